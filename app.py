@@ -4,15 +4,31 @@ Job Cross-Reference Web Application
 Flask backend for the job search tool
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, g, render_template, request, jsonify, send_file, make_response
+import functools
 import json
+import logging
 from pathlib import Path
-from job_cross_reference import JobCrossReference
+from gazetteer import get_gazetteer
+from job_cross_reference import JobCrossReference, SearchDeadline, SearchFilters
+from records import to_dict
+from resume_parser import extract_skills_from_resume, extract_location_from_resume
+from telemetry import HTTP_SECONDS, REGISTRY, configure_logging, log_event
 import os
-import pdfplumber
-import re
+import threading
+import time
+
+configure_logging()
 
 app = Flask(__name__)
+# Reject oversized uploads before they reach the resume parser
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_UPLOAD_MB', 10)) * 1024 * 1024
+# Upstream time budget per search; past it, results found so far are returned marked partial
+SEARCH_BUDGET_SECONDS = float(os.environ.get('SEARCH_BUDGET_SECONDS', 15))
+# A batch upload is extracted while the request waits, so bound how much work one can ask for
+RESUME_BATCH_MAX_FILES = int(os.environ.get('RESUME_BATCH_MAX_FILES', 50))
+RESUME_BATCH_MAX_BYTES = int(os.environ.get('RESUME_BATCH_MAX_MB', 100)) * 1024 * 1024
+RESUME_BATCH_BUDGET_SECONDS = float(os.environ.get('RESUME_BATCH_BUDGET_SECONDS', 60))
 
 # Load API keys from config or environment variables
 def load_api_keys():
@@ -23,17 +39,16 @@ def load_api_keys():
     adzuna_app_id = os.environ.get('ADZUNA_APP_ID', '')
     adzuna_app_key = os.environ.get('ADZUNA_APP_KEY', '')
     
-    # Debug logging (don't log actual keys)
-    if adzuna_app_id or adzuna_app_key:
-        print(f"✓ Found env vars: ADZUNA_APP_ID={'SET' if adzuna_app_id else 'NOT SET'}, ADZUNA_APP_KEY={'SET' if adzuna_app_key else 'NOT SET'}")
-    else:
-        print("⚠ Environment variables ADZUNA_APP_ID and ADZUNA_APP_KEY not found")
-    
+    # Log which keys are set, never the keys themselves
     if adzuna_app_id and adzuna_app_key:
         api_keys['adzuna_app_id'] = adzuna_app_id
         api_keys['adzuna_app_key'] = adzuna_app_key
-        print("✓ Using API keys from environment variables")
+        log_event('api_keys_loaded', logging.DEBUG, source='environment')
         return api_keys
+    if adzuna_app_id or adzuna_app_key:
+        log_event('api_keys_incomplete', logging.WARNING,
+                  ADZUNA_APP_ID='SET' if adzuna_app_id else 'NOT SET',
+                  ADZUNA_APP_KEY='SET' if adzuna_app_key else 'NOT SET')
     
     # Fallback to config.json (local development)
     config_path = Path(__file__).parent / 'config.json'
@@ -45,11 +60,72 @@ def load_api_keys():
                     api_keys['adzuna_app_id'] = config['adzuna'].get('app_id', '')
                     api_keys['adzuna_app_key'] = config['adzuna'].get('app_key', '')
         except Exception as e:
-            print(f"Error loading config: {e}")
+            log_event('config_load_failed', logging.WARNING, path=str(config_path), error=str(e))
     
     return api_keys if api_keys else None
 
 
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_latency(response):
+    """Observe request latency by route (not raw path, to keep label values bounded)"""
+    start = g.pop('request_start', None)
+    if start is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_SECONDS.labels(endpoint, request.method, response.status_code).observe(time.perf_counter() - start)
+    return response
+
+
+def profile_request(name):
+    """
+    Profile a view when the request asks for it with the PROFILE_TOKEN
+    (X-Profile-Token header or ?profile=<token>) or is sampled, and point
+    to the saved profile in the X-Profile-Id response header.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            import profiling
+            
+            token = request.headers.get('X-Profile-Token') or request.args.get('profile')
+            reason = profiling.profile_reason(token)
+            if not reason:
+                return view(*args, **kwargs)
+            with profiling.profiled(name, reason) as artifact:
+                response = make_response(view(*args, **kwargs))
+            if artifact['id']:
+                response.headers['X-Profile-Id'] = artifact['id']
+            return response
+        return wrapper
+    return decorator
+
+
+@app.route('/api/profiles/<profile_id>')
+def download_profile(profile_id):
+    """Download a request profile (.prof, or ?format=txt for the text summary); needs the PROFILE_TOKEN"""
+    import profiling
+    
+    if not profiling.token_matches(request.headers.get('X-Profile-Token') or request.args.get('token')):
+        return jsonify({'error': 'Forbidden'}), 403
+    text = request.args.get('format') == 'txt'
+    path = profiling.profile_path(profile_id, '.txt' if text else '.prof')
+    if path is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    if text:
+        return send_file(path.resolve(), mimetype='text/plain')
+    return send_file(path.resolve(), as_attachment=True)
+
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus scrape endpoint (totals across gunicorn workers, see telemetry.Registry)"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route('/')
 def index():
     """Main page"""
@@ -57,6 +133,7 @@ def index():
 
 
 @app.route('/api/search', methods=['POST'])
+@profile_request('search')
 def search_jobs():
     """API endpoint to search for jobs"""
     try:
@@ -65,10 +142,22 @@ def search_jobs():
         interests = data.get('interests', [])
         location = data.get('location', '')
         us_wide = data.get('us_wide', True)
+        include_mentors = data.get('include_mentors', False)
         
         if not skills:
             return jsonify({'error': 'Skills are required'}), 400
         
+        try:
+            filters = SearchFilters.from_dict(data.get('filters'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        mentors_per_job = data.get('mentors_per_job')
+        try:
+            mentors_per_job = 3 if mentors_per_job is None else min(max(int(mentors_per_job), 0), 10)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'mentors_per_job must be an integer'}), 400
+        
         # Load API keys
         api_keys = load_api_keys()
         
@@ -77,20 +166,26 @@ def search_jobs():
             user_skills=skills,
             user_interests=interests,
             location=location,
-            api_keys=api_keys
+            api_keys=api_keys,
+            mentor_processor=get_mentor_processor(),
+            search_cache=get_search_cache()
         )
         
-        # Process search
-        result = cross_ref.process('mentors.csv', us_wide=us_wide)
+        # Process search within the latency budget
+        result = cross_ref.process('mentors.csv', us_wide=us_wide,
+                                   deadline=SearchDeadline(SEARCH_BUDGET_SECONDS), filters=filters,
+                                   include_mentors=include_mentors, mentors_per_job=mentors_per_job)
         
         # Return results
         return jsonify({
             'success': True,
-            'jobs': result['jobs'],
-            'top_matches': result['top_matches'],
+            'partial': result['partial'],
+            'jobs': [to_dict(job) for job in result['jobs']],
+            'top_matches': [to_dict(job) for job in result['top_matches']],
             'stats': {
                 'total_jobs': len(result['jobs']),
                 'high_matches': len(result['top_matches']),
+                'skipped_searches': result['skipped_searches'],
                 'mentor_stats': result['mentor_stats']
             },
             'csv_report': result['csv_report'],
@@ -101,14 +196,20 @@ def search_jobs():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/locations')
+def complete_locations():
+    """Known places starting with ?q= (for location autocomplete)"""
+    places = get_gazetteer().complete(request.args.get('q', ''), limit=10)
+    return jsonify({'locations': [
+        {'id': place.id, 'name': place.display, 'lat': place.lat, 'lon': place.lon} for place in places
+    ]})
+
+
 @app.route('/api/mentors')
 def get_mentors():
     """Get mentor statistics"""
     try:
-        from job_cross_reference import MentorProcessor
-        
-        processor = MentorProcessor()
-        processor.load_from_csv('mentors.csv')
+        processor = get_mentor_processor()
         
         mentor_skills = processor.get_mentor_skills()
         mentor_companies = processor.get_mentor_companies()
@@ -123,77 +224,52 @@ def get_mentors():
         return jsonify({'error': str(e)}), 500
 
 
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """
+    Search cache (a SQLite file shared by every worker) and this worker's
+    prefetch thread, which only refreshes while it holds the prefetch lock
+    """
+    # Created on first use rather than in warm_up: threads don't survive gunicorn's fork
+    with _search_cache_lock:
+        if not hasattr(get_search_cache, '_cache'):
+            from job_cross_reference import JobSearcher
+            from search_cache import PrefetchScheduler, SearchCache
+            
+            cache = SearchCache.from_env()
+            api_keys = load_api_keys()
+            if api_keys:
+                PrefetchScheduler.from_env(cache, JobSearcher(api_keys)).start()
+            get_search_cache._cache = cache
+    return get_search_cache._cache
+
+
+def get_mentor_processor():
+    """Shared mentor processor with its company and skill indexes (loaded once per process)"""
+    if not hasattr(get_mentor_processor, '_processor'):
+        from job_cross_reference import MentorProcessor
+        
+        processor = MentorProcessor()
+        processor.load_from_csv('mentors.csv')
+        processor.get_company_index()
+        processor.get_skill_index()
+        processor.get_company_matcher()
+        get_mentor_processor._processor = processor
+    return get_mentor_processor._processor
+
+
 @app.route('/api/mentors/company/<path:company_name>')
 def get_mentors_by_company(company_name):
     """Get mentors who work at a specific company"""
     try:
-        from job_cross_reference import MentorProcessor
         import urllib.parse
         
         # Decode URL-encoded company name
         company_name = urllib.parse.unquote(company_name)
         
-        # Initialize processor (cache it to avoid reloading every time)
-        if not hasattr(get_mentors_by_company, '_processor'):
-            get_mentors_by_company._processor = MentorProcessor()
-            get_mentors_by_company._processor.load_from_csv('mentors.csv')
-        
-        processor = get_mentors_by_company._processor
-        
-        # Find mentors at this company (improved fuzzy matching)
-        matching_mentors = []
-        company_lower = company_name.lower().strip()
-        
-        # Normalize company name (remove common suffixes, etc.)
-        def normalize_company(name):
-            name = name.lower().strip()
-            # Remove common suffixes
-            name = re.sub(r'\s+(inc|llc|ltd|corp|corporation|company|co)\.?$', '', name)
-            # Remove special characters
-            name = re.sub(r'[^\w\s]', '', name)
-            return name
-        
-        normalized_search = normalize_company(company_name)
-        
-        for mentor in processor.mentors:
-            mentor_company = str(mentor.get('company', '')).strip()
-            if not mentor_company:
-                continue
-            
-            mentor_company_lower = mentor_company.lower()
-            normalized_mentor = normalize_company(mentor_company)
-            
-            # Multiple matching strategies
-            matches = False
-            
-            # 1. Exact match (case insensitive)
-            if company_lower == mentor_company_lower:
-                matches = True
-            # 2. Normalized match
-            elif normalized_search == normalized_mentor:
-                matches = True
-            # 3. One contains the other (for partial matches)
-            elif (normalized_search in normalized_mentor or normalized_mentor in normalized_search) and len(normalized_search) > 3:
-                matches = True
-            # 4. Word-by-word match (e.g., "JPMorgan Chase" matches "JPMorgan Chase & Co.")
-            elif normalized_search and normalized_mentor:
-                search_words = set(normalized_search.split())
-                mentor_words = set(normalized_mentor.split())
-                # If most words match, consider it a match
-                if len(search_words) > 0 and len(mentor_words) > 0:
-                    common_words = search_words.intersection(mentor_words)
-                    if len(common_words) >= min(2, len(search_words)):
-                        matches = True
-            
-            if matches:
-                matching_mentors.append({
-                    'name': str(mentor.get('name', 'N/A')),
-                    'full_name': str(mentor.get('full_name', mentor.get('name', 'N/A'))),
-                    'title': str(mentor.get('title', 'N/A')),
-                    'company': str(mentor.get('company', 'N/A')),
-                    'linkedin': str(mentor.get('linkedin', '')),
-                    'areas_of_expertise': str(mentor.get('areas_of_expertise', ''))
-                })
+        matching_mentors = get_mentor_processor().get_company_index().lookup(company_name)
         
         return jsonify({
             'company': company_name,
@@ -201,46 +277,56 @@ def get_mentors_by_company(company_name):
             'count': len(matching_mentors)
         })
     except Exception as e:
-        import traceback
-        error_msg = f"Error: {str(e)}\n{traceback.format_exc()}"
-        print(f"Mentor lookup error: {error_msg}")
+        log_event('mentor_lookup_failed', logging.ERROR, company=company_name, error=str(e), exc_info=True)
         return jsonify({'error': str(e), 'company': company_name, 'mentors': [], 'count': 0}), 500
 
 
+@app.route('/api/mentors/companies', methods=['POST'])
+def get_mentors_by_companies():
+    """Get mentors for many companies in one request"""
+    try:
+        data = request.json or {}
+        companies = [str(c) for c in data.get('companies', []) if c and str(c).strip()]
+        
+        matches = get_mentor_processor().get_company_index().lookup_many(companies)
+        
+        return jsonify({
+            'results': {
+                company: {'mentors': mentors, 'count': len(mentors)}
+                for company, mentors in matches.items()
+            }
+        })
+    except Exception as e:
+        return jsonify({'error': str(e), 'results': {}}), 500
+
+
+def get_bookmark_store():
+    """Shared bookmark store (opened once per process)"""
+    if not hasattr(get_bookmark_store, '_store'):
+        from bookmark_store import BookmarkStore
+        
+        get_bookmark_store._store = BookmarkStore('bookmarks.db', legacy_json='bookmarks.json')
+    return get_bookmark_store._store
+
+
 @app.route('/api/bookmarks', methods=['GET', 'POST', 'DELETE'])
 def bookmarks():
-    """Handle job bookmarks (stored in memory for now, could use database)"""
-    # In a real app, use a database. For now, we'll use a simple file
-    bookmarks_file = Path('bookmarks.json')
+    """Handle job bookmarks (stored in SQLite, see bookmark_store.py)"""
+    store = get_bookmark_store()
     
     if request.method == 'GET':
-        if bookmarks_file.exists():
-            with open(bookmarks_file, 'r') as f:
-                return jsonify(json.load(f))
-        return jsonify({'bookmarks': []})
+        return jsonify({'bookmarks': store.list_all()})
     
     elif request.method == 'POST':
         data = request.json
         job_id = data.get('job_id')
         job_data = data.get('job_data')
         
-        # Load existing bookmarks
-        bookmarks = []
-        if bookmarks_file.exists():
-            with open(bookmarks_file, 'r') as f:
-                bookmarks = json.load(f).get('bookmarks', [])
+        if not job_id:
+            return jsonify({'success': False, 'error': 'job_id is required'}), 400
         
         # Add if not already bookmarked
-        if not any(b.get('job_id') == job_id for b in bookmarks):
-            bookmarks.append({
-                'job_id': job_id,
-                'job_data': job_data,
-                'bookmarked_at': str(Path(__file__).stat().st_mtime)  # Simple timestamp
-            })
-            
-            with open(bookmarks_file, 'w') as f:
-                json.dump({'bookmarks': bookmarks}, f, indent=2)
-            
+        if store.add(job_id, job_data):
             return jsonify({'success': True, 'bookmarked': True})
         return jsonify({'success': True, 'bookmarked': False, 'message': 'Already bookmarked'})
     
@@ -248,20 +334,26 @@ def bookmarks():
         data = request.json
         job_id = data.get('job_id')
         
-        if bookmarks_file.exists():
-            with open(bookmarks_file, 'r') as f:
-                bookmarks_data = json.load(f)
-            
-            bookmarks = [b for b in bookmarks_data.get('bookmarks', []) if b.get('job_id') != job_id]
-            
-            with open(bookmarks_file, 'w') as f:
-                json.dump({'bookmarks': bookmarks}, f, indent=2)
+        removed = store.remove(job_id)
+        return jsonify({'success': True, 'removed': removed})
+
+
+_resume_extractor_lock = threading.Lock()
+
+
+def get_resume_extractor():
+    """Shared resume extractor (worker pool and cache, created once per process)"""
+    # Locked because threaded workers could otherwise each start a pool
+    with _resume_extractor_lock:
+        if not hasattr(get_resume_extractor, '_extractor'):
+            from resume_extraction import ResumeExtractor
             
-            return jsonify({'success': True, 'removed': True})
-        return jsonify({'success': False, 'error': 'No bookmarks file'})
+            get_resume_extractor._extractor = ResumeExtractor.from_env()
+    return get_resume_extractor._extractor
 
 
 @app.route('/api/upload-resume', methods=['POST'])
+@profile_request('upload_resume')
 def upload_resume():
     """Extract skills and location from uploaded resume"""
     try:
@@ -272,28 +364,17 @@ def upload_resume():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        # Save temporarily
-        upload_dir = Path('uploads')
-        upload_dir.mkdir(exist_ok=True)
-        file_path = upload_dir / file.filename
-        file.save(file_path)
-        
-        # Extract text from PDF
+        # Extract text from PDF (in memory, in a worker process; nothing is written to disk)
         text = ""
         if file.filename.lower().endswith('.pdf'):
             try:
-                with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        text += page.extract_text() + "\n"
+                text = get_resume_extractor().extract_text(file.read())
             except Exception as e:
                 return jsonify({'error': f'Error reading PDF: {str(e)}'}), 500
         
         # Extract skills and location
         skills = extract_skills_from_resume(text)
-        location = extract_location_from_resume(text)
-        
-        # Clean up
-        file_path.unlink()
+        location = get_gazetteer().canonical(extract_location_from_resume(text))
         
         return jsonify({
             'success': True,
@@ -305,222 +386,63 @@ def upload_resume():
         return jsonify({'error': str(e)}), 500
 
 
-def extract_skills_from_resume(text):
-    """Extract skills from resume text - improved parsing"""
-    found_skills = set()
-    text_lower = text.lower()
-    
-    # Look for "TECHNICAL SKILLS" or "SKILLS" section - capture full multi-line section
-    # First try to find the section header
-    skills_header_match = re.search(r'(?:technical\s+)?skills?[:\s]+', text, re.IGNORECASE)
-    if skills_header_match:
-        # Find where the skills section ends (next major section)
-        start_pos = skills_header_match.end()
-        # Look for next section (EXPERIENCE, EDUCATION, PROJECTS, or double newline + caps)
-        end_match = re.search(r'\n(EXPERIENCE|EDUCATION|PROJECTS|HIGHLIGHTS)', text[start_pos:], re.IGNORECASE)
-        if end_match:
-            skills_text = text[start_pos:start_pos + end_match.start()]
-        else:
-            # Fallback: take next 500 characters or until double newline
-            remaining = text[start_pos:start_pos + 500]
-            double_newline = remaining.find('\n\n')
-            if double_newline > 0:
-                skills_text = remaining[:double_newline]
-            else:
-                skills_text = remaining
-    else:
-        # Fallback to original pattern
-        skills_section_patterns = [
-            r'(?:technical\s+)?skills?[:\s]+\n?(.*?)(?:\n\n|\nEXPERIENCE|\nEDUCATION|\nPROJECTS|$)',
-            r'technologies?[:\s]+\n?(.*?)(?:\n\n|\nEXPERIENCE|$)',
-        ]
-        for pattern in skills_section_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL | re.MULTILINE)
-            if match:
-                skills_text = match.group(1)
-                break
-        else:
-            skills_text = ""
-    
-    # If found skills section, parse it
-    if skills_text:
-        # First, replace newlines with spaces but preserve structure
-        skills_text = skills_text.replace('\n', ' ')
-        # Clean up extra whitespace but preserve single spaces
-        skills_text = re.sub(r'\s+', ' ', skills_text)
-        
-        # Remove category labels and replace with commas to separate categories
-        # This prevents "Tailwind CSS Tools: Git" from becoming "Tailwind CSS Git"
-        skills_text = re.sub(r'\b(Languages|Frameworks|Tools|Other|Technologies):\s*', ', ', skills_text, flags=re.IGNORECASE)
-        # Remove leading comma if present
-        skills_text = skills_text.lstrip(', ').strip()
-        
-        all_skills_text = skills_text
-        
-        # Better parsing: first split by commas, then handle slashes
-        # This preserves structure: "A, B/C, D" -> ["A", "B/C", "D"]
-        comma_split = []
-        current_item = ""
-        paren_depth = 0
-        
-        for char in all_skills_text:
-            if char == '(':
-                paren_depth += 1
-                current_item += char
-            elif char == ')':
-                paren_depth -= 1
-                current_item += char
-            elif char == ',' and paren_depth == 0:
-                if current_item.strip():
-                    comma_split.append(current_item.strip())
-                current_item = ""
-            else:
-                current_item += char
-        
-        if current_item.strip():
-            comma_split.append(current_item.strip())
-        
-        # Now process each comma-separated item, splitting by "/" if needed
-        skills_list = []
-        for item in comma_split:
-            item = item.strip()
-            if not item:
-                continue
-            
-            # If item contains "/", split it
-            if '/' in item and '(' not in item:  # Don't split if it's in parentheses
-                parts = item.split('/')
-                for part in parts:
-                    part = part.strip()
-                    if part:
-                        skills_list.append(part)
+@app.route('/api/upload-resumes', methods=['POST'])
+def upload_resumes():
+    """Extract profiles from many resumes at once (PDF/TXT files or .zip archives)"""
+    try:
+        import io
+        import zipfile
+        from bulk_resumes import RESUME_EXTENSIONS, archive_resumes, build_profile, candidate_names, read_member
+        
+        # Collect (name, bytes) for every resume, expanding zip archives. Archive
+        # sizes are checked from their directories before anything is decompressed.
+        resumes = []
+        total_bytes = 0
+        try:
+            for file in request.files.getlist('resumes'):
+                data = file.read()
+                if file.filename.lower().endswith('.zip'):
+                    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                        members = archive_resumes(archive, RESUME_BATCH_MAX_FILES - len(resumes),
+                                                  RESUME_BATCH_MAX_BYTES - total_bytes)
+                        for info in members:
+                            resumes.append((info.filename, read_member(archive, info)))
+                            total_bytes += len(resumes[-1][1])
+                elif file.filename.lower().endswith(RESUME_EXTENSIONS):
+                    resumes.append((file.filename, data))
+                    total_bytes += len(data)
+                if len(resumes) > RESUME_BATCH_MAX_FILES:
+                    raise ValueError(f"more than {RESUME_BATCH_MAX_FILES} resumes in one upload")
+        except zipfile.BadZipFile as e:
+            return jsonify({'error': f'Invalid zip archive: {e}'}), 400
+        except ValueError as e:
+            return jsonify({'error': f'Upload too large: {e}'}), 413
+        
+        if not resumes:
+            return jsonify({'error': 'No resumes uploaded'}), 400
+        
+        # Extract all PDFs in parallel in the worker pool, within the batch time budget
+        pdfs = [i for i, (name, _) in enumerate(resumes) if name.lower().endswith('.pdf')]
+        texts = dict(zip(pdfs, get_resume_extractor().extract_texts([resumes[i][1] for i in pdfs],
+                                                                    budget=RESUME_BATCH_BUDGET_SECONDS)))
+        
+        profiles = []
+        candidates = candidate_names([name for name, _ in resumes])
+        for i, (name, data) in enumerate(resumes):
+            text = texts[i] if i in texts else data.decode('utf-8', errors='replace')
+            if isinstance(text, Exception):
+                profiles.append({'candidate': candidates[i], 'source': name, 'error': str(text)})
             else:
-                skills_list.append(item)
-        
-        # Process each skill
-        for skill in skills_list:
-            skill = skill.strip()
-            if not skill or len(skill) < 2:
-                continue
-            
-            # Remove category prefixes
-            skill = re.sub(r'^(basic|advanced|proficient|experienced|other)\s+', '', skill, flags=re.IGNORECASE)
-            skill = re.sub(r'^\d+\.\s*', '', skill)
-            
-            # Skip category labels
-            if skill.lower() in ['languages', 'frameworks', 'tools', 'other', 'technologies']:
-                continue
-            
-            # Handle skills with parentheses - extract main skill name
-            if '(' in skill and ')' in skill:
-                # Extract main part before parentheses
-                main_skill = skill.split('(')[0].strip()
-                # Also check if there's useful info in parentheses
-                paren_content = re.search(r'\(([^)]+)\)', skill)
-                if paren_content:
-                    paren_text = paren_content.group(1)
-                    # For "AWS (basic)", just use "AWS"
-                    if 'basic' not in paren_text.lower() and 'liquid' not in paren_text.lower():
-                        # For "Hardware Integration (Raspberry Pi / FM9)", add both
-                        if '/' in paren_text:
-                            for part in paren_text.split('/'):
-                                part = part.strip()
-                                if part and len(part) > 2:
-                                    found_skills.add(part.title())
-                        else:
-                            # Single item in parentheses might be worth adding
-                            if len(paren_text.strip()) > 2 and paren_text.strip() not in ['basic', 'liquid']:
-                                found_skills.add(paren_text.strip().title())
-                if main_skill:
-                    skill = main_skill
-                else:
-                    continue
-            
-            if skill and len(skill) > 2:
-                # Handle special abbreviations
-                if skill.lower() in ['ai', 'ml', 'api', 'aws', 'css', 'html', 'iot', 'js']:
-                    if skill.lower() == 'js':
-                        found_skills.add('JavaScript')
-                    else:
-                        found_skills.add(skill.upper())
-                elif '/' in skill:
-                    # Handle "HTML/CSS" or "Git/GitHub"
-                    parts = skill.split('/')
-                    for part in parts:
-                        part = part.strip()
-                        if part:
-                            if part.lower() in ['html', 'css']:
-                                found_skills.add(part.upper())
-                            elif part.lower() == 'git':
-                                found_skills.add('Git')
-                            elif part.lower() == 'github':
-                                found_skills.add('GitHub')
-                            else:
-                                found_skills.add(part.title())
-                elif '-' in skill and not skill.startswith('-'):
-                    found_skills.add(skill.title())
-                else:
-                    found_skills.add(skill.title() if skill.islower() else skill)
-    
-    # Also search entire text for common skills if section parsing didn't work well
-    if len(found_skills) < 5:
-        skill_keywords = {
-            'python', 'javascript', 'java', 'react', 'node.js', 'nodejs',
-            'typescript', 'html', 'css', 'sql', 'mongodb', 'postgresql',
-            'aws', 'azure', 'docker', 'kubernetes', 'git', 'github',
-            'flask', 'django', 'express', 'vue', 'angular', 'next.js',
-            'machine learning', 'ai', 'artificial intelligence', 'ml',
-            'data science', 'data analysis', 'pandas', 'numpy',
-            'full stack', 'fullstack', 'frontend', 'backend', 'full-stack',
-            'rest api', 'graphql', 'microservices', 'agile', 'scrum',
-            'creative coding', 'music technology', 'hardware integration',
-            'raspberry pi', 'embedded systems', 'iot', 'streamlit', 'vite',
-            'tailwind css', 'shopify', 'railway'
-        }
+                profiles.append(build_profile(name, text, data, candidates[i]))
         
-        for keyword in skill_keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                if keyword in ['ai', 'ml', 'api', 'aws', 'css', 'html', 'iot']:
-                    found_skills.add(keyword.upper())
-                else:
-                    found_skills.add(keyword.title() if keyword.islower() else keyword)
-    
-    return list(found_skills)[:20]  # Return up to 20 skills
-
-
-def extract_location_from_resume(text):
-    """Extract location from resume text - improved"""
-    # Look for location in header (most common place)
-    # Pattern: "City, State |" or "City, State | phone"
-    header_pattern = r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2})\s*\|'
-    match = re.search(header_pattern, text, re.MULTILINE)
-    if match:
-        city = match.group(1).strip()
-        state = match.group(2).strip()
-        # Clean up city if it has newlines
-        city = city.replace('\n', ' ').strip()
-        return f"{city}, {state}"
-    
-    # Fallback: look for any City, State pattern
-    location_patterns = [
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2})\b',  # City, State
-        r'location[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2})',  # Location: City, State
-    ]
-    
-    for pattern in location_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            # Take the first valid match (usually in header)
-            for match in matches:
-                if len(match) == 2:
-                    city = match[0].replace('\n', ' ').strip()
-                    state = match[1].strip()
-                    # Skip if city looks wrong (e.g., contains "Tankersley")
-                    if 'tankersley' not in city.lower() and len(city) > 2:
-                        return f"{city}, {state}"
+        return jsonify({
+            'success': True,
+            'profiles': profiles,
+            'count': len(profiles)
+        })
     
-    return ""
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/reports/<filename>')
@@ -532,6 +454,24 @@ def download_report(filename):
     return jsonify({'error': 'File not found'}), 404
 
 
+def warm_up():
+    """
+    Build the shared, read-only state before serving: the mentor store with
+    its company and skill indexes and company matcher, the bookmark store,
+    the location gazetteer, and the upstream HTTP client. Under gunicorn
+    this runs in the master before workers fork (see gunicorn.conf.py), so
+    workers share it copy-on-write. The resume worker
+    pool and the search cache's prefetch thread are left to each worker,
+    since pools and threads can't cross a fork.
+    """
+    processor = get_mentor_processor()
+    processor.get_mentor_skills()
+    get_bookmark_store()
+    get_gazetteer()
+    import requests  # noqa: F401  (imported once here instead of in every worker)
+    return {'mentors': len(processor.mentors), 'companies': len(processor.get_mentor_companies())}
+
+
 if __name__ == '__main__':
     # Get port from environment variable (for Railway/Heroku) or default to 5001
     port = int(os.environ.get('PORT', 5001))
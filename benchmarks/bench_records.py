@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for compact mentor and job records
+Compares the memory held by plain dicts and by the slotted, interned records
+in records.py for synthetic mentor and job lists.
+Usage: python benchmarks/bench_records.py [--sizes 1000 100000]
+"""
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from records import JobRecord, MentorRecord
+
+
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises']
+TITLES = ['Founder', 'CEO', 'CTO', 'Software Engineer', 'Product Manager', 'Investor']
+CITIES = [('Huntsville', 'AL'), ('Madison', 'WI'), ('Austin', 'TX'), ('Denver', 'CO')]
+EXPERTISE = ['Fundraising', 'Product', 'Engineering', 'Marketing', 'Sales', 'Hiring', 'Legal']
+
+
+def make_mentor_rows(count: int, seed: int = 0):
+    """Synthetic mentor rows as they come out of the CSV reader (fresh strings per row)"""
+    rng = random.Random(seed)
+    for i in range(count):
+        city, state = rng.choice(CITIES)
+        yield {
+            'name': f'Mentor {i}',
+            'full_name': f'Mentor Number {i}',
+            # Build strings per row, like a parser does, so nothing is shared up front
+            'title': ''.join(rng.choice(TITLES)),
+            'company': ''.join(rng.choice(COMPANIES)),
+            'city': ''.join(city),
+            'state': ''.join(state),
+            'country': ''.join('USA'),
+            'areas_of_expertise': ', '.join(rng.sample(EXPERTISE, 3)),
+            'biography': f'Mentor {i} has helped many startups.',
+            'linkedin': f'https://www.linkedin.com/in/mentor-{i}',
+            'website': '',
+        }
+
+
+def make_job_rows(count: int, seed: int = 0):
+    """Synthetic job results shaped like JobSearcher.search_adzuna output"""
+    rng = random.Random(seed)
+    for i in range(count):
+        city, state = rng.choice(CITIES)
+        yield {
+            'title': f'Software Engineer {i}',
+            'company': ''.join(rng.choice(COMPANIES)),
+            'location': f'{city}, {state}',
+            'description': 'Build and ship features for our customers.',
+            'url': f'https://example.com/jobs/{i}',
+            'created': '2024-01-01T00:00:00Z',
+            'salary_min': 90000,
+            'salary_max': 150000,
+            'source': ''.join('Adzuna'),
+        }
+
+
+def measure(build) -> int:
+    """Bytes still allocated after build() returns (the built structure is kept alive)"""
+    tracemalloc.start()
+    kept = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark memory of compact mentor and job records')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 100000],
+                        help='Number of records')
+    args = parser.parse_args()
+
+    def mentor_dicts(rows):
+        mentors = list(rows)
+        for mentor in mentors:
+            mentor['areas_of_expertise_list'] = [e.strip() for e in mentor['areas_of_expertise'].split(',')]
+        return mentors
+
+    def mentor_records(rows):
+        mentors = [MentorRecord.from_dict(row) for row in rows]
+        for mentor in mentors:
+            mentor['areas_of_expertise_list'] = [e.strip() for e in mentor['areas_of_expertise'].split(',')]
+        return mentors
+
+    print(f"{'records':<10}{'size':>10}{'dict MB':>12}{'record MB':>12}{'saved':>8}")
+    for size in args.sizes:
+        for label, rows, as_dicts, as_records in (
+            ('mentors', make_mentor_rows, mentor_dicts, mentor_records),
+            ('jobs', make_job_rows, list, lambda r: [JobRecord.from_dict(row) for row in r]),
+        ):
+            plain = measure(lambda: as_dicts(rows(size)))
+            compact = measure(lambda: as_records(rows(size)))
+            print(f"{label:<10}{size:>10}{plain / 1e6:>12.2f}{compact / 1e6:>12.2f}{1 - compact / plain:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for resume skill extraction
+Compares the compiled tokenizer/keyword scanner in resume_parser with the
+previous per-character splitter and per-keyword regex loop on long resumes.
+Usage: python benchmarks/bench_resume_parser.py [--sizes 1000 10000 100000]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import make_resume
+from resume_parser import SKILL_KEYWORDS, _split_skills_section, extract_skills_from_resume, find_skill_keywords
+
+
+def make_skills_section(items: int, seed: int = 0) -> str:
+    """Synthetic skills section with category labels, slashes and parentheses"""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(items):
+        if i % 10 == 0:
+            parts.append(rng.choice(['Languages:', 'Frameworks:', 'Tools:']))
+        skill = rng.choice(SKILL_KEYWORDS)
+        parts.append(f'{skill} (advanced)' if i % 7 == 0 else skill)
+    return ', '.join(parts)
+
+
+def legacy_find_skill_keywords(text: str) -> set:
+    """Previous fallback: one regex compile and scan per keyword"""
+    text_lower = text.lower()
+    found = set()
+    for keyword in SKILL_KEYWORDS:
+        pattern = r'\b' + re.escape(keyword) + r'\b'
+        if re.search(pattern, text_lower):
+            found.add(keyword)
+    return found
+
+
+def legacy_split_skills_section(skills_text: str) -> list:
+    """Previous splitter: several re.sub passes, then a per-character loop"""
+    skills_text = skills_text.replace('\n', ' ')
+    skills_text = re.sub(r'\s+', ' ', skills_text)
+    skills_text = re.sub(r'\b(Languages|Frameworks|Tools|Other|Technologies):\s*', ', ', skills_text,
+                         flags=re.IGNORECASE)
+    skills_text = skills_text.lstrip(', ').strip()
+    comma_split = []
+    current_item = ""
+    paren_depth = 0
+    for char in skills_text:
+        if char == '(':
+            paren_depth += 1
+            current_item += char
+        elif char == ')':
+            paren_depth -= 1
+            current_item += char
+        elif char == ',' and paren_depth == 0:
+            if current_item.strip():
+                comma_split.append(current_item.strip())
+            current_item = ""
+        else:
+            current_item += char
+    if current_item.strip():
+        comma_split.append(current_item.strip())
+    return comma_split
+
+
+def best_of(func, arg, repeat: int = 5) -> float:
+    """Best wall time in seconds over several runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark resume skill extraction')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000],
+                        help='Resume lengths in words')
+    args = parser.parse_args()
+
+    print(f"{'stage':<24}{'size':>10}{'legacy ms':>12}{'compiled ms':>14}{'speedup':>10}")
+    for size in args.sizes:
+        resume = make_resume(size)
+        assert legacy_find_skill_keywords(resume) == set(find_skill_keywords(resume))
+        legacy = best_of(legacy_find_skill_keywords, resume)
+        compiled = best_of(find_skill_keywords, resume)
+        print(f"{'keyword scan':<24}{size:>10}{legacy * 1000:>12.2f}{compiled * 1000:>14.2f}{legacy / compiled:>9.1f}x")
+
+        section = make_skills_section(size // 10)
+        assert legacy_split_skills_section(section) == _split_skills_section(section)
+        legacy = best_of(legacy_split_skills_section, section)
+        compiled = best_of(_split_skills_section, section)
+        print(f"{'skills section split':<24}{size // 10:>10}{legacy * 1000:>12.2f}{compiled * 1000:>14.2f}{legacy / compiled:>9.1f}x")
+
+        total = best_of(extract_skills_from_resume, resume)
+        print(f"{'extract_skills (full)':<24}{size:>10}{'':>12}{total * 1000:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the web app
+Imports app.py in fresh interpreters (a cold start) and reports import time,
+peak memory, and whether any heavy dependency was loaded at startup.
+Usage: python benchmarks/bench_startup.py [--runs 10] [--budget-ms 500]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Dependencies that should only be imported by the routes that use them
+HEAVY_MODULES = ['pandas', 'numpy', 'pdfplumber', 'requests']
+
+# Runs in the child interpreter: time the import and report what it pulled in
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'import_ms': elapsed * 1000,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': len(sys.modules),
+    'heavy': [m for m in %r if m in sys.modules],
+}))
+"""
+
+
+def cold_start() -> dict:
+    """Import app.py once in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, '-c', _PROBE % HEAVY_MODULES],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure cold-start import time of app.py')
+    parser.add_argument('--runs', type=int, default=10, help='Fresh interpreters to start')
+    parser.add_argument('--budget-ms', type=float, default=500.0,
+                        help='Fail if the median import time exceeds this (default: 500)')
+    args = parser.parse_args()
+
+    runs = [cold_start() for _ in range(args.runs)]
+    import_ms = sorted(run['import_ms'] for run in runs)
+    median_ms = statistics.median(import_ms)
+    heavy = sorted({m for run in runs for m in run['heavy']})
+
+    print(f"Cold starts:       {len(runs)}")
+    print(f"Import time:       median {median_ms:.1f} ms, min {import_ms[0]:.1f} ms, max {import_ms[-1]:.1f} ms")
+    print(f"Peak RSS:          {max(run['max_rss_kb'] for run in runs) / 1024:.1f} MB")
+    print(f"Modules loaded:    {runs[0]['modules']}")
+    print(f"Heavy at startup:  {', '.join(heavy) if heavy else 'none'}")
+
+    if heavy or median_ms > args.budget_ms:
+        print(f"✗ Over startup budget ({args.budget_ms:.0f} ms, no heavy imports)")
+        sys.exit(1)
+    print(f"✓ Within startup budget ({args.budget_ms:.0f} ms, no heavy imports)")
+
+
+if __name__ == "__main__":
+    main()
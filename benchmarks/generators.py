@@ -0,0 +1,163 @@
+"""
+Seeded synthetic data for benchmarks
+Mentor rows/CSV files, Adzuna-shaped job lists, lookbook text and resumes.
+The same seed and size always produce the same data, so runs are comparable.
+"""
+
+import csv
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parse_mentor_lookbook import CSV_COLUMNS
+from records import JobRecord
+from resume_parser import SKILL_KEYWORDS
+
+
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Quinn',
+               'Maria', 'Wei', 'Priya', 'Omar', 'Elena', 'Kofi', 'Yuki', 'Lars', 'Ana', 'David']
+LAST_NAMES = ['Smith', 'Johnson', 'Lee', 'Garcia', 'Brown', 'Nguyen', 'Patel', 'Kim', 'Lopez', 'Chen',
+              'Martin', 'Rossi', 'Okafor', 'Schmidt', 'Silva', 'Cohen', 'Tanaka', 'Novak', 'Khan', 'Berg']
+TITLES = ['Founder', 'Co-Founder & CEO', 'CTO', 'Managing Partner', 'Senior Software Engineer',
+          'VP of Product', 'Head of Growth', 'Principal', 'Investor', 'Director of Engineering']
+SUFFIXES = ['Inc', 'LLC', 'Labs', 'Ventures', 'Capital', 'Technologies', 'Group', 'Partners', '']
+SYLLABLES = ['ac', 'me', 'glo', 'bex', 'ini', 'tech', 'um', 'brel', 'la', 'hoo', 'li', 'stark', 'way',
+             'ne', 'cy', 'ber', 'dyne', 'vo', 'lt', 'ra', 'nex', 'tri', 'on', 'zen', 'qua', 'ntum']
+LOCATIONS = [('Madison', 'WI'), ('Milwaukee', 'WI'), ('Austin', 'TX'), ('Denver', 'CO'),
+             ('Huntsville', 'AL'), ('Chicago', 'IL'), ('Boston', 'MA'), ('Seattle', 'WA'),
+             ('San Francisco', 'CA'), ('New York', 'NY'), ('Atlanta', 'GA'), ('Omaha', 'NE')]
+EXPERTISE = ['B2B Sales', 'B2C Sales', 'Business Development', 'Design Thinking', 'Fundraising',
+             'Go-To Market Strategy', 'Growth Strategy', 'Leadership and Management', 'Marketing',
+             'Pitching', 'Product Development', 'Revenue Models', 'Software Development',
+             'Artificial Intelligence', 'Machine Learning', 'Data Science', 'Cybersecurity',
+             'Legal', 'Human Resources', 'Hardware', 'Healthcare', 'Fintech', 'Branding', 'SaaS']
+FILLER = ['Led', 'a', 'team', 'building', 'scalable', 'services', 'for', 'customers', 'and',
+          'partners', 'improved', 'latency', 'by', '40%', 'shipped', 'features', 'with', 'product']
+
+
+def make_companies(count: int, seed: int = 0) -> List[str]:
+    """Distinct synthetic company names"""
+    rng = random.Random(seed)
+    companies = set()
+    while len(companies) < count:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+        companies.add(f"{word} {rng.choice(SUFFIXES)}".strip())
+    return sorted(companies)
+
+
+def iter_mentor_rows(count: int, seed: int = 0) -> Iterator[Dict]:
+    """Mentor rows with the lookbook CSV columns (about five mentors per company)"""
+    rng = random.Random(seed)
+    companies = make_companies(max(count // 5, 1), seed)
+    for i in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+        city, state = rng.choice(LOCATIONS)
+        yield {
+            'name': name,
+            'full_name': name,
+            'title': rng.choice(TITLES),
+            'company': rng.choice(companies),
+            'city': city,
+            'state': state,
+            'country': 'United States',
+            'areas_of_expertise': ', '.join(rng.sample(EXPERTISE, rng.randint(2, 8))),
+            'biography': ' '.join(rng.choice(FILLER) for _ in range(40)),
+            'linkedin': f"https://www.linkedin.com/in/mentor-{i}/",
+            'website': '',
+        }
+
+
+def write_mentor_csv(path: Path, count: int, seed: int = 0) -> Path:
+    """Write a mentors CSV with count rows (streamed, so 1M rows is fine)"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(iter_mentor_rows(count, seed))
+    return path
+
+
+def make_jobs(count: int, seed: int = 0, companies: List[str] = None, duplicate_rate: float = 0.2) -> List[JobRecord]:
+    """
+    Jobs shaped like JobSearcher.search_adzuna results. About duplicate_rate
+    of them repeat an earlier job's URL (the same posting from another query),
+    and some are at the given companies (e.g. mentor companies).
+    """
+    rng = random.Random(seed)
+    other_companies = make_companies(max(count // 10, 1), seed + 1)
+    jobs = []
+    for i in range(count):
+        if jobs and rng.random() < duplicate_rate:
+            jobs.append(rng.choice(jobs).copy())
+            continue
+        skills = rng.sample(SKILL_KEYWORDS, 3)
+        city, state = rng.choice(LOCATIONS)
+        company = rng.choice(companies) if companies and rng.random() < 0.1 else rng.choice(other_companies)
+        jobs.append(JobRecord(
+            title=f"{rng.choice(['Senior', 'Junior', 'Staff', ''])} {skills[0].title()} Developer".strip(),
+            company=company,
+            location=f"{city}, {state}",
+            description=' '.join(rng.choice(FILLER + skills) for _ in range(60)),
+            url=f"https://www.adzuna.com/details/{seed}-{i}",
+            created='2024-01-01T00:00:00Z',
+            salary_min=rng.choice([None, 70000, 90000, 110000]),
+            salary_max=rng.choice([None, 120000, 150000, 180000]),
+            source='Adzuna',
+        ))
+    return jobs
+
+
+def make_lookbook_text(count: int, seed: int = 0) -> str:
+    """Lookbook text with count entries in the "Name | Company" + field-label format"""
+    lines = ['Mentor Lookbook', '']
+    for mentor in iter_mentor_rows(count, seed):
+        lines.append(f"{mentor['full_name']} | {mentor['company']}")
+        for label, key in (('Full Name', 'full_name'), ('Title', 'title'), ('Company', 'company'),
+                           ('City', 'city'), ('State', 'state'), ('Country', 'country')):
+            lines.extend([label, mentor[key]])
+        lines.append('Areas of Expertise')
+        lines.extend(mentor['areas_of_expertise'].split(', '))
+        lines.extend(['Biography', mentor['biography'], 'LinkedIn', mentor['linkedin'], ''])
+    return '\n'.join(lines) + '\n'
+
+
+def make_resume(words: int, seed: int = 0) -> str:
+    """Resume with a short skills section and a long experience section"""
+    rng = random.Random(seed)
+    skills = ', '.join(rng.sample(SKILL_KEYWORDS, 3))
+    mentioned = rng.sample(SKILL_KEYWORDS, 8)
+    body = []
+    for i in range(words):
+        body.append(rng.choice(mentioned) if rng.random() < 0.01 else rng.choice(FILLER))
+        if i % 15 == 14:
+            body.append('\n')
+    return f"Jane Doe\nHuntsville, AL | 555-0100\n\nSKILLS: {skills}\n\nEXPERIENCE\n{' '.join(body)}\n"
+
+
+def make_resume_pdf(text: str) -> bytes:
+    """A one-page PDF (Helvetica text, no dependencies) of the first lines of text"""
+    def escape(line):
+        return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    lines = [line for line in text.splitlines() if line.strip()][:60]
+    content = 'BT /F1 10 Tf 50 770 Td 12 TL\n' + ''.join(f'({escape(line)}) Tj T*\n' for line in lines) + 'ET'
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+        '/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+        f'<< /Length {len(content.encode("latin-1"))} >>\nstream\n{content}\nendstream',
+    ]
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj\n{obj}\nendobj\n'.encode('latin-1')
+    xref = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    pdf += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode()
+    pdf += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    return pdf
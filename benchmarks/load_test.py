@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Load test for the web app
+Starts a stub Adzuna API and the app (gunicorn or the Flask dev server)
+against synthetic mentors, drives a weighted mix of search, mentor lookup,
+bookmark and resume upload requests at a target rate, and reports latency
+percentiles, throughput and error rates per endpoint.
+Requests are scheduled open-loop: latency is measured from when a request
+was due, so a saturated server shows up as queueing delay rather than a
+quietly lower request rate.
+Usage: python benchmarks/load_test.py [--rate 20] [--duration 30] [--server gunicorn|dev]
+"""
+
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
+
+import requests
+
+from generators import LOCATIONS, iter_mentor_rows, make_resume, make_resume_pdf, write_mentor_csv
+from resume_parser import SKILL_KEYWORDS
+from stub_adzuna import StubAdzuna
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Default traffic mix (relative weights)
+MIX = {
+    'search': 2,
+    'mentors_by_company': 4,
+    'mentors_by_companies': 2,
+    'bookmarks_list': 2,
+    'bookmarks_add': 1,
+    'upload_resume': 1,
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_app(server: str, port: int, workdir: Path, adzuna_url: str, log_file) -> subprocess.Popen:
+    """Run the app from workdir (so mentors.csv, bookmarks.db and output/ live there)"""
+    env = dict(os.environ, PORT=str(port), ADZUNA_API_URL=adzuna_url,
+               ADZUNA_APP_ID='load-test', ADZUNA_APP_KEY='load-test', LOG_LEVEL='WARNING')
+    if server == 'gunicorn':
+        cmd = [sys.executable, '-m', 'gunicorn', '-c', str(ROOT / 'gunicorn.conf.py'),
+               '--pythonpath', str(ROOT), '--bind', f'127.0.0.1:{port}', 'app:app']
+    else:
+        cmd = [sys.executable, str(ROOT / 'app.py')]
+    return subprocess.Popen(cmd, cwd=workdir, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"app exited with code {process.returncode}")
+        try:
+            requests.get(f"{base_url}/api/mentors", timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError(f"app did not start within {timeout:.0f}s")
+
+
+class Traffic:
+    """Builds randomized requests for each endpoint in the mix"""
+
+    def __init__(self, base_url: str, companies: list, seed: int = 0):
+        self.base_url = base_url
+        self.companies = companies
+        self.rng = random.Random(seed)
+        self.resumes = [make_resume_pdf(make_resume(300, i)) for i in range(10)]
+        self._local = threading.local()
+        self._bookmark_ids = 0
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        # One keep-alive session per client thread
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def send(self, kind: str, timeout: float) -> requests.Response:
+        rng = self.rng
+        url = self.base_url
+        if kind == 'search':
+            city, state = rng.choice(LOCATIONS)
+            return self.session.post(f"{url}/api/search", timeout=timeout, json={
+                'skills': rng.sample(SKILL_KEYWORDS, 3),
+                'interests': [],
+                'location': f"{city}, {state}",
+                'us_wide': rng.random() < 0.5,
+                'include_mentors': True,
+            })
+        if kind == 'mentors_by_company':
+            return self.session.get(f"{url}/api/mentors/company/{quote(rng.choice(self.companies))}", timeout=timeout)
+        if kind == 'mentors_by_companies':
+            return self.session.post(f"{url}/api/mentors/companies", timeout=timeout,
+                                     json={'companies': rng.sample(self.companies, min(25, len(self.companies)))})
+        if kind == 'bookmarks_list':
+            return self.session.get(f"{url}/api/bookmarks", timeout=timeout)
+        if kind == 'bookmarks_add':
+            with self._lock:
+                self._bookmark_ids += 1
+                job_id = f"load-{self._bookmark_ids}"
+            return self.session.post(f"{url}/api/bookmarks", timeout=timeout,
+                                     json={'job_id': job_id, 'job_data': {'title': 'Engineer', 'company': 'Acme'}})
+        if kind == 'upload_resume':
+            pdf = rng.choice(self.resumes)
+            return self.session.post(f"{url}/api/upload-resume", timeout=timeout,
+                                     files={'resume': ('resume.pdf', pdf, 'application/pdf')})
+        raise ValueError(f"unknown request kind: {kind}")
+
+
+def run_load(traffic: Traffic, mix: dict, rate: float, duration: float, concurrency: int,
+             timeout: float) -> dict:
+    """Send requests at `rate` per second for `duration` seconds; latencies and errors per kind"""
+    kinds, weights = zip(*mix.items())
+    results = {kind: {'latencies': [], 'errors': 0, 'statuses': {}} for kind in kinds}
+    lock = threading.Lock()
+
+    def fire(kind, due):
+        try:
+            status = traffic.send(kind, timeout).status_code
+        except requests.RequestException as e:
+            status = type(e).__name__
+        latency = time.perf_counter() - due
+        with lock:
+            result = results[kind]
+            result['latencies'].append(latency)
+            result['statuses'][str(status)] = result['statuses'].get(str(status), 0) + 1
+            if not isinstance(status, int) or status >= 500:
+                result['errors'] += 1
+
+    schedule_rng = random.Random(1)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        due = start
+        while due - start < duration:
+            # Poisson arrivals
+            due += schedule_rng.expovariate(rate)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, schedule_rng.choices(kinds, weights)[0], due)
+    elapsed = time.perf_counter() - start
+    return {'elapsed': elapsed, 'by_kind': results}
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return float('nan')
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        'requests': count,
+        'throughput': count / elapsed if elapsed else 0.0,
+        'error_rate': errors / count if count else 0.0,
+        'p50_ms': percentile(values, 50) * 1000,
+        'p95_ms': percentile(values, 95) * 1000,
+        'p99_ms': percentile(values, 99) * 1000,
+    }
+
+
+def report(run: dict) -> dict:
+    elapsed = run['elapsed']
+    summary = {}
+    all_latencies, all_errors = [], 0
+    for kind, result in run['by_kind'].items():
+        if result['latencies']:
+            summary[kind] = {**summarize(result['latencies'], result['errors'], elapsed),
+                             'statuses': result['statuses']}
+            all_latencies.extend(result['latencies'])
+            all_errors += result['errors']
+    summary['total'] = summarize(all_latencies, all_errors, elapsed)
+
+    print(f"\n{'endpoint':<22}{'requests':>9}{'req/s':>8}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for kind, s in summary.items():
+        print(f"{kind:<22}{s['requests']:>9}{s['throughput']:>8.1f}{s['error_rate']:>8.1%}"
+              f"{s['p50_ms']:>9.0f}{s['p95_ms']:>9.0f}{s['p99_ms']:>9.0f}")
+    return summary
+
+
+def parse_mix(text: str) -> dict:
+    """'search=2,upload_resume=1' -> {'search': 2.0, 'upload_resume': 1.0}"""
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        if kind.strip() not in MIX:
+            raise ValueError(f"unknown request kind '{kind.strip()}' (choose from {', '.join(MIX)})")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Load test the web app against a stub Adzuna API')
+    parser.add_argument('--rate', type=float, default=20.0, help='Target requests per second (default: 20)')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds of load (default: 30)')
+    parser.add_argument('--concurrency', type=int, default=64, help='Maximum requests in flight')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Client timeout per request in seconds')
+    parser.add_argument('--mix', type=parse_mix, default=MIX,
+                        help='Traffic weights, e.g. search=1,mentors_by_company=5 (default: %(default)s)')
+    parser.add_argument('--server', choices=['gunicorn', 'dev'], default='gunicorn')
+    parser.add_argument('--mentors', type=int, default=1000, help='Synthetic mentors to serve')
+    parser.add_argument('--upstream-latency-ms', type=float, default=300.0, help='Stub Adzuna mean latency')
+    parser.add_argument('--upstream-jitter-ms', type=float, default=100.0, help='Stub Adzuna latency std dev')
+    parser.add_argument('--upstream-error-rate', type=float, default=0.0, help='Fraction of stub Adzuna 503s')
+    parser.add_argument('--upstream-results', type=int, default=50, help='Stub Adzuna results per call')
+    parser.add_argument('--json', help='Also write the summary to this JSON file')
+    args = parser.parse_args()
+
+    stub = StubAdzuna(latency_ms=args.upstream_latency_ms, jitter_ms=args.upstream_jitter_ms,
+                      error_rate=args.upstream_error_rate, results=args.upstream_results).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        write_mentor_csv(workdir / 'mentors.csv', args.mentors)
+        companies = sorted({row['company'] for row in iter_mentor_rows(args.mentors)})
+
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        with open(workdir / 'app.log', 'w') as log_file:
+            app = start_app(args.server, port, workdir, stub.url, log_file)
+            try:
+                wait_until_ready(base_url, app)
+                print(f"App ({args.server}) on {base_url}, stub Adzuna on {stub.url}")
+                print(f"Driving {args.rate:g} req/s for {args.duration:g}s, mix: "
+                      f"{', '.join(f'{k}={v:g}' for k, v in args.mix.items())}")
+
+                traffic = Traffic(base_url, companies)
+                run = run_load(traffic, args.mix, args.rate, args.duration, args.concurrency, args.timeout)
+            finally:
+                app.terminate()
+                try:
+                    app.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    app.kill()
+        stub.stop()
+
+        summary = report(run)
+        print(f"\nUpstream calls served by the stub: {stub.requests}")
+        errors = {kind: s['statuses'] for kind, s in summary.items()
+                  if kind != 'total' and s['error_rate'] > 0}
+        if errors:
+            print(f"Error statuses: {json.dumps(errors)}")
+            print(f"App log: {(workdir / 'app.log').read_text()[-2000:]}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'settings': {k: v for k, v in vars(args).items() if k != 'json'},
+            'summary': summary,
+        }, indent=2) + '\n')
+        print(f"✓ Summary written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
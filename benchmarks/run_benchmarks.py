@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the job search pipeline
+Runs each stage (mentor loading, company index, dedup, ranking, mentor
+expertise matching, lookbook parsing, skill extraction) and the full cross-reference on seeded synthetic
+data, reports throughput and peak memory, and compares the results with a
+stored baseline to flag regressions.
+Throughput is compared relative to a fixed pure-Python reference workload
+timed alongside each stage, so a slower or busier machine doesn't read as a
+regression; a baseline recorded on one machine holds on another.
+Usage: python benchmarks/run_benchmarks.py [--scale small|medium|large] [--save-baseline]
+"""
+
+import json
+import logging
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import EXPERTISE, make_jobs, make_lookbook_text, make_resume, write_mentor_csv
+from job_cross_reference import (JobCrossReference, JobSearcher, MentorCompanyIndex, MentorProcessor,
+                                 ReportGenerator, SkillMatcher, snapshot_path_for, write_mentor_snapshot)
+from parse_mentor_lookbook import iter_mentor_lookbook
+from resume_parser import extract_skills_from_resume
+
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+
+SCALES = {
+    'small': {'mentors': 150, 'jobs': 100, 'resumes': 20},
+    'medium': {'mentors': 10_000, 'jobs': 10_000, 'resumes': 200},
+    'large': {'mentors': 1_000_000, 'jobs': 100_000, 'resumes': 1_000},
+}
+
+USER_SKILLS = ['python', 'react', 'machine learning', 'sql', 'docker']
+
+
+# Each benchmark: setup(sizes, workdir) -> state (untimed), run(state) -> items processed (timed)
+
+def setup_mentor_csv(sizes, workdir):
+    return write_mentor_csv(workdir / 'mentors_load.csv', sizes['mentors'])
+
+
+def run_mentor_csv(csv_path):
+    processor = MentorProcessor()
+    processor.load_from_csv(str(csv_path), use_snapshot=False)
+    processor.get_mentor_skills()
+    processor.get_mentor_companies()
+    return len(processor.mentors)
+
+
+def setup_mentor_snapshot(sizes, workdir):
+    csv_path = write_mentor_csv(workdir / 'mentors_snapshot.csv', sizes['mentors'])
+    processor = MentorProcessor()
+    processor.load_from_csv(str(csv_path), use_snapshot=False)
+    processor.save_snapshot(snapshot_path_for(str(csv_path)), source_path=str(csv_path))
+    return csv_path
+
+
+def run_mentor_snapshot(csv_path):
+    processor = MentorProcessor()
+    if not processor.load_from_snapshot(snapshot_path_for(str(csv_path)), str(csv_path)):
+        raise RuntimeError('snapshot was not used')
+    return len(processor.mentors)
+
+
+def setup_company_index(sizes, workdir):
+    processor = MentorProcessor()
+    processor.load_from_csv(str(write_mentor_csv(workdir / 'mentors_index.csv', sizes['mentors'])),
+                            use_snapshot=False)
+    companies = [job['company'] for job in make_jobs(sizes['jobs'], companies=processor.get_mentor_companies())]
+    return processor.mentors, companies
+
+
+def run_company_index(state):
+    mentors, companies = state
+    MentorCompanyIndex(mentors).lookup_many(companies)
+    return len(companies)
+
+
+def setup_dedupe(sizes, workdir):
+    return make_jobs(sizes['jobs'])
+
+
+def run_dedupe(jobs):
+    JobSearcher.dedupe_jobs(jobs)
+    return len(jobs)
+
+
+def setup_rank(sizes, workdir):
+    processor = MentorProcessor()
+    processor.load_from_csv(str(write_mentor_csv(workdir / 'mentors_rank.csv', sizes['mentors'])),
+                            use_snapshot=False)
+    jobs = make_jobs(sizes['jobs'], companies=processor.get_mentor_companies())
+    return SkillMatcher(USER_SKILLS, ['AI']), jobs, processor.get_mentor_skills(), processor.get_company_matcher()
+
+
+def run_rank(state):
+    matcher, jobs, mentor_skills, company_matcher = state
+    matcher.rank_jobs(jobs, mentor_skills, company_matcher=company_matcher)
+    return len(jobs)
+
+
+def setup_mentor_skills(sizes, workdir):
+    processor = MentorProcessor()
+    processor.load_from_csv(str(write_mentor_csv(workdir / 'mentors_skills.csv', sizes['mentors'])),
+                            use_snapshot=False)
+    # Mention a few expertise areas in each job so most have relevant mentors
+    jobs = make_jobs(sizes['jobs'], duplicate_rate=0)
+    rng = random.Random(0)
+    for job in jobs:
+        job['description'] += ' ' + ' '.join(rng.sample(EXPERTISE, 3))
+    return processor.get_skill_index(), jobs
+
+
+def run_mentor_skills(state):
+    index, jobs = state
+    index.top_mentors_many(jobs, 3)
+    return len(jobs)
+
+
+def setup_lookbook(sizes, workdir):
+    return make_lookbook_text(sizes['mentors']).splitlines()
+
+
+def run_lookbook(lines):
+    return sum(1 for _ in iter_mentor_lookbook(lines))
+
+
+def setup_skills(sizes, workdir):
+    return [make_resume(800, seed) for seed in range(sizes['resumes'])]
+
+
+def run_skills(resumes):
+    for resume in resumes:
+        extract_skills_from_resume(resume)
+    return len(resumes)
+
+
+def setup_end_to_end(sizes, workdir):
+    csv_path = write_mentor_csv(workdir / 'mentors_e2e.csv', sizes['mentors'])
+    # A real run finds the snapshot left by the previous load; the first load writes it
+    write_mentor_snapshot(str(csv_path))
+    return csv_path, make_jobs(sizes['jobs']), workdir
+
+
+def run_end_to_end(state):
+    csv_path, jobs, workdir = state
+    cross_ref = JobCrossReference(USER_SKILLS, ['AI'], location='Madison, WI')
+    cross_ref.report_generator = ReportGenerator(str(workdir / 'output'))
+    # Serve the synthetic jobs in place of Adzuna, split evenly across the planned queries
+    searches = cross_ref.job_searcher.plan_searches(USER_SKILLS, 'Madison, WI')
+    chunk = math.ceil(len(jobs) / len(searches))
+    calls = iter(range(len(searches)))
+    cross_ref.job_searcher.search_adzuna = lambda query, where, limit=50, timeout=None, params=None: \
+        [job.copy() for job in jobs[next(calls) * chunk:][:chunk]]
+    result = cross_ref.process(str(csv_path))
+    return len(result['jobs'])
+
+
+def setup_reference(sizes, workdir):
+    rng = random.Random(0)
+    return [f"{rng.choice(EXPERTISE)} {rng.randrange(10 ** 6)}" for _ in range(20_000)]
+
+
+def run_reference(words):
+    """Interpreter-bound work unrelated to the pipeline: string, dict and sort operations"""
+    counts = {}
+    for word in words:
+        key = word.lower().split()[0]
+        counts[key] = counts.get(key, 0) + len(word)
+    sorted(words)
+    return len(words)
+
+
+# Timed alongside every benchmark as the yardstick for it (not itself reported)
+REFERENCE = ('reference', 'ops', setup_reference, run_reference)
+
+BENCHMARKS = [
+    # name, unit, setup, run
+    ('mentor_csv_load', 'mentors', setup_mentor_csv, run_mentor_csv),
+    ('mentor_snapshot_load', 'mentors', setup_mentor_snapshot, run_mentor_snapshot),
+    ('company_index', 'lookups', setup_company_index, run_company_index),
+    ('dedupe_jobs', 'jobs', setup_dedupe, run_dedupe),
+    ('rank_jobs', 'jobs', setup_rank, run_rank),
+    ('mentor_skills', 'jobs', setup_mentor_skills, run_mentor_skills),
+    ('parse_lookbook', 'mentors', setup_lookbook, run_lookbook),
+    ('extract_skills', 'resumes', setup_skills, run_skills),
+    ('end_to_end', 'jobs', setup_end_to_end, run_end_to_end),
+]
+
+
+def _loops_for(run, state, min_time: float) -> int:
+    """How many back-to-back runs take at least min_time seconds"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run(state)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return loops
+        loops = max(loops * 2, math.ceil(loops * min_time / elapsed * 1.2)) if elapsed > 0 else loops * 10
+
+
+def _time_per_run(run, state, loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        run(state)
+    return (time.perf_counter() - start) / loops
+
+
+def measure(run, state, repeat: int, min_time: float, reference: tuple) -> dict:
+    """
+    Median time per run over `repeat` samples, each looping the run for at
+    least min_time seconds (so millisecond stages aren't timer and scheduler
+    noise), then peak traced memory from one more run.
+    Each sample is followed by a sample of the reference (run, state) pair,
+    and 'relative' is the median ratio of the two throughputs, so changes in
+    machine speed during the run cancel out.
+    """
+    reference_run, reference_state = reference
+    items = run(state)
+    reference_items = reference_run(reference_state)
+    loops = _loops_for(run, state, min_time)
+    reference_loops = _loops_for(reference_run, reference_state, min_time)
+    samples = []
+    ratios = []
+    for _ in range(repeat):
+        seconds = _time_per_run(run, state, loops)
+        reference_seconds = _time_per_run(reference_run, reference_state, reference_loops)
+        samples.append(seconds)
+        ratios.append((items / seconds) / (reference_items / reference_seconds))
+    seconds = statistics.median(samples)
+
+    tracemalloc.start()
+    run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'items': items,
+        'seconds': seconds,
+        'throughput': items / seconds if seconds > 0 else float('inf'),
+        'relative': statistics.median(ratios),
+        'peak_mb': peak / 1e6,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Names and reasons for benchmarks that regressed past the tolerance"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or 'relative' not in base:
+            continue
+        # Throughput as a multiple of the reference workload's, measured on the same machine
+        if result['relative'] < base['relative'] * (1 - tolerance):
+            regressions.append(f"{name}: {result['relative']:.3f}x reference throughput "
+                               f"vs baseline {base['relative']:.3f}x")
+        # Allow a little absolute slack so tiny allocations don't flap
+        if result['peak_mb'] > base['peak_mb'] * (1 + tolerance) + 0.5:
+            regressions.append(f"{name}: peak memory {result['peak_mb']:.1f} MB vs baseline {base['peak_mb']:.1f} MB")
+    return regressions
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the job search pipeline on synthetic data')
+    parser.add_argument('--scale', choices=SCALES, default='small', help='Data sizes (default: small)')
+    parser.add_argument('--mentors', type=int, help='Override the number of mentors')
+    parser.add_argument('--jobs', type=int, help='Override the number of jobs')
+    parser.add_argument('--only', nargs='+', choices=[b[0] for b in BENCHMARKS], help='Run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed samples per benchmark (median is kept)')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Seconds each sample runs for, looping short benchmarks (default: 0.2)')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='Baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown / memory growth before flagging a regression (default: 0.25)')
+    args = parser.parse_args()
+
+    # Keep pipeline logs out of the results table
+    logging.getLogger('jobsearch').setLevel(logging.WARNING)
+
+    sizes = dict(SCALES[args.scale])
+    if args.mentors:
+        sizes['mentors'] = args.mentors
+    if args.jobs:
+        sizes['jobs'] = args.jobs
+    # Custom sizes get their own baseline entry
+    scale_key = args.scale if sizes == SCALES[args.scale] else f"{sizes['mentors']}m_{sizes['jobs']}j"
+
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    baseline = baselines.get(scale_key, {})
+
+    print(f"Scale: {scale_key} ({sizes['mentors']} mentors, {sizes['jobs']} jobs, {sizes['resumes']} resumes)")
+    print(f"{'benchmark':<22}{'items':>10}{'ms':>11}{'items/s':>13}{'peak MB':>10}{'vs baseline':>13}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        _, _, setup_ref, run_ref = REFERENCE
+        reference = (run_ref, setup_ref(sizes, Path(tmp)))
+        for name, unit, setup, run in BENCHMARKS:
+            if args.only and name not in args.only:
+                continue
+            state = setup(sizes, Path(tmp))
+            result = measure(run, state, args.repeat, args.min_time, reference)
+            results[name] = result
+            base = baseline.get(name)
+            change = f"{result['relative'] / base['relative'] - 1:+.0%}" if base and 'relative' in base else '-'
+            print(f"{name:<22}{result['items']:>10}{result['seconds'] * 1000:>11.1f}"
+                  f"{result['throughput']:>13,.0f}{result['peak_mb']:>10.1f}{change:>13}")
+
+    if args.save_baseline:
+        baselines[scale_key] = {**baseline, **{
+            name: {'relative': round(r['relative'], 4), 'throughput': round(r['throughput'], 1),
+                   'peak_mb': round(r['peak_mb'], 2)}
+            for name, r in results.items()
+        }}
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+        print(f"\n✓ Baseline saved to {baseline_path}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+    if baseline:
+        print(f"\n✓ No regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Stub Adzuna search API for offline load tests
+Serves Adzuna-shaped search results from the synthetic job generator with
+configurable latency, error rate and result count. Point the app at it with
+ADZUNA_API_URL=http://127.0.0.1:<port>/v1/api/jobs/us/search/1
+Usage: python benchmarks/stub_adzuna.py [--port 8765] [--latency-ms 300] [--error-rate 0.02]
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from generators import make_jobs
+
+
+def adzuna_result(job) -> dict:
+    """A job in Adzuna's response format"""
+    return {
+        'title': job['title'],
+        'company': {'display_name': job['company']},
+        'location': {'display_name': job['location']},
+        'description': job['description'],
+        'redirect_url': job['url'],
+        'created': job['created'],
+        'salary_min': job['salary_min'],
+        'salary_max': job['salary_max'],
+    }
+
+
+class StubAdzuna:
+    """Threaded HTTP server answering /v1/api/jobs/<country>/search/<page>"""
+
+    def __init__(self, port: int = 0, latency_ms: float = 300.0, jitter_ms: float = 100.0,
+                 error_rate: float = 0.0, results: int = 50, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.results = results
+        # A pool of postings; each query gets a deterministic slice of it
+        self.pool = [adzuna_result(job) for job in make_jobs(max(results * 20, 1000), seed, duplicate_rate=0)]
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1/api/jobs/us/search/1"
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests += 1
+        params = parse_qs(urlparse(handler.path).query)
+        delay = max(0.0, random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+        time.sleep(delay)
+
+        if random.random() < self.error_rate:
+            self._send(handler, 503, {'exception': 'SERVICE_UNAVAILABLE'})
+            return
+        count = min(int(params.get('results_per_page', ['50'])[0]), self.results)
+        key = f"{params.get('what', [''])[0]}|{params.get('where', [''])[0]}"
+        start = hash(key) % (len(self.pool) - count + 1)
+        self._send(handler, 200, {'count': count, 'results': self.pool[start:start + count]})
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        try:
+            handler.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up waiting (e.g. its timeout fired)
+
+    def start(self) -> 'StubAdzuna':
+        """Serve in a background thread"""
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a stub Adzuna search API')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=300.0, help='Mean response latency')
+    parser.add_argument('--jitter-ms', type=float, default=100.0, help='Standard deviation of the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--results', type=int, default=50, help='Maximum results per response')
+    args = parser.parse_args()
+
+    stub = StubAdzuna(args.port, args.latency_ms, args.jitter_ms, args.error_rate, args.results)
+    print(f"Stub Adzuna listening on {stub.url}")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Bookmark Storage
+SQLite-backed store for saved jobs, safe to share between worker processes
+"""
+
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from telemetry import log_event
+
+
+class BookmarkStore:
+    """Stores bookmarked jobs keyed by job_id"""
+
+    def __init__(self, db_path: str = 'bookmarks.db', legacy_json: Optional[str] = 'bookmarks.json'):
+        self.db_path = str(db_path)
+        is_new = not Path(self.db_path).exists()
+
+        with self._connect() as conn:
+            # WAL lets readers proceed while another process is writing
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS bookmarks (
+                    job_id TEXT PRIMARY KEY,
+                    job_data TEXT NOT NULL,
+                    bookmarked_at TEXT NOT NULL
+                )
+            """)
+
+        if is_new and legacy_json and Path(legacy_json).exists():
+            self._import_legacy(legacy_json)
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection wrapped in a transaction"""
+        # The timeout makes concurrent writers wait for the lock instead of failing
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _import_legacy(self, json_path: str) -> None:
+        """Copy bookmarks from the old bookmarks.json file"""
+        try:
+            with open(json_path, 'r') as f:
+                bookmarks = json.load(f).get('bookmarks', [])
+        except Exception as e:
+            log_event('bookmark_import_failed', logging.WARNING, path=json_path, error=str(e))
+            return
+
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO bookmarks (job_id, job_data, bookmarked_at) VALUES (?, ?, ?)',
+                [(str(b.get('job_id')), json.dumps(b.get('job_data')), str(b.get('bookmarked_at', '')))
+                 for b in bookmarks if b.get('job_id')]
+            )
+        log_event('bookmarks_imported', path=json_path, bookmarks=len(bookmarks))
+
+    def list_all(self) -> List[Dict]:
+        """All bookmarks, oldest first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT job_id, job_data, bookmarked_at FROM bookmarks ORDER BY rowid'
+            ).fetchall()
+        return [
+            {'job_id': job_id, 'job_data': json.loads(job_data), 'bookmarked_at': bookmarked_at}
+            for job_id, job_data, bookmarked_at in rows
+        ]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Look up a single bookmark"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT job_id, job_data, bookmarked_at FROM bookmarks WHERE job_id = ?', (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'job_id': row[0], 'job_data': json.loads(row[1]), 'bookmarked_at': row[2]}
+
+    def add(self, job_id: str, job_data: Dict) -> bool:
+        """Bookmark a job; returns False if it was already bookmarked"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO bookmarks (job_id, job_data, bookmarked_at) VALUES (?, ?, ?)',
+                (job_id, json.dumps(job_data), datetime.now().isoformat(timespec='seconds'))
+            )
+            return cursor.rowcount > 0
+
+    def remove(self, job_id: str) -> bool:
+        """Remove a bookmark; returns False if it did not exist"""
+        with self._connect() as conn:
+            cursor = conn.execute('DELETE FROM bookmarks WHERE job_id = ?', (job_id,))
+            return cursor.rowcount > 0
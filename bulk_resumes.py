@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Bulk resume ingestion for a cohort of candidates
+Extracts text, skills and location from a directory or .zip of resumes in
+parallel and writes one compact profile JSON per candidate
+Usage: python bulk_resumes.py <resumes_dir_or_zip> [--output profiles] [--workers N]
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from gazetteer import get_gazetteer
+from resume_extraction import extract_pdf_text
+from resume_parser import extract_skills_from_resume, extract_location_from_resume
+
+
+RESUME_EXTENSIONS = ('.pdf', '.txt')
+# Limits on an archive's uncompressed contents, checked before anything is
+# decompressed (the compressed size says little about what a zip expands to)
+MAX_RESUME_BYTES = 20 * 1024 * 1024
+MAX_ARCHIVE_RESUMES = 10000
+MAX_ARCHIVE_BYTES = 2 * 1024 ** 3
+
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w.-]+')
+
+
+def candidate_names(sources: List[str]) -> List[str]:
+    """
+    Candidate name for each resume: the file stem ('alice' for 'alice.pdf'),
+    or the full source path when another resume in the batch has the same
+    stem, so every candidate in a batch is distinct
+    """
+    stems = Counter(Path(source).stem for source in sources)
+    names = [Path(source).stem if stems[Path(source).stem] == 1 else source for source in sources]
+    # A zip archive can even repeat a member name
+    seen = Counter()
+    unique = []
+    for name in names:
+        seen[name] += 1
+        unique.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+    return unique
+
+
+def build_profile(name: str, text: str, data: bytes, candidate: str = None) -> Dict:
+    """Compact candidate profile from extracted resume text"""
+    return {
+        'candidate': candidate or Path(name).stem,
+        'source': name,
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'skills': extract_skills_from_resume(text),
+        'location': get_gazetteer().canonical(extract_location_from_resume(text)),
+    }
+
+
+def resume_text(name: str, data: bytes, max_pages: int = 10) -> str:
+    """Text of a PDF or plain-text resume"""
+    if name.lower().endswith('.pdf'):
+        return extract_pdf_text(data, max_pages)
+    return data.decode('utf-8', errors='replace')
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 ** 2:.1f} MB"
+
+
+def archive_resumes(archive: zipfile.ZipFile, max_files: int = MAX_ARCHIVE_RESUMES,
+                    max_bytes: int = MAX_ARCHIVE_BYTES) -> List[zipfile.ZipInfo]:
+    """
+    The resume members of a zip archive, raising ValueError if there are more
+    than max_files, any is over MAX_RESUME_BYTES, or they add up to more than
+    max_bytes uncompressed
+    """
+    members = [info for info in archive.infolist()
+               if info.filename.lower().endswith(RESUME_EXTENSIONS) and not info.filename.startswith('__MACOSX/')]
+    if len(members) > max_files:
+        raise ValueError(f"archive has {len(members)} resumes (limit {max_files})")
+    for info in members:
+        if info.file_size > MAX_RESUME_BYTES:
+            raise ValueError(f"{info.filename} is {_mb(info.file_size)} uncompressed (limit {_mb(MAX_RESUME_BYTES)})")
+    total = sum(info.file_size for info in members)
+    if total > max_bytes:
+        raise ValueError(f"archive expands to {_mb(total)} (limit {_mb(max_bytes)})")
+    return members
+
+
+def read_member(archive: zipfile.ZipFile, member) -> bytes:
+    """Contents of one archive member, never reading more than MAX_RESUME_BYTES"""
+    with archive.open(member) as f:
+        data = f.read(MAX_RESUME_BYTES + 1)
+    if len(data) > MAX_RESUME_BYTES:
+        raise ValueError(f"{getattr(member, 'filename', member)} is larger than {_mb(MAX_RESUME_BYTES)} uncompressed")
+    return data
+
+
+def iter_resume_files(source: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, location) for each resume in a directory or zip archive"""
+    path = Path(source)
+    if path.is_dir():
+        for file_path in sorted(path.rglob('*')):
+            if file_path.is_file() and file_path.suffix.lower() in RESUME_EXTENSIONS:
+                yield str(file_path.relative_to(path)), str(file_path)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive_resumes(archive):
+                yield info.filename, f'{path}::{info.filename}'
+    else:
+        raise ValueError(f"{source} is not a directory or zip archive")
+
+
+def _read_resume(location: str) -> bytes:
+    if '::' in location:
+        archive_path, member = location.split('::', 1)
+        with zipfile.ZipFile(archive_path) as archive:
+            return read_member(archive, member)
+    with open(location, 'rb') as f:
+        return f.read()
+
+
+def process_resume(item: Tuple[str, str, str, int]) -> Dict:
+    """Build one candidate profile (runs in a worker process)"""
+    name, location, candidate, max_pages = item
+    try:
+        data = _read_resume(location)
+        return build_profile(name, resume_text(name, data, max_pages), data, candidate)
+    except Exception as e:
+        return {'candidate': candidate, 'source': name, 'error': str(e)}
+
+
+def _profile_filename(profile: Dict) -> str:
+    # Flatten archive/subdirectory paths into one safe file name, keeping the
+    # extension and adding a hash of the (unique) candidate so 'alice.pdf'/'alice.txt'
+    # and 'a/b.pdf'/'a_b.pdf' don't overwrite each other
+    digest = hashlib.sha1(profile['candidate'].encode('utf-8')).hexdigest()[:8]
+    return f"{_UNSAFE_FILENAME_RE.sub('_', profile['source'])}-{digest}.json"
+
+
+def ingest(source: str, output_dir: str = 'profiles', workers: int = None, max_pages: int = 10) -> Dict:
+    """Extract profiles for every resume in source and write them to output_dir"""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    files = list(iter_resume_files(source))
+    candidates = candidate_names([name for name, _ in files])
+    items = [(name, location, candidate, max_pages) for (name, location), candidate in zip(files, candidates)]
+    print(f"🔍 Found {len(items)} resumes in {source}")
+
+    start = time.perf_counter()
+    succeeded = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for profile in executor.map(process_resume, items, chunksize=4):
+            with open(output_path / _profile_filename(profile), 'w', encoding='utf-8') as f:
+                json.dump(profile, f, ensure_ascii=False, separators=(',', ':'))
+            if 'error' in profile:
+                failed += 1
+                print(f"⚠ {profile['source']}: {profile['error']}")
+            else:
+                succeeded += 1
+    elapsed = time.perf_counter() - start
+
+    rate = len(items) / elapsed if elapsed > 0 else 0.0
+    return {
+        'resumes': len(items),
+        'succeeded': succeeded,
+        'failed': failed,
+        'seconds': elapsed,
+        'resumes_per_second': rate,
+        'output_dir': str(output_path),
+    }
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Extract skills and location from a batch of resumes')
+    parser.add_argument('source', help='Directory or .zip archive of PDF/TXT resumes')
+    parser.add_argument('--output', '-o', default='profiles',
+                        help='Directory for per-candidate profile JSON files (default: profiles)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--max-pages', type=int, default=10,
+                        help='Pages to read from each PDF (default: 10)')
+
+    args = parser.parse_args()
+
+    summary = ingest(args.source, args.output, workers=args.workers, max_pages=args.max_pages)
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"Resumes processed: {summary['resumes']} ({summary['failed']} failed)")
+    print(f"Time: {summary['seconds']:.2f}s")
+    print(f"Throughput: {summary['resumes_per_second']:.1f} resumes/second")
+    print(f"Profiles written to: {summary['output_dir']}")
+
+
+if __name__ == "__main__":
+    main()
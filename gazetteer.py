@@ -0,0 +1,168 @@
+"""
+Location Gazetteer
+Offline index of US places (the country, states and major cities) with
+coordinates, loaded from gazetteer.csv. Resolves free-text locations such
+as "SF, CA", "San Francisco CA" or "san francisco, california" to one
+canonical place, so equivalent searches share an upstream query and cache
+entry, and measures distances for radius filtering without a geocoding
+service.
+"""
+
+import bisect
+import csv
+import math
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+GAZETTEER_PATH = Path(__file__).parent / 'gazetteer.csv'
+
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_SPACE_RE = re.compile(r'\s+')
+_COUNTRY_NAMES = {'us', 'usa', 'united states', 'united states of america'}
+
+
+class Place(NamedTuple):
+    id: str
+    kind: str  # 'country', 'state' or 'city'
+    name: str
+    state: str  # two-letter code ('' for the country)
+    lat: float
+    lon: float
+
+    @property
+    def display(self) -> str:
+        """Canonical text for the place, e.g. 'San Francisco, CA'"""
+        return f"{self.name}, {self.state}" if self.kind == 'city' else self.name
+
+
+def normalize(text: str) -> str:
+    """Lowercase, punctuation to spaces, single-spaced ('St. Louis,MO' -> 'st louis mo')"""
+    return _SPACE_RE.sub(' ', _NON_WORD_RE.sub(' ', str(text).lower())).strip()
+
+
+def distance_km(a: Place, b: Place) -> float:
+    """Great-circle distance between two places"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (a.lat, a.lon, b.lat, b.lon))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 6371.0 * 2 * math.asin(math.sqrt(h))
+
+
+class Gazetteer:
+    """Alias and prefix index over the places in a gazetteer CSV"""
+
+    def __init__(self, path: Path = GAZETTEER_PATH):
+        self.places: Dict[str, Place] = {}
+        self._aliases: Dict[str, Place] = {}  # whole normalized text -> place
+        self._states: Dict[str, Place] = {}  # 'wi' / 'wisconsin' -> state
+        self._cities: Dict[str, List[Place]] = {}  # city name or alias -> every city called that
+        self._city_state: Dict[Tuple[str, str], Place] = {}  # (city name or alias, 'WI') -> city
+
+        rows = []
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                place = Place(row['id'], row['kind'], row['name'], row['state'],
+                              float(row['lat']), float(row['lon']))
+                self.places[place.id] = place
+                aliases = [normalize(a) for a in row['aliases'].split('|') if a.strip()]
+                rows.append((place, aliases))
+
+        # Whole-text keys, first come first served: two-letter state codes,
+        # explicit aliases, then state names, then city names (so 'la' is
+        # Louisiana rather than Los Angeles, 'washington' is the state and
+        # 'new york' is the city, via its alias)
+        for place, aliases in rows:
+            if place.kind == 'state':
+                self._aliases.setdefault(place.state.lower(), place)
+        for place, aliases in rows:
+            for alias in aliases:
+                self._aliases.setdefault(alias, place)
+        for place, aliases in rows:
+            if place.kind == 'state':
+                for key in [normalize(place.name), place.state.lower()] + aliases:
+                    self._states.setdefault(key, place)
+                    self._aliases.setdefault(key, place)
+            elif place.kind == 'country':
+                self._aliases.setdefault(normalize(place.name), place)
+        for place, aliases in rows:
+            if place.kind != 'city':
+                continue
+            state = self._states[place.state.lower()]
+            for name in [normalize(place.name)] + aliases:
+                self._cities.setdefault(name, []).append(place)
+                self._city_state[(name, place.state)] = place
+                self._aliases.setdefault(name, place)
+                self._aliases.setdefault(f"{name} {place.state.lower()}", place)
+                self._aliases.setdefault(f"{name} {normalize(state.name)}", place)
+
+        # Sorted (key, id) pairs for prefix completion
+        self._prefix_keys = sorted({(key, place.id) for key, place in self._aliases.items()})
+
+    def resolve(self, text: str, near: Place = None) -> Optional[Place]:
+        """
+        The place a free-text location refers to, or None if it isn't known.
+        A city name shared by several places (e.g. 'Springfield') resolves to
+        the one nearest `near` when given, otherwise to the first listed.
+        """
+        parts = [normalize(part) for part in str(text or '').split(',')]
+        parts = [part for part in parts if part]
+        while len(parts) > 1 and parts[-1] in _COUNTRY_NAMES:
+            parts.pop()
+        if not parts:
+            return None
+        full = ' '.join(parts)
+
+        place = self._aliases.get(full)
+        if place is not None:
+            if place.kind == 'city' and near is not None:
+                return self._nearest(self._cities.get(full, [place]), near)
+            return place
+
+        # "<city> <state>", with the state as a code or a name of up to three words
+        tokens = full.split()
+        for size in (3, 2, 1):
+            if len(tokens) > size:
+                state = self._states.get(' '.join(tokens[-size:]))
+                if state is not None:
+                    return self._city_state.get((' '.join(tokens[:-size]), state.state))
+
+        # "<city>, <county or region>", as in Adzuna's "Madison, Dane County"
+        if len(parts) > 1 and parts[0] in self._cities:
+            return self._nearest(self._cities[parts[0]], near)
+        return None
+
+    @staticmethod
+    def _nearest(candidates: List[Place], near: Optional[Place]) -> Place:
+        if near is None or len(candidates) == 1:
+            return candidates[0]
+        return min(candidates, key=lambda place: distance_km(place, near))
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Place]:
+        """Places with a name or alias starting with prefix"""
+        key = normalize(prefix)
+        if not key:
+            return []
+        matches = []
+        i = bisect.bisect_left(self._prefix_keys, (key, ''))
+        while i < len(self._prefix_keys) and len(matches) < limit:
+            name, place_id = self._prefix_keys[i]
+            if not name.startswith(key):
+                break
+            place = self.places[place_id]
+            if place not in matches:
+                matches.append(place)
+            i += 1
+        return matches
+
+    def canonical(self, text: str) -> str:
+        """Canonical text for a location, or the text itself (trimmed) if it isn't known"""
+        place = self.resolve(text)
+        return place.display if place is not None else str(text or '').strip()
+
+
+def get_gazetteer() -> Gazetteer:
+    """Shared gazetteer (loaded once per process)"""
+    if not hasattr(get_gazetteer, '_gazetteer'):
+        get_gazetteer._gazetteer = Gazetteer()
+    return get_gazetteer._gazetteer
@@ -0,0 +1,83 @@
+"""
+Gunicorn configuration for production serving
+Runs several threaded workers forked from a master that has already loaded
+the app and built the mentor store, so workers share it copy-on-write.
+Usage: gunicorn -c gunicorn.conf.py app:app
+All settings can be overridden with the environment variables below.
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+
+# Processes for CPU-bound work (ranking, matching), threads for requests waiting on Adzuna
+workers = int(os.environ.get('WEB_CONCURRENCY', min(2 * (os.cpu_count() or 1) + 1, 8)))
+threads = int(os.environ.get('WEB_THREADS', 4))
+worker_class = 'gthread'
+
+# Import app.py once in the master so warm-up state is inherited by every worker
+preload_app = True
+
+# Recycle workers gracefully after a number of requests (jittered so they don't restart together)
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('WEB_MAX_REQUESTS_JITTER', 100))
+# A search makes several upstream calls, so allow more than the 30s default
+timeout = int(os.environ.get('WEB_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+
+# Workers publish their metrics here so /metrics on any worker reports totals for all
+# (read by telemetry.py when the app is imported, which happens after this file)
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), f"jobsearch-metrics-{os.getpid()}"))
+
+
+def on_starting(server):
+    """Start from an empty metrics directory"""
+    metrics_dir = os.environ['METRICS_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def when_ready(server):
+    """Warm up in the master after the app is loaded and before any worker forks"""
+    import app
+
+    stats = app.warm_up()
+    # Publish the warm-up stages (mentor load etc.), which happen once, in the master
+    app.REGISTRY.write_state()
+    # Move warmed objects out of the collector's view so GC passes in the
+    # workers don't write to their pages and break copy-on-write sharing
+    gc.freeze()
+    server.log.info("Warmed up: %(mentors)d mentors, %(companies)d companies", stats)
+
+
+def post_fork(server, worker):
+    """Drop the metrics copied from the master (it reports its own) and start publishing"""
+    from telemetry import REGISTRY
+
+    REGISTRY.reset()
+    REGISTRY.start_flusher(float(os.environ.get('METRICS_FLUSH_SECONDS', 5)))
+
+
+def worker_exit(server, worker):
+    """Publish a worker's final metrics as it exits"""
+    from telemetry import REGISTRY
+
+    REGISTRY.write_state()
+
+
+def child_exit(server, worker):
+    """Fold an exited worker's metrics into the archive so totals survive recycling"""
+    from telemetry import REGISTRY
+
+    REGISTRY.retire_process(worker.pid)
+
+
+def on_exit(server):
+    shutil.rmtree(os.environ['METRICS_DIR'], ignore_errors=True)
@@ -5,74 +5,687 @@ Cross-references mentors from Spark/Gener8tor network with available jobs
 based on skills, location, and career alignment.
 """
 
-import pandas as pd
+import csv
+import heapq
 import json
+import logging
+import math
 import os
-from typing import List, Dict, Optional
-from datetime import datetime
-import requests
+import re
+import time
+from typing import Dict, Iterator, List, Optional
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from gazetteer import Place, distance_km, get_gazetteer
+from records import JobRecord, MentorRecord, to_dict
+from telemetry import (JOBS, UPSTREAM_REQUESTS, UPSTREAM_SECONDS, configure_logging, log_event,
+                       record_cache, span)
+
+
+_COMPANY_SUFFIX_RE = re.compile(r'\s+(inc|llc|ltd|corp|corporation|company|co)\.?$')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+
+def normalize_company(name: str) -> str:
+    """Normalize a company name for matching (lowercase, no legal suffix or punctuation)"""
+    name = str(name).lower().strip()
+    # Remove common suffixes
+    name = _COMPANY_SUFFIX_RE.sub('', name)
+    # Remove special characters
+    name = _NON_WORD_RE.sub('', name)
+    return name
+
+
+def mentor_summary(mentor: Dict) -> Dict:
+    """Public mentor fields returned by the API"""
+    return {
+        'name': str(mentor.get('name', 'N/A')),
+        'full_name': str(mentor.get('full_name', mentor.get('name', 'N/A'))),
+        'title': str(mentor.get('title', 'N/A')),
+        'company': str(mentor.get('company', 'N/A')),
+        'linkedin': str(mentor.get('linkedin', '')),
+        'areas_of_expertise': str(mentor.get('areas_of_expertise', ''))
+    }
+
+
+def _trigrams(text: str) -> set:
+    """Distinct character trigrams of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CompanyMatcher:
+    """
+    Fuzzy company-name resolution over a set of companies.
+    Names are normalized once and indexed by character trigram and by word,
+    so a lookup only touches companies sharing trigrams or words with the query.
+    """
+    
+    def __init__(self, companies: List[str] = None):
+        self.companies = set()    # normalized company names
+        self.by_trigram = {}      # trigram -> normalized companies containing it
+        self.trigram_counts = {}  # normalized company -> number of distinct trigrams
+        self.short = set()        # normalized companies too short to have a trigram
+        self.by_word = {}         # word -> normalized companies containing it
+        for company in companies or []:
+            self.add(company)
+    
+    def add(self, company: str) -> str:
+        """Index a company name, returning its normalized form"""
+        normalized = normalize_company(company)
+        if not normalized or normalized in self.companies:
+            return normalized
+        
+        self.companies.add(normalized)
+        trigrams = _trigrams(normalized)
+        if trigrams:
+            self.trigram_counts[normalized] = len(trigrams)
+            for trigram in trigrams:
+                self.by_trigram.setdefault(trigram, set()).add(normalized)
+        else:
+            self.short.add(normalized)
+        for word in set(normalized.split()):
+            self.by_word.setdefault(word, set()).add(normalized)
+        return normalized
+    
+    def match(self, company_name: str) -> set:
+        """Return the normalized indexed companies matching a company name"""
+        normalized_search = normalize_company(company_name)
+        if not normalized_search:
+            return set()
+        
+        matched = set()
+        
+        # 1. Normalized match (also covers exact case-insensitive match)
+        if normalized_search in self.companies:
+            matched.add(normalized_search)
+        
+        # 2. One contains the other (for partial matches). A company containing
+        # the search shares all of the search's trigrams, and a company contained
+        # in the search has all of its own trigrams among the search's.
+        if len(normalized_search) > 3:
+            search_trigrams = _trigrams(normalized_search)
+            hits = {}
+            for trigram in search_trigrams:
+                for normalized in self.by_trigram.get(trigram, ()):
+                    hits[normalized] = hits.get(normalized, 0) + 1
+            for normalized, count in hits.items():
+                if count == len(search_trigrams) and normalized_search in normalized:
+                    matched.add(normalized)
+                elif count == self.trigram_counts[normalized] and normalized in normalized_search:
+                    matched.add(normalized)
+            for normalized in self.short:
+                if normalized in normalized_search:
+                    matched.add(normalized)
+        
+        # 3. Word-by-word match (e.g., "JPMorgan Chase" matches "JPMorgan Chase & Co.")
+        search_words = set(normalized_search.split())
+        required = min(2, len(search_words))
+        common_counts = {}
+        for word in search_words:
+            for normalized in self.by_word.get(word, ()):
+                common_counts[normalized] = common_counts.get(normalized, 0) + 1
+        matched.update(n for n, count in common_counts.items() if count >= required)
+        
+        return matched
+
+
+class MentorCompanyIndex:
+    """
+    Precomputed index for finding mentors by company name.
+    Company names are resolved through a CompanyMatcher built once over the
+    mentors' companies instead of scanning every mentor per lookup.
+    """
+    
+    def __init__(self, mentors: List[Dict]):
+        self.summaries = []
+        self.by_normalized = {}  # normalized company -> mentor positions
+        self.matcher = CompanyMatcher()
+        
+        for mentor in mentors:
+            company = mentor.get('company', '')
+            if not isinstance(company, str) or not company.strip():
+                continue
+            normalized = self.matcher.add(company)
+            if not normalized:
+                continue
+            
+            position = len(self.summaries)
+            self.summaries.append(mentor_summary(mentor))
+            self.by_normalized.setdefault(normalized, []).append(position)
+    
+    def match_companies(self, company_name: str) -> set:
+        """Return the normalized mentor companies matching a company name"""
+        return self.matcher.match(company_name)
+    
+    def lookup(self, company_name: str) -> List[Dict]:
+        """Find mentors who work at a company, in mentor file order"""
+        positions = []
+        for normalized in self.match_companies(company_name):
+            positions.extend(self.by_normalized[normalized])
+        return [self.summaries[p] for p in sorted(positions)]
+    
+    def lookup_many(self, company_names: List[str]) -> Dict[str, List[Dict]]:
+        """Resolve many company names at once, reusing results for repeated names"""
+        results = {}
+        resolved = {}
+        for company_name in company_names:
+            if company_name in results:
+                continue
+            key = normalize_company(company_name)
+            if key not in resolved:
+                resolved[key] = self.lookup(company_name)
+            results[company_name] = resolved[key]
+        return results
+
+
+_SKILL_PAREN_RE = re.compile(r'\(([^)]*)\)')
+_SKILL_FIELDS = ('skills', 'expertise', 'specialties', 'areas', 'competencies', 'areas_of_expertise')
+# Labels that say nothing about what a mentor can help with
+_GENERIC_SKILLS = {'other'}
+
+
+def mentor_skill_labels(mentor: Dict) -> List[str]:
+    """A mentor's skill labels, from whichever skill columns the file has"""
+    labels = []
+    for field in _SKILL_FIELDS:
+        value = mentor.get(field)
+        if isinstance(value, str):
+            labels.extend(s.strip() for s in value.split(',') if s.strip())
+        elif isinstance(value, list):
+            labels.extend(str(s).strip() for s in value if s)
+    return labels
+
+
+def skill_terms(label: str) -> List[str]:
+    """
+    Phrases that show a skill in job text: the label, any acronym in
+    parentheses, and the parts of "X and Y" / "X/Y" labels
+    ('Search Engine Optimization (SEO)' -> 'seo', 'search engine optimization')
+    """
+    label = label.lower().replace('-', ' ').replace('_', ' ')
+    terms = [acronym.strip() for acronym in _SKILL_PAREN_RE.findall(label)]
+    base = re.sub(r'^and\s+', '', _SKILL_PAREN_RE.sub('', label).strip())
+    terms.append(base)
+    for separator in (' and ', '/'):
+        if separator in base:
+            terms.extend(part.strip() for part in base.split(separator))
+    return [term for term in dict.fromkeys(terms) if len(term) > 1]
+
+
+class MentorSkillIndex:
+    """
+    Mentors' areas of expertise as bitsets over the skill vocabulary.
+    Each distinct skill label gets one bit, so a mentor is an int with a bit
+    per skill. A job is encoded the same way from the skill terms found in
+    its text, and a mentor's relevance to it is popcount(mentor & job).
+    """
+    
+    def __init__(self, mentors: List[Dict]):
+        self.vocabulary = []  # bit -> skill label
+        bits = {}  # normalized label -> bit
+        self.summaries = []
+        self.vectors = []  # mentor position -> bitset
+        
+        for mentor in mentors:
+            vector = 0
+            for label in mentor_skill_labels(mentor):
+                key = ' '.join(label.lower().split())
+                if key in _GENERIC_SKILLS:
+                    continue
+                if key not in bits:
+                    bits[key] = len(self.vocabulary)
+                    self.vocabulary.append(label)
+                vector |= 1 << bits[key]
+            if vector:
+                self.summaries.append(mentor_summary(mentor))
+                self.vectors.append(vector)
+        # Fewer skills means a more focused match, used to break ties
+        self._sizes = [vector.bit_count() for vector in self.vectors]
+        
+        # One regex over every term; each term sets the bits of the labels it came from
+        self._term_bits = {}
+        for label, bit in bits.items():
+            for term in skill_terms(label):
+                self._term_bits[term] = self._term_bits.get(term, 0) | (1 << bit)
+        terms = sorted(self._term_bits, key=len, reverse=True)
+        # The regex takes the longest term at each position, so a longer term
+        # also carries the bits of the terms inside it ('b2b sales' -> 'sales')
+        for term in terms:
+            for inner in terms:
+                if len(inner) < len(term) and re.search(r'\b' + re.escape(inner) + r'\b', term):
+                    self._term_bits[term] |= self._term_bits[inner]
+        self._term_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, terms)) + r')\b') if terms else None
+    
+    def encode_job(self, job: Dict) -> int:
+        """Bitset of the vocabulary skills mentioned in a job's title and description"""
+        if self._term_re is None:
+            return 0
+        text = f"{job.get('title', '')} {job.get('description', '')}".lower().replace('-', ' ').replace('_', ' ')
+        vector = 0
+        for term in set(self._term_re.findall(text)):
+            vector |= self._term_bits[term]
+        return vector
+    
+    def skills_of(self, vector: int) -> List[str]:
+        """Skill labels of the bits set in a vector"""
+        return [label for bit, label in enumerate(self.vocabulary) if vector >> bit & 1]
+    
+    def top_mentors(self, job_vector: int, n: int = 3) -> List[Dict]:
+        """The n mentors sharing the most skills with a job vector, with the shared skills"""
+        if not job_vector or n <= 0:
+            return []
+        overlaps = [(vector & job_vector).bit_count() for vector in self.vectors]
+        best = heapq.nlargest(n, (p for p, overlap in enumerate(overlaps) if overlap),
+                              key=lambda p: (overlaps[p], -self._sizes[p], -p))
+        return [
+            {**self.summaries[p], 'shared_skills': self.skills_of(self.vectors[p] & job_vector)}
+            for p in best
+        ]
+    
+    def top_mentors_many(self, jobs: List[Dict], n: int = 3) -> List[List[Dict]]:
+        """top_mentors for each job, computing each distinct job vector once"""
+        resolved = {}
+        results = []
+        for job in jobs:
+            vector = self.encode_job(job)
+            if vector not in resolved:
+                resolved[vector] = self.top_mentors(vector, n)
+            results.append(resolved[vector])
+        return results
+
+
+SNAPSHOT_VERSION = 4
+
+
+def snapshot_path_for(file_path: str) -> str:
+    """Path of the compiled snapshot kept next to a mentor file"""
+    return f"{file_path}.snapshot"
+
+
+_JSON_CHUNK_SIZE = 1 << 16
+_JSON_VALUE_END_RE = re.compile(r'\s*[,\]]')
+
+
+def iter_json_records(file_path: str) -> Iterator[Dict]:
+    """
+    Yield the records of a JSON array or JSON Lines file one at a time.
+    Arrays are decoded element by element from a rolling buffer, so memory is
+    bounded by one record (plus a read chunk) rather than the whole file.
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer = f.read(_JSON_CHUNK_SIZE).lstrip()
+        if not buffer.startswith('['):
+            # JSON Lines: one record per line
+            f.seek(0)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        
+        pos = 1
+        eof = False
+        while True:
+            # Skip whitespace and the comma between elements
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    break
+                chunk = f.read(_JSON_CHUNK_SIZE)
+                eof = not chunk
+                buffer, pos = chunk, 0
+            if pos >= len(buffer):
+                raise ValueError(f"{file_path}: unterminated JSON array")
+            if buffer[pos] == ']':
+                return
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+                # A value is only complete once the delimiter after it is in the buffer
+                # (a number split across chunks, like "35." + "0", still decodes)
+                complete = eof or _JSON_VALUE_END_RE.match(buffer, end) is not None
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                # The record continues past the buffer; drop what was consumed and read more
+                chunk = f.read(_JSON_CHUNK_SIZE)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            yield record
+            pos = end
+
 
 class MentorProcessor:
     """Processes and stores mentor information"""
     
     def __init__(self):
         self.mentors = []
+        self._reset_derived()
+    
+    def _reset_derived(self) -> None:
+        """Drop values computed from self.mentors (after loading new mentors)"""
+        self._company_index = None
+        self._skill_index = None
+        self._skills = None
+        self._companies = None
+        self._company_matcher = None
     
-    def load_from_csv(self, file_path: str) -> None:
-        """Load mentors from CSV file"""
+    def load_from_csv(self, file_path: str, use_snapshot: bool = True) -> None:
+        """
+        Load mentors from CSV file, or its compiled snapshot if it is up to
+        date. A missing or stale snapshot is rebuilt from the parsed CSV, so
+        tools that change the CSV don't need to rebuild it themselves.
+        """
+        if use_snapshot:
+            loaded = self.load_from_snapshot(snapshot_path_for(file_path), file_path)
+            record_cache('mentor_snapshot', loaded)
+            if loaded:
+                return
         try:
-            df = pd.read_csv(file_path)
-            self.mentors = df.to_dict('records')
-            print(f"✓ Loaded {len(self.mentors)} mentors from {file_path}")
+            with span('mentor_load', source=file_path) as fields:
+                with open(file_path, 'r', newline='', encoding='utf-8') as f:
+                    self.mentors = [MentorRecord.from_dict(row) for row in csv.DictReader(f)]
+                self._reset_derived()
+                fields['mentors'] = len(self.mentors)
         except Exception as e:
-            print(f"Error loading mentors: {e}")
+            log_event('mentor_load_failed', logging.ERROR, source=file_path, error=str(e))
             raise
+        if use_snapshot:
+            try:
+                self.save_snapshot(snapshot_path_for(file_path), source_path=file_path)
+            except OSError as e:
+                # e.g. a read-only deployment: loading from the CSV still works
+                log_event('mentor_snapshot_not_saved', logging.WARNING, source=file_path, error=str(e))
     
     def load_from_json(self, file_path: str) -> None:
-        """Load mentors from JSON file"""
+        """Load mentors from a JSON array or JSON Lines file, one record at a time"""
         try:
-            with open(file_path, 'r') as f:
-                self.mentors = json.load(f)
-            print(f"✓ Loaded {len(self.mentors)} mentors from {file_path}")
+            with span('mentor_load', source=file_path) as fields:
+                self.mentors = [MentorRecord.from_dict(row) for row in iter_json_records(file_path)]
+                self._reset_derived()
+                fields['mentors'] = len(self.mentors)
         except Exception as e:
-            print(f"Error loading mentors: {e}")
+            log_event('mentor_load_failed', logging.ERROR, source=file_path, error=str(e))
             raise
     
+    def load(self, file_path: str) -> None:
+        """Load mentors from a CSV, JSON or JSON Lines file, by extension"""
+        if file_path.endswith('.csv'):
+            self.load_from_csv(file_path)
+        elif file_path.endswith(('.json', '.jsonl')):
+            self.load_from_json(file_path)
+        else:
+            raise ValueError("Mentor file must be CSV, JSON or JSON Lines")
+    
+    @staticmethod
+    def _source_signature(source_path: str) -> Dict:
+        """Size and content hash of a mentor file (stable across copies and git checkouts)"""
+        import hashlib
+        
+        digest = hashlib.sha256()
+        with open(source_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return {'size': os.path.getsize(source_path), 'sha256': digest.hexdigest()}
+    
+    def save_snapshot(self, snapshot_path: str, source_path: str = None) -> None:
+        """
+        Write a compiled snapshot of the loaded mentors: compact mentor
+        records and the prebuilt skill, company and company-index
+        structures, so a later load skips parsing entirely.
+        """
+        import pickle
+        
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'source': self._source_signature(source_path) if source_path else None,
+            'mentors': self.mentors,
+            'skills': self.get_mentor_skills(),
+            'companies': self.get_mentor_companies(),
+            'company_index': self.get_company_index(),
+        }
+        # Write to a temp file and rename so readers never see a partial snapshot
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+        log_event('mentor_snapshot_saved', path=snapshot_path, mentors=len(self.mentors))
+    
+    def load_from_snapshot(self, snapshot_path: str, source_path: str = None) -> bool:
+        """
+        Load mentors from a compiled snapshot. Returns False (leaving the
+        processor unchanged) if the snapshot is missing, from another version,
+        or older than source_path.
+        """
+        import mmap
+        import pickle
+        
+        if not os.path.exists(snapshot_path):
+            return False
+        try:
+            # Unpickle straight from the mapped file instead of reading it into a buffer first
+            with open(snapshot_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                snapshot = pickle.loads(mapped)
+            if snapshot.get('version') != SNAPSHOT_VERSION:
+                return False
+            if source_path:
+                source = snapshot.get('source') or {}
+                # Compare sizes first so a changed file is usually rejected without hashing it
+                if source.get('size') != os.path.getsize(source_path) or \
+                        source != self._source_signature(source_path):
+                    return False
+        except Exception as e:
+            log_event('mentor_snapshot_ignored', logging.WARNING, path=snapshot_path, error=str(e))
+            return False
+        
+        self.mentors = snapshot['mentors']
+        self._skills = snapshot['skills']
+        self._companies = snapshot['companies']
+        self._company_index = snapshot['company_index']
+        self._company_matcher = None
+        self._skill_index = None
+        log_event('mentor_load', source=snapshot_path, mentors=len(self.mentors))
+        return True
+    
     def get_mentor_skills(self) -> List[str]:
         """Extract unique skills from all mentors"""
+        if self._skills is not None:
+            return list(self._skills)
         skills = set()
         for mentor in self.mentors:
-            # Try different possible column names for skills
-            skill_fields = ['skills', 'expertise', 'specialties', 'areas', 'competencies', 
-                          'areas_of_expertise']
-            for field in skill_fields:
-                if field in mentor and mentor[field]:
-                    if isinstance(mentor[field], str):
-                        # Handle comma-separated values
-                        skills.update([s.strip() for s in mentor[field].split(',') if s.strip()])
-                    elif isinstance(mentor[field], list):
-                        skills.update([str(s).strip() for s in mentor[field] if s])
-        return list(skills)
+            skills.update(mentor_skill_labels(mentor))
+        self._skills = list(skills)
+        return list(self._skills)
+    
+    def get_company_index(self) -> MentorCompanyIndex:
+        """Company lookup index over the loaded mentors (built on first use)"""
+        if self._company_index is None:
+            self._company_index = MentorCompanyIndex(self.mentors)
+        return self._company_index
+    
+    def get_skill_index(self) -> MentorSkillIndex:
+        """Expertise bitsets over the loaded mentors, for ranking mentors per job (built on first use)"""
+        if self._skill_index is None:
+            self._skill_index = MentorSkillIndex(self.mentors)
+        return self._skill_index
+    
+    def get_company_matcher(self) -> 'CompanyMatcher':
+        """Matcher over all mentor companies, for scoring jobs (built on first use)"""
+        if self._company_matcher is None:
+            self._company_matcher = CompanyMatcher(self.get_mentor_companies())
+        return self._company_matcher
     
     def get_mentor_companies(self) -> List[str]:
         """Extract unique companies from mentors"""
+        if self._companies is not None:
+            return list(self._companies)
         companies = set()
         for mentor in self.mentors:
             company_fields = ['company', 'organization', 'employer', 'current_company']
             for field in company_fields:
                 if field in mentor and mentor[field]:
                     companies.add(str(mentor[field]).strip())
-        return list(companies)
+        self._companies = list(companies)
+        return list(self._companies)
+    
+    def attach_mentors(self, jobs: List[Dict], mentors_per_job: int = 3) -> None:
+        """
+        Set each job's 'mentors' (mentors at its company, in one indexed pass)
+        and 'skill_mentors' (the mentors whose expertise best overlaps it)
+        """
+        matches = self.get_company_index().lookup_many([job.get('company', '') for job in jobs])
+        experts = self.get_skill_index().top_mentors_many(jobs, mentors_per_job)
+        for job, job_experts in zip(jobs, experts):
+            job['mentors'] = matches.get(job.get('company', ''), [])
+            job['skill_mentors'] = job_experts
+
+
+def write_mentor_snapshot(csv_path: str) -> str:
+    """Compile the snapshot for a mentors CSV (run after the CSV changes)"""
+    processor = MentorProcessor()
+    processor.load_from_csv(csv_path, use_snapshot=False)
+    snapshot_path = snapshot_path_for(csv_path)
+    processor.save_snapshot(snapshot_path, source_path=csv_path)
+    return snapshot_path
+
+
+class SearchDeadline:
+    """Latency budget for one search request"""
+    
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+    
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def expired(self) -> bool:
+        return self.remaining() == 0.0
+
+
+class SearchFilters:
+    """
+    Structured job filters. Those Adzuna supports are sent as query
+    parameters so fewer jobs are fetched; the rest are applied to the
+    fetched jobs before scoring.
+    """
+    
+    def __init__(self, min_salary: float = None, max_age_days: int = None, remote_only: bool = False,
+                 radius_km: float = None, exclude_companies: List[str] = None):
+        self.min_salary = min_salary
+        self.max_age_days = max_age_days
+        self.remote_only = remote_only
+        self.radius_km = radius_km
+        self.exclude_companies = list(exclude_companies or [])
+        self._excluded = {normalize_company(c) for c in self.exclude_companies} - {''}
+    
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> 'SearchFilters':
+        """Filters from a JSON object (e.g. a request body), raising ValueError on bad values"""
+        data = data or {}
+        if not isinstance(data, dict):
+            raise ValueError("filters must be an object")
+        
+        def number(key, cast):
+            value = data.get(key)
+            if value is None or value == '':
+                return None
+            if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+                raise ValueError(f"{key} must be a number")
+            try:
+                value = cast(value)
+            except (TypeError, ValueError, OverflowError):
+                raise ValueError(f"{key} must be a number")
+            if not math.isfinite(value):
+                raise ValueError(f"{key} must be a number")
+            if value < 0:
+                raise ValueError(f"{key} must not be negative")
+            return value
+        
+        exclude = data.get('exclude_companies') or []
+        if isinstance(exclude, str):
+            exclude = exclude.split(',')
+        elif not isinstance(exclude, list) or not all(isinstance(c, str) for c in exclude):
+            raise ValueError("exclude_companies must be a string or a list of strings")
+        return cls(
+            min_salary=number('min_salary', float),
+            max_age_days=number('max_age_days', int),
+            remote_only=bool(data.get('remote_only', False)),
+            radius_km=number('radius_km', float),
+            exclude_companies=[str(c).strip() for c in exclude if str(c).strip()],
+        )
+    
+    def __bool__(self) -> bool:
+        return bool(self.min_salary or self.max_age_days is not None or self.remote_only
+                    or self.radius_km is not None or self._excluded)
+    
+    def upstream_params(self, where: str) -> Dict[str, str]:
+        """Adzuna query parameters for these filters"""
+        params = {}
+        if self.min_salary:
+            params['salary_min'] = str(int(self.min_salary))
+        if self.max_age_days is not None:
+            params['max_days_old'] = str(self.max_age_days)
+        if self.remote_only:
+            params['what_and'] = 'remote'
+        # Distance only applies around a place; US-wide results are filtered by distance locally
+        if self.radius_km is not None and where and where != 'us':
+            params['distance'] = str(int(self.radius_km))
+        return params
+    
+    def matches(self, job: Dict, now: datetime = None, center: Place = None) -> bool:
+        """Whether a fetched job passes the filters (radius needs the searched city as center)"""
+        if self.min_salary:
+            salary = job.get('salary_max') or job.get('salary_min')
+            # Like Adzuna's salary_min, jobs without a salary are left out
+            if not salary or salary < self.min_salary:
+                return False
+        if self.max_age_days is not None:
+            created = job.get('created') or ''
+            try:
+                posted = datetime.strptime(created[:19], '%Y-%m-%dT%H:%M:%S')
+            except ValueError:
+                posted = None
+            if posted and posted < (now or datetime.utcnow()) - timedelta(days=self.max_age_days):
+                return False
+        if self.remote_only:
+            text = f"{job.get('title', '')} {job.get('location', '')} {job.get('description', '')}".lower()
+            if 'remote' not in text:
+                return False
+        if self._excluded and normalize_company(job.get('company', '')) in self._excluded:
+            return False
+        if self.radius_km is not None and center is not None and center.kind == 'city':
+            place = get_gazetteer().resolve(job.get('location', ''), near=center)
+            # Jobs placed only by state or country, or somewhere unknown, are kept
+            if place is not None and place.kind == 'city' and distance_km(center, place) > self.radius_km:
+                return False
+        return True
+    
+    def apply(self, jobs: List[Dict], center: Place = None) -> List[Dict]:
+        now = datetime.utcnow()
+        return [job for job in jobs if self.matches(job, now, center)]
 
 
 class JobSearcher:
     """Searches for jobs using various APIs and methods"""
     
-    def __init__(self, api_keys: Optional[Dict[str, str]] = None):
+    # Overridable so tests and load tests can point at a local stub
+    ADZUNA_URL = os.environ.get('ADZUNA_API_URL', 'https://api.adzuna.com/v1/api/jobs/us/search/1')
+    # Longest wait for any one upstream call (connect or read)
+    REQUEST_TIMEOUT = float(os.environ.get('ADZUNA_TIMEOUT_SECONDS', 10))
+    
+    def __init__(self, api_keys: Optional[Dict[str, str]] = None, search_cache=None):
         self.api_keys = api_keys or {}
+        # Optional SearchCache (search_cache.py) shared across requests
+        self.search_cache = search_cache
         self.jobs = []
+        # Set by search_job_apis when a deadline cut the search short
+        self.partial = False
+        self.skipped_searches = 0
     
     def search_indeed(self, query: str, location: str = "", limit: int = 50) -> List[Dict]:
         """
@@ -81,7 +694,7 @@ class JobSearcher:
         """
         # TODO: Implement Indeed API integration
         # You'll need: https://ads.indeed.com/jobroll/xmlfeed
-        print(f"Searching Indeed for: {query} in {location}")
+        log_event('search_skipped', source='Indeed', query=query, location=location)
         return []
     
     def search_linkedin(self, query: str, location: str = "", limit: int = 50) -> List[Dict]:
@@ -89,57 +702,76 @@ class JobSearcher:
         Search LinkedIn jobs (Note: LinkedIn API requires authentication)
         """
         # TODO: Implement LinkedIn API integration
-        print(f"Searching LinkedIn for: {query} in {location}")
+        log_event('search_skipped', source='LinkedIn', query=query, location=location)
         return []
     
-    def search_adzuna(self, query: str, location: str = "us", limit: int = 50) -> List[Dict]:
+    def search_adzuna(self, query: str, location: str = "us", limit: int = 50,
+                      timeout: float = None, params: Dict[str, str] = None) -> List[Dict]:
         """
-        Search Adzuna jobs (Free API available)
+        Search Adzuna jobs (Free API available). timeout caps the wait in
+        seconds (default REQUEST_TIMEOUT); params are extra query parameters
+        (e.g. SearchFilters.upstream_params).
         """
         if 'adzuna_app_id' not in self.api_keys or 'adzuna_app_key' not in self.api_keys:
-            print("⚠ Adzuna API keys not configured. Skipping Adzuna search.")
+            log_event('adzuna_not_configured', logging.WARNING)
+            UPSTREAM_REQUESTS.labels('Adzuna', 'skipped').inc()
             return []
         
+        import requests  # imported on first search to keep app startup light
+        
         try:
-            url = f"https://api.adzuna.com/v1/api/jobs/us/search/1"
+            url = self.ADZUNA_URL
             params = {
                 'app_id': self.api_keys['adzuna_app_id'],
                 'app_key': self.api_keys['adzuna_app_key'],
                 'results_per_page': min(limit, 50),
                 'what': query,
                 'where': location,
-                'content-type': 'application/json'
+                'content-type': 'application/json',
+                **(params or {})
             }
-            response = requests.get(url, params=params)
+            
+            start = time.perf_counter()
+            response = requests.get(url, params=params, timeout=timeout or self.REQUEST_TIMEOUT)
+            elapsed = time.perf_counter() - start
+            UPSTREAM_SECONDS.labels('Adzuna').observe(elapsed)
             if response.status_code == 200:
                 data = response.json()
                 jobs = []
                 for job in data.get('results', []):
-                    jobs.append({
-                        'title': job.get('title', ''),
-                        'company': job.get('company', {}).get('display_name', ''),
-                        'location': job.get('location', {}).get('display_name', ''),
-                        'description': job.get('description', ''),
-                        'url': job.get('redirect_url', ''),
-                        'created': job.get('created', ''),
-                        'salary_min': job.get('salary_min'),
-                        'salary_max': job.get('salary_max'),
-                        'source': 'Adzuna'
-                    })
-                if len(jobs) > 0:
-                    print(f"✓ Found {len(jobs)} jobs from Adzuna")
+                    jobs.append(JobRecord(
+                        title=job.get('title', ''),
+                        company=job.get('company', {}).get('display_name', ''),
+                        location=job.get('location', {}).get('display_name', ''),
+                        description=job.get('description', ''),
+                        url=job.get('redirect_url', ''),
+                        created=job.get('created', ''),
+                        salary_min=job.get('salary_min'),
+                        salary_max=job.get('salary_max'),
+                        source='Adzuna'
+                    ))
+                UPSTREAM_REQUESTS.labels('Adzuna', 'success').inc()
+                JOBS.labels('fetched').inc(len(jobs))
+                log_event('adzuna_search', query=query, location=location, jobs=len(jobs),
+                          duration_ms=round(elapsed * 1000, 2))
                 return jobs
             else:
-                print(f"⚠ Adzuna API error: {response.status_code}")
+                UPSTREAM_REQUESTS.labels('Adzuna', 'http_error').inc()
+                log_event('adzuna_search_failed', logging.WARNING, query=query, location=location,
+                          status=response.status_code, duration_ms=round(elapsed * 1000, 2))
                 return []
+        except requests.Timeout:
+            UPSTREAM_REQUESTS.labels('Adzuna', 'timeout').inc()
+            log_event('adzuna_search_failed', logging.WARNING, query=query, location=location,
+                      error='timeout', timeout_seconds=round(timeout or self.REQUEST_TIMEOUT, 2))
+            return []
         except Exception as e:
-            print(f"Error searching Adzuna: {e}")
+            UPSTREAM_REQUESTS.labels('Adzuna', 'error').inc()
+            log_event('adzuna_search_failed', logging.WARNING, query=query, location=location, error=str(e))
             return []
     
-    def search_job_apis(self, skills: List[str], location: str = "", us_wide: bool = True) -> List[Dict]:
-        """Search multiple job APIs with multiple query variations"""
-        all_jobs = []
-        
+    def build_search_queries(self, skills: List[str]) -> List[str]:
+        """Search query variations for a set of skills"""
         # Create multiple search query variations for better coverage
         queries = []
         
@@ -174,26 +806,32 @@ class JobSearcher:
             if q_lower not in seen:
                 seen.add(q_lower)
                 unique_queries.append(q)
-        
-        print(f"   Using {len(unique_queries)} search query variations")
-        
-        # Search local area with all query variations
+        return unique_queries
+    
+    def plan_searches(self, skills: List[str], location: str = "", us_wide: bool = True) -> List[tuple]:
+        """
+        The (query, location, limit) upstream searches needed for a set of
+        skills. Known locations are canonicalized ("SF, CA" and "San
+        Francisco CA" both become "San Francisco, CA") so equivalent searches
+        share upstream calls and cache entries.
+        """
+        unique_queries = self.build_search_queries(skills)
+        searches = []
+        place = get_gazetteer().resolve(location) if location else None
+        if place is not None:
+            # A country-wide "location" is the US-wide search
+            location = place.display if place.kind != 'country' else ''
+            us_wide = us_wide or place.kind == 'country'
         if location:
-            print(f"\n🔍 Searching jobs in: {location}")
-            for i, query in enumerate(unique_queries[:5], 1):  # Reduced to 5 for local to prioritize local results
-                print(f"   Query {i}/{min(len(unique_queries), 5)}: '{query}'")
-                jobs = self.search_adzuna(query, location, limit=30)
-                all_jobs.extend(jobs)
-        
-        # Search US-wide with all query variations (only if us_wide is True)
+            # Reduced to 5 for local to prioritize local results
+            searches.extend((query, location, 30) for query in unique_queries[:5])
         if us_wide:
-            print(f"\n🔍 Searching jobs US-wide")
-            for i, query in enumerate(unique_queries[:5], 1):  # Reduced to 5 queries
-                print(f"   Query {i}/{min(len(unique_queries), 5)}: '{query}'")
-                jobs = self.search_adzuna(query, "us", limit=40)  # Reduced limit
-                all_jobs.extend(jobs)
-        
-        # Remove duplicates based on title + company + URL
+            searches.extend((query, "us", 40) for query in unique_queries[:5])
+        return searches
+    
+    @staticmethod
+    def dedupe_jobs(all_jobs: List[Dict]) -> List[Dict]:
+        """Remove duplicates based on title + company + URL"""
         seen = set()
         unique_jobs = []
         for job in all_jobs:
@@ -211,8 +849,82 @@ class JobSearcher:
             if key not in seen and title:  # Only add if we have a title
                 seen.add(key)
                 unique_jobs.append(job)
+        return unique_jobs
+    
+    @staticmethod
+    def filter_jobs(jobs: List[Dict], filters: SearchFilters, location: str = "") -> List[Dict]:
+        """Jobs passing the filters (the radius is measured from location)"""
+        center = get_gazetteer().resolve(location) if filters.radius_km is not None and location else None
+        with span('filter', jobs=len(jobs)) as fields:
+            kept = filters.apply(jobs, center)
+            fields['kept'] = len(kept)
+        JOBS.labels('filtered').inc(len(kept))
+        return kept
+    
+    def search_job_apis(self, skills: List[str], location: str = "", us_wide: bool = True,
+                        deadline: SearchDeadline = None, filters: SearchFilters = None) -> List[Dict]:
+        """
+        Search multiple job APIs with multiple query variations. With a
+        deadline, no new query starts once it has passed and each call waits
+        at most the time left; the jobs found so far (plus stale cached
+        results for queries skipped or cut short) are returned and
+        self.partial is set.
+        Filters are sent upstream where supported and applied after dedup.
+        """
+        all_jobs = []
+        self.partial = False
+        self.skipped_searches = 0
+        not_started = 0
+        
+        # Search local area first, then US-wide (only if us_wide is True)
+        searches = self.plan_searches(skills, location, us_wide)
+        cache = self.search_cache
+        with span('job_search', queries=len(searches)) as fields:
+            for query, where, limit in searches:
+                params = filters.upstream_params(where) if filters else {}
+                key = cache.key(query, where, limit, params) if cache else None
+                if cache:
+                    cache.record_query(key)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        all_jobs.extend(cached)
+                        continue
+                timeout = None
+                if deadline is not None:
+                    if deadline.expired():
+                        self.partial = True
+                        self.skipped_searches += 1
+                        not_started += 1
+                        all_jobs.extend((cache.get(key, allow_stale=True) if cache else None) or [])
+                        continue
+                    timeout = min(self.REQUEST_TIMEOUT, deadline.remaining())
+                jobs = self.search_adzuna(query, where, limit=limit, timeout=timeout, params=params)
+                if not jobs and deadline is not None and deadline.expired():
+                    # The deadline cut this call short, so it counts as skipped
+                    self.partial = True
+                    self.skipped_searches += 1
+                    all_jobs.extend((cache.get(key, allow_stale=True) if cache else None) or [])
+                    continue
+                # Empty results may be upstream errors, so they aren't cached
+                if cache and jobs:
+                    cache.put(key, jobs)
+                all_jobs.extend(jobs)
+            fields['jobs'] = len(all_jobs)
+            if self.partial:
+                fields['skipped'] = self.skipped_searches
+        if self.partial:
+            UPSTREAM_REQUESTS.labels('Adzuna', 'deadline_skipped').inc(not_started)
+            log_event('search_deadline_exceeded', logging.WARNING, budget_seconds=deadline.seconds,
+                      skipped=self.skipped_searches, planned=len(searches))
+        
+        with span('dedupe', jobs=len(all_jobs)) as fields:
+            unique_jobs = self.dedupe_jobs(all_jobs)
+            fields['unique_jobs'] = len(unique_jobs)
+        JOBS.labels('unique').inc(len(unique_jobs))
+        
+        if filters:
+            unique_jobs = self.filter_jobs(unique_jobs, filters, location)
         
-        print(f"✓ Found {len(unique_jobs)} unique jobs (from {len(all_jobs)} total results)")
         self.jobs = unique_jobs
         return unique_jobs
 
@@ -224,7 +936,8 @@ class SkillMatcher:
         self.user_skills = [s.lower() for s in user_skills]
         self.user_interests = [i.lower() for i in (user_interests or [])]
     
-    def calculate_match_score(self, job: Dict, mentor_skills: List[str], mentor_companies: List[str] = None) -> float:
+    def calculate_match_score(self, job: Dict, mentor_skills: List[str], mentor_companies: List[str] = None,
+                              company_matcher: CompanyMatcher = None) -> float:
         """Calculate how well a job matches based on skills - improved algorithm"""
         score = 0.0
         max_score = 100.0
@@ -263,20 +976,24 @@ class SkillMatcher:
             score += (interest_matches / len(self.user_interests)) * 15
         
         # 5. Mentor company match bonus (10% weight) - big boost if mentor works there
-        if mentor_companies and job_company:
-            for mentor_company in mentor_companies:
-                if normalize_skill(mentor_company) in job_company or job_company in normalize_skill(mentor_company):
-                    score += 10
-                    break  # Only count once
+        if company_matcher is None and mentor_companies:
+            company_matcher = CompanyMatcher(mentor_companies)
+        if company_matcher and job_company and company_matcher.match(job_company):
+            score += 10
         
         return min(score, max_score)
     
-    def rank_jobs(self, jobs: List[Dict], mentor_skills: List[str], mentor_companies: List[str] = None) -> List[Dict]:
+    def rank_jobs(self, jobs: List[Dict], mentor_skills: List[str], mentor_companies: List[str] = None,
+                  company_matcher: CompanyMatcher = None) -> List[Dict]:
         """Rank jobs by match score"""
-        for job in jobs:
-            job['match_score'] = self.calculate_match_score(job, mentor_skills, mentor_companies)
-        
-        return sorted(jobs, key=lambda x: x.get('match_score', 0), reverse=True)
+        with span('rank', jobs=len(jobs)):
+            if company_matcher is None:
+                company_matcher = CompanyMatcher(mentor_companies or [])
+            for job in jobs:
+                job['match_score'] = self.calculate_match_score(job, mentor_skills, company_matcher=company_matcher)
+            ranked = sorted(jobs, key=lambda x: x.get('match_score', 0), reverse=True)
+        JOBS.labels('ranked').inc(len(ranked))
+        return ranked
 
 
 class ReportGenerator:
@@ -286,6 +1003,18 @@ class ReportGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
     
+    @staticmethod
+    def _write_csv(filepath: Path, rows: List[Dict], columns: List[str]) -> None:
+        """Write rows with the given columns, in order, keeping only columns some row has"""
+        present = set()
+        for row in rows:
+            present.update(row)
+        fieldnames = [c for c in columns if c in present]
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+    
     def generate_csv_report(self, jobs: List[Dict], filename: str = None) -> str:
         """Generate CSV report of matched jobs"""
         if not filename:
@@ -294,18 +1023,32 @@ class ReportGenerator:
         
         filepath = self.output_dir / filename
         
-        df = pd.DataFrame(jobs)
-        # Select and order columns
+        rows = [to_dict(job) for job in jobs]
+        # Sort by match score
+        rows.sort(key=lambda row: row.get('match_score') or 0, reverse=True)
+        
         columns = ['title', 'company', 'location', 'match_score', 'url', 'source', 'salary_min', 'salary_max']
-        available_columns = [c for c in columns if c in df.columns]
-        df = df[available_columns]
+        self._write_csv(filepath, rows, columns)
+        log_event('report_saved', format='csv', path=str(filepath), jobs=len(rows))
+        return str(filepath)
+    
+    def generate_batch_csv_report(self, results: List[Dict], filename: str = None) -> str:
+        """Generate one CSV report of matched jobs for many candidates"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"batch_matches_{timestamp}.csv"
         
-        # Sort by match score
-        if 'match_score' in df.columns:
-            df = df.sort_values('match_score', ascending=False)
+        filepath = self.output_dir / filename
+        
+        rows = []
+        for result in results:
+            for job in result['jobs']:
+                rows.append({'candidate': result['candidate'], **to_dict(job)})
         
-        df.to_csv(filepath, index=False)
-        print(f"✓ Report saved to: {filepath}")
+        columns = ['candidate', 'title', 'company', 'location', 'match_score', 'url', 'source',
+                   'salary_min', 'salary_max']
+        self._write_csv(filepath, rows, columns)
+        log_event('report_saved', format='batch_csv', path=str(filepath), jobs=len(rows))
         return str(filepath)
     
     def generate_html_report(self, jobs: List[Dict], mentors: List[Dict], filename: str = None) -> str:
@@ -369,7 +1112,7 @@ class ReportGenerator:
         with open(filepath, 'w') as f:
             f.write(html)
         
-        print(f"✓ HTML report saved to: {filepath}")
+        log_event('report_saved', format='html', path=str(filepath), jobs=min(len(jobs), 50))
         return str(filepath)
 
 
@@ -377,70 +1120,153 @@ class JobCrossReference:
     """Main class for cross-referencing mentors with jobs"""
     
     def __init__(self, user_skills: List[str], user_interests: List[str] = None, 
-                 location: str = "", api_keys: Dict[str, str] = None):
-        self.mentor_processor = MentorProcessor()
-        self.job_searcher = JobSearcher(api_keys)
+                 location: str = "", api_keys: Dict[str, str] = None,
+                 mentor_processor: MentorProcessor = None, search_cache=None):
+        # A preloaded processor (e.g. the web app's shared one) skips loading mentors
+        self.mentor_processor = mentor_processor or MentorProcessor()
+        self.job_searcher = JobSearcher(api_keys, search_cache=search_cache)
         self.skill_matcher = SkillMatcher(user_skills, user_interests)
         self.report_generator = ReportGenerator()
         self.location = location
     
-    def process(self, mentor_file: str, us_wide: bool = True) -> Dict:
-        """Main processing function"""
-        print("=" * 60)
-        print("Job Cross-Reference Analysis")
-        print("=" * 60)
+    def process(self, mentor_file: str, us_wide: bool = True, deadline: SearchDeadline = None,
+                filters: SearchFilters = None, include_mentors: bool = False, mentors_per_job: int = 3) -> Dict:
+        """
+        Main processing function. With a deadline, upstream searching stops
+        when it passes and the jobs found so far are ranked and returned with
+        'partial' set. Filters narrow the jobs before they are scored.
+        include_mentors attaches company and skill mentors to each job.
+        """
+        start = time.perf_counter()
         
-        # Load mentors
-        if mentor_file.endswith('.csv'):
-            self.mentor_processor.load_from_csv(mentor_file)
-        elif mentor_file.endswith('.json'):
-            self.mentor_processor.load_from_json(mentor_file)
-        else:
-            raise ValueError("Mentor file must be CSV or JSON")
+        # Load mentors (unless the processor was preloaded)
+        if not self.mentor_processor.mentors:
+            self.mentor_processor.load(mentor_file)
         
         # Extract mentor skills and companies
         mentor_skills = self.mentor_processor.get_mentor_skills()
         mentor_companies = self.mentor_processor.get_mentor_companies()
-        print(f"✓ Extracted {len(mentor_skills)} unique skills from mentors")
-        print(f"✓ Found {len(mentor_companies)} unique companies")
         
         # Search for jobs using USER skills (not mentor skills)
         user_skills_for_search = self.skill_matcher.user_skills
-        print(f"✓ Searching jobs matching your skills: {', '.join(user_skills_for_search[:5])}...")
         jobs = self.job_searcher.search_job_apis(
             user_skills_for_search, 
             location=self.location, 
-            us_wide=us_wide
+            us_wide=us_wide,
+            deadline=deadline,
+            filters=filters
         )
-        print(f"✓ Found {len(jobs)} total jobs")
         
         # Match and rank jobs (pass mentor companies for better scoring)
-        ranked_jobs = self.skill_matcher.rank_jobs(jobs, mentor_skills, list(mentor_companies))
-        print(f"✓ Ranked {len(ranked_jobs)} jobs by match score")
+        ranked_jobs = self.skill_matcher.rank_jobs(
+            jobs, mentor_skills, company_matcher=self.mentor_processor.get_company_matcher()
+        )
+        if include_mentors:
+            self.mentor_processor.attach_mentors(ranked_jobs, mentors_per_job)
         
         # Generate reports
-        csv_path = self.report_generator.generate_csv_report(ranked_jobs)
-        html_path = self.report_generator.generate_html_report(
-            ranked_jobs, 
-            self.mentor_processor.mentors
-        )
+        with span('report_csv'):
+            csv_path = self.report_generator.generate_csv_report(ranked_jobs)
+        with span('report_html'):
+            html_path = self.report_generator.generate_html_report(
+                ranked_jobs, 
+                self.mentor_processor.mentors
+            )
         
         # Summary
         top_matches = [j for j in ranked_jobs if j.get('match_score', 0) >= 50]
-        print("\n" + "=" * 60)
-        print("SUMMARY")
-        print("=" * 60)
-        print(f"Total Jobs Found: {len(ranked_jobs)}")
-        print(f"High Matches (≥50%): {len(top_matches)}")
-        print(f"Reports Generated:")
-        print(f"  - CSV: {csv_path}")
-        print(f"  - HTML: {html_path}")
+        log_event('cross_reference_complete', skills=len(user_skills_for_search), jobs=len(ranked_jobs),
+                  high_matches=len(top_matches), mentors=len(self.mentor_processor.mentors),
+                  partial=self.job_searcher.partial,
+                  duration_ms=round((time.perf_counter() - start) * 1000, 2))
         
         return {
             'jobs': ranked_jobs,
             'top_matches': top_matches,
             'csv_report': csv_path,
             'html_report': html_path,
+            'partial': self.job_searcher.partial,
+            'skipped_searches': self.job_searcher.skipped_searches,
+            'mentor_stats': {
+                'total_mentors': len(self.mentor_processor.mentors),
+                'unique_skills': len(mentor_skills),
+                'unique_companies': len(mentor_companies)
+            }
+        }
+
+
+class BatchCrossReference:
+    """Cross-references many candidate profiles against one shared job pool"""
+    
+    def __init__(self, profiles: List[Dict], api_keys: Dict[str, str] = None, top_n: int = 50):
+        self.profiles = profiles
+        self.mentor_processor = MentorProcessor()
+        self.job_searcher = JobSearcher(api_keys)
+        self.report_generator = ReportGenerator()
+        self.top_n = top_n
+    
+    def process(self, mentor_file: str, us_wide: bool = True, filters: SearchFilters = None,
+                include_mentors: bool = False, mentors_per_job: int = 3) -> Dict:
+        """
+        Load mentors once, fetch each distinct search once, and rank jobs for
+        every profile the way JobCrossReference does for one: filters narrow
+        each profile's jobs (the radius around its own location) before they
+        are scored, and include_mentors attaches mentors to its top jobs.
+        """
+        start = time.perf_counter()
+        
+        self.mentor_processor.load(mentor_file)
+        mentor_skills = self.mentor_processor.get_mentor_skills()
+        mentor_companies = self.mentor_processor.get_mentor_companies()
+        company_matcher = self.mentor_processor.get_company_matcher()
+        
+        # Plan every profile's searches, then fetch the union once
+        plans = []
+        for profile in self.profiles:
+            skills = [s.lower() for s in profile.get('skills', [])]
+            plans.append(self.job_searcher.plan_searches(skills, profile.get('location', ''), us_wide))
+        distinct_searches = list(dict.fromkeys(search for plan in plans for search in plan))
+        
+        fetched = {}
+        with span('job_search', queries=len(distinct_searches),
+                  planned=sum(len(plan) for plan in plans)) as fields:
+            for query, where, limit in distinct_searches:
+                params = filters.upstream_params(where) if filters else {}
+                fetched[(query, where, limit)] = self.job_searcher.search_adzuna(query, where, limit=limit,
+                                                                                 params=params)
+            fields['jobs'] = sum(len(jobs) for jobs in fetched.values())
+        
+        # Score every profile against its slice of the shared job pool
+        results = []
+        for profile, plan in zip(self.profiles, plans):
+            skill_matcher = SkillMatcher(profile.get('skills', []), profile.get('interests', []))
+            jobs = JobSearcher.dedupe_jobs([job for search in plan for job in fetched[search]])
+            if filters:
+                jobs = JobSearcher.filter_jobs(jobs, filters, profile.get('location', ''))
+            # Copy jobs so each profile gets its own match_score
+            ranked_jobs = skill_matcher.rank_jobs([job.copy() for job in jobs], mentor_skills,
+                                                  company_matcher=company_matcher)
+            top_jobs = ranked_jobs[:self.top_n]
+            if include_mentors:
+                self.mentor_processor.attach_mentors(top_jobs, mentors_per_job)
+            results.append({
+                'candidate': profile.get('candidate') or profile.get('name', f'profile_{len(results) + 1}'),
+                'jobs': top_jobs,
+                'top_matches': [j for j in ranked_jobs if j.get('match_score', 0) >= 50],
+                'total_jobs': len(ranked_jobs)
+            })
+        
+        with span('report_csv'):
+            csv_path = self.report_generator.generate_batch_csv_report(results)
+        
+        log_event('batch_cross_reference_complete', profiles=len(results),
+                  upstream_searches=len(distinct_searches),
+                  duration_ms=round((time.perf_counter() - start) * 1000, 2))
+        
+        return {
+            'profiles': results,
+            'csv_report': csv_path,
+            'upstream_searches': len(distinct_searches),
             'mentor_stats': {
                 'total_mentors': len(self.mentor_processor.mentors),
                 'unique_skills': len(mentor_skills),
@@ -449,24 +1275,52 @@ class JobCrossReference:
         }
 
 
+def load_profiles(path: str) -> List[Dict]:
+    """Load candidate profiles from a JSON list file or a directory of profile JSON files"""
+    profile_path = Path(path)
+    if profile_path.is_dir():
+        profiles = []
+        for file_path in sorted(profile_path.glob('*.json')):
+            with open(file_path, 'r') as f:
+                profile = json.load(f)
+            if profile.get('skills'):
+                profiles.append(profile)
+        return profiles
+    with open(profile_path, 'r') as f:
+        return json.load(f)
+
+
 def main():
     """Main entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Cross-reference mentors with job opportunities')
     parser.add_argument('mentor_file', help='Path to mentor CSV or JSON file')
-    parser.add_argument('--skills', nargs='+', required=True, 
+    parser.add_argument('--skills', nargs='+',
                        help='Your current skills (space-separated)')
+    parser.add_argument('--profiles',
+                       help='Batch mode: JSON list of profiles or a directory of profile JSON files '
+                            '(e.g. from bulk_resumes.py)')
     parser.add_argument('--interests', nargs='+', default=[], 
                        help='Your interests/future skills (space-separated)')
     parser.add_argument('--location', default='', 
                        help='Your location for local job search (e.g., "San Francisco, CA")')
     parser.add_argument('--us-wide', action='store_true', default=True,
                        help='Also search US-wide jobs')
+    parser.add_argument('--min-salary', type=float, help='Only jobs paying at least this much')
+    parser.add_argument('--max-age-days', type=int, help='Only jobs posted within this many days')
+    parser.add_argument('--remote', action='store_true', help='Only remote jobs')
+    parser.add_argument('--radius-km', type=float, help='Search radius around --location in km')
+    parser.add_argument('--exclude-company', nargs='+', default=[], help='Companies to leave out')
     parser.add_argument('--adzuna-app-id', help='Adzuna API App ID')
     parser.add_argument('--adzuna-app-key', help='Adzuna API App Key')
     
     args = parser.parse_args()
+    if not args.skills and not args.profiles:
+        parser.error('either --skills or --profiles is required')
+    
+    # Progress goes to stderr as readable lines (LOG_FORMAT=json for machine-readable logs)
+    configure_logging(log_format='text')
     
     # Setup API keys - try config file first, then command line args
     api_keys = {}
@@ -478,15 +1332,31 @@ def main():
                 if 'adzuna' in config:
                     api_keys['adzuna_app_id'] = config['adzuna'].get('app_id', '')
                     api_keys['adzuna_app_key'] = config['adzuna'].get('app_key', '')
-                    print("✓ Loaded API keys from config.json")
+                    log_event('api_keys_loaded', source='config.json')
         except Exception as e:
-            print(f"⚠ Could not load config.json: {e}")
+            log_event('config_load_failed', logging.WARNING, path=str(config_path), error=str(e))
     
     # Command line args override config file
     if args.adzuna_app_id and args.adzuna_app_key:
         api_keys['adzuna_app_id'] = args.adzuna_app_id
         api_keys['adzuna_app_key'] = args.adzuna_app_key
-        print("✓ Using API keys from command line arguments")
+        log_event('api_keys_loaded', source='command_line')
+    
+    filters = SearchFilters(min_salary=args.min_salary, max_age_days=args.max_age_days,
+                            remote_only=args.remote, radius_km=args.radius_km,
+                            exclude_companies=args.exclude_company)
+    
+    if args.profiles:
+        batch = BatchCrossReference(load_profiles(args.profiles), api_keys=api_keys if api_keys else None)
+        result = batch.process(args.mentor_file, us_wide=args.us_wide, filters=filters)
+        
+        print("\n" + "=" * 60)
+        print("SUMMARY")
+        print("=" * 60)
+        print(f"Profiles: {len(result['profiles'])}")
+        print(f"Upstream searches: {result['upstream_searches']}")
+        print(f"Report: {result['csv_report']}")
+        return
     
     # Create and run cross-reference
     cross_ref = JobCrossReference(
@@ -495,8 +1365,16 @@ def main():
         location=args.location,
         api_keys=api_keys if api_keys else None
     )
+    result = cross_ref.process(args.mentor_file, us_wide=args.us_wide, filters=filters)
     
-    cross_ref.process(args.mentor_file, us_wide=args.us_wide)
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"Total Jobs Found: {len(result['jobs'])}")
+    print(f"High Matches (≥50%): {len(result['top_matches'])}")
+    print(f"Reports Generated:")
+    print(f"  - CSV: {result['csv_report']}")
+    print(f"  - HTML: {result['html_report']}")
 
 
 if __name__ == "__main__":
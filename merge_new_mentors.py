@@ -1,105 +1,415 @@
 #!/usr/bin/env python3
 """
 Quick script to merge new mentor batches with existing database
-Usage: python merge_new_mentors.py <new_mentor_file.txt>
+Usage: python merge_new_mentors.py <new_mentor_file.txt|.pdf>
+
+New mentors are appended to mentors.csv. A persistent dedup index
+(mentors.csv.idx.db) maps each name|company key to its row, so merging a
+batch only touches the batch, not the whole database. Mentors that are not
+exact duplicates are also fuzzy-matched against existing mentors sharing a
+blocking key (surname, company word or LinkedIn URL), and the decisions are
+written to output/merge_report_<timestamp>.csv. The compiled mentor
+snapshot (mentors.csv.snapshot) goes stale with the CSV and is rebuilt by
+the next load, so a merge never re-reads the whole database.
 """
 
+import csv
+import os
+import re
+import sqlite3
 import sys
-import pandas as pd
-from parse_mentor_lookbook import parse_mentor_lookbook, save_to_csv
+import tempfile
+from datetime import datetime
+from difflib import SequenceMatcher
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
-def merge_mentors(new_file_path: str):
-    """Parse new mentors and merge with existing, showing what's new"""
-    
-    # Load existing mentors
-    existing_file = 'mentors.csv'
-    if Path(existing_file).exists():
-        df_existing = pd.read_csv(existing_file)
-        print(f"📊 Current mentors in database: {len(df_existing)}")
-    else:
-        df_existing = pd.DataFrame()
-        print("📊 No existing mentors file found, starting fresh")
-    
-    # Parse new mentors
-    print(f"\n🔍 Parsing new mentors from: {new_file_path}")
-    with open(new_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    new_mentors = parse_mentor_lookbook(content)
-    print(f"✓ Found {len(new_mentors)} mentors in new file")
-    
-    # Convert to DataFrame
-    df_new = pd.DataFrame(new_mentors)
-    
-    if len(df_existing) == 0:
-        # No existing data, just save new
-        save_to_csv(new_mentors, existing_file)
-        print(f"\n✅ Saved {len(new_mentors)} mentors to {existing_file}")
-        return
-    
-    # Create deduplication key
-    df_existing['dedup_key'] = (
-        df_existing['name'].str.lower().str.strip().fillna('') + '|' + 
-        df_existing['company'].str.lower().str.strip().fillna('')
-    )
-    df_new['dedup_key'] = (
-        df_new['name'].str.lower().str.strip().fillna('') + '|' + 
-        df_new['company'].str.lower().str.strip().fillna('')
+from job_cross_reference import normalize_company
+from parse_mentor_lookbook import CSV_COLUMNS, iter_mentor_lookbook, read_lookbook_lines
+
+
+def dedup_key(mentor: Dict) -> str:
+    """name|company key used to detect mentors already in the database"""
+    name = str(mentor.get('name') or '').lower().strip()
+    company = str(mentor.get('company') or '').lower().strip()
+    return f"{name}|{company}"
+
+
+_NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'phd', 'md', 'mba'}
+_COMPANY_STOPWORDS = {'the', 'and', 'of', 'for', 'group', 'inc', 'llc', 'ltd', 'co', 'corp', 'company'}
+# Company-word blocks larger than this are too common to be useful (e.g. "ventures")
+MAX_BLOCK_SIZE = 200
+
+
+def _name_tokens(name: str) -> List[str]:
+    """Lowercase name words without punctuation or suffixes like Jr./PhD"""
+    words = re.sub(r'[^\w\s]', ' ', str(name or '').lower()).split()
+    return [w for w in words if w not in _NAME_SUFFIXES]
+
+
+def normalize_linkedin(url: str) -> str:
+    """LinkedIn profile URL reduced to its path (e.g. 'in/janedoe')"""
+    url = str(url or '').strip().lower()
+    url = re.sub(r'^https?://', '', url)
+    url = re.sub(r'^([a-z]{2,3}\.)?(www\.)?linkedin\.com/', '', url)
+    return url.split('?')[0].strip('/')
+
+
+def blocking_keys(mentor: Dict) -> List[str]:
+    """Keys that put possibly-duplicate mentors in the same block"""
+    keys = []
+    tokens = _name_tokens(mentor.get('name'))
+    if tokens:
+        keys.append(f"s:{tokens[-1]}")
+    for word in set(normalize_company(mentor.get('company') or '').split()):
+        if len(word) > 2 and word not in _COMPANY_STOPWORDS:
+            keys.append(f"c:{word}")
+    linkedin = normalize_linkedin(mentor.get('linkedin'))
+    if linkedin:
+        keys.append(f"l:{linkedin}")
+    return keys
+
+
+def _similar(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def names_match(a: str, b: str) -> bool:
+    """Same surname and compatible first names ("Zach" / "Zachary", "Z." / "Zachary")"""
+    tokens_a, tokens_b = _name_tokens(a), _name_tokens(b)
+    if not tokens_a or not tokens_b:
+        return False
+    if tokens_a[-1] != tokens_b[-1] and _similar(tokens_a[-1], tokens_b[-1]) < 0.9:
+        return False
+    if len(tokens_a) == 1 or len(tokens_b) == 1:
+        return True
+    first_a, first_b = tokens_a[0], tokens_b[0]
+    shorter, longer = sorted((first_a, first_b), key=len)
+    return (
+        first_a == first_b
+        or (len(shorter) == 1 and longer.startswith(shorter))
+        or (len(shorter) >= 3 and longer.startswith(shorter))
+        or _similar(first_a, first_b) >= 0.8
     )
+
+
+def companies_match(a: str, b: str) -> bool:
+    """Same company after normalization, containment or mostly shared words"""
+    norm_a, norm_b = normalize_company(a or ''), normalize_company(b or '')
+    if not norm_a or not norm_b:
+        return False
+    if norm_a == norm_b:
+        return True
+    if min(len(norm_a), len(norm_b)) > 3 and (norm_a in norm_b or norm_b in norm_a):
+        return True
+    words_a, words_b = set(norm_a.split()), set(norm_b.split())
+    if len(words_a & words_b) / len(words_a | words_b) >= 0.5:
+        return True
+    return _similar(norm_a, norm_b) >= 0.85
+
+
+def match_reason(mentor: Dict, candidate: Dict) -> Optional[str]:
+    """Why two mentor records are the same person, or None if they aren't"""
+    linkedin = normalize_linkedin(mentor.get('linkedin'))
+    if linkedin and linkedin == normalize_linkedin(candidate.get('linkedin')):
+        return 'linkedin'
+    if names_match(mentor.get('name'), candidate.get('name')) and \
+            companies_match(mentor.get('company'), candidate.get('company')):
+        return 'name+company'
+    return None
+
+
+class MentorDedupIndex:
+    """
+    Persistent name|company -> row index for a mentors CSV file.
+    The index records the CSV size and modification time it was built for;
+    if the CSV was changed by anything else (even keeping its size), the
+    index is rebuilt from the CSV on open. Rows are
+    also indexed by blocking key for fuzzy duplicate detection.
+    """
     
-    # Find new mentors (not in existing)
-    existing_keys = set(df_existing['dedup_key'].values)
-    new_keys = set(df_new['dedup_key'].values)
-    truly_new_keys = new_keys - existing_keys
-    
-    print(f"\n📈 Analysis:")
-    print(f"  - Existing mentors: {len(df_existing)}")
-    print(f"  - New mentors found: {len(df_new)}")
-    print(f"  - Already in database: {len(new_keys) - len(truly_new_keys)}")
-    print(f"  - NEW mentors to add: {len(truly_new_keys)}")
-    
-    if len(truly_new_keys) == 0:
-        print("\n✅ No new mentors found - all are already in the database!")
-        return
-    
-    # Get the new mentor records
-    df_truly_new = df_new[df_new['dedup_key'].isin(truly_new_keys)].copy()
-    df_truly_new = df_truly_new.drop('dedup_key', axis=1)
-    
-    # Show new mentor names
-    print(f"\n🆕 New mentors being added:")
-    for idx, row in df_truly_new.iterrows():
-        name = row.get('name', 'N/A')
-        company = row.get('company', 'N/A')
-        print(f"  - {name} | {company}")
-    
-    # Merge
-    df_existing_clean = df_existing.drop('dedup_key', axis=1)
-    df_combined = pd.concat([df_existing_clean, df_truly_new], ignore_index=True)
-    
-    # Save
-    df_combined.to_csv(existing_file, index=False)
-    
-    print(f"\n✅ Updated {existing_file}")
-    print(f"   Total mentors now: {len(df_combined)}")
-    
-    # Summary stats
-    companies = df_combined['company'].dropna().unique()
-    print(f"   Unique companies: {len(companies)}")
-    
-    if 'areas_of_expertise' in df_combined.columns:
-        all_expertise = set()
-        for expertise in df_combined['areas_of_expertise'].dropna():
-            if isinstance(expertise, str):
-                all_expertise.update([e.strip() for e in expertise.split(',') if e.strip()])
-        print(f"   Unique expertise areas: {len(all_expertise)}")
+    SCHEMA_VERSION = '2'
+
+    def __init__(self, csv_path: str):
+        self.csv_path = Path(csv_path)
+        self.db_path = f"{csv_path}.idx.db"
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)')
+        if self._meta('schema') != self.SCHEMA_VERSION:
+            # Index written by an older version of this script: start over
+            self.conn.executescript('DROP TABLE IF EXISTS mentor_keys; DROP TABLE IF EXISTS blocks; DELETE FROM meta;')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS mentor_keys '
+                          '(key TEXT PRIMARY KEY, row INTEGER, name TEXT, company TEXT, linkedin TEXT)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS blocks (block TEXT, row INTEGER)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS blocks_by_key ON blocks (block)')
+        self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('schema', ?)", (self.SCHEMA_VERSION,))
+        self.conn.commit()
+
+        if self._meta('csv_signature') != self._csv_signature():
+            self.rebuild()
+
+    def _csv_signature(self) -> str:
+        """Size and modification time (ns) of the CSV, as 'size:mtime'"""
+        if not self.csv_path.exists():
+            return '0:0'
+        stat = self.csv_path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _meta(self, name: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _insert(self, mentors: Iterable[Dict], first_row: int) -> int:
+        """Add mentors (CSV rows first_row, first_row + 1, ...) to the key and block tables"""
+        count = 0
+        for row, mentor in enumerate(mentors, first_row):
+            self.conn.execute(
+                'INSERT OR IGNORE INTO mentor_keys (key, row, name, company, linkedin) VALUES (?, ?, ?, ?, ?)',
+                (dedup_key(mentor), row, str(mentor.get('name') or ''), str(mentor.get('company') or ''),
+                 str(mentor.get('linkedin') or ''))
+            )
+            self.conn.executemany('INSERT INTO blocks (block, row) VALUES (?, ?)',
+                                  [(key, row) for key in blocking_keys(mentor)])
+            count += 1
+        return count
+
+    def rebuild(self) -> None:
+        """Re-index every row of the CSV (only needed when the index is missing or stale)"""
+        with self.conn:
+            self.conn.execute('DELETE FROM mentor_keys')
+            self.conn.execute('DELETE FROM blocks')
+            rows = 0
+            if self.csv_path.exists():
+                with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+                    rows = self._insert(csv.DictReader(f), 0)
+            self._set_meta(rows)
+        print(f"✓ Indexed {rows} mentors from {self.csv_path}")
+
+    def _set_meta(self, row_count: int) -> None:
+        self.conn.executemany("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                              [('csv_signature', self._csv_signature()), ('csv_rows', str(row_count))])
+
+    @property
+    def row_count(self) -> int:
+        """Number of data rows in the CSV"""
+        return int(self._meta('csv_rows') or 0)
+
+    def __contains__(self, key: str) -> bool:
+        return self.conn.execute('SELECT 1 FROM mentor_keys WHERE key = ?', (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM mentor_keys').fetchone()[0]
+
+    def unique_companies(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(DISTINCT LOWER(TRIM(company))) FROM mentor_keys WHERE company != ''"
+        ).fetchone()[0]
+
+    def candidates(self, mentor: Dict) -> List[Dict]:
+        """Indexed mentors sharing a (not too common) blocking key with this mentor"""
+        rows = set()
+        for key in blocking_keys(mentor):
+            block = [r for (r,) in self.conn.execute(
+                'SELECT row FROM blocks WHERE block = ? LIMIT ?', (key, MAX_BLOCK_SIZE + 1))]
+            if len(block) <= MAX_BLOCK_SIZE:
+                rows.update(block)
+        if not rows:
+            return []
+        placeholders = ','.join('?' * len(rows))
+        return [
+            {'row': row, 'name': name, 'company': company, 'linkedin': linkedin}
+            for row, name, company, linkedin in self.conn.execute(
+                f'SELECT row, name, company, linkedin FROM mentor_keys WHERE row IN ({placeholders})', sorted(rows))
+        ]
+
+    def record(self, mentors: List[Dict]) -> None:
+        """Index mentors just appended to the end of the CSV"""
+        first_row = self.row_count
+        with self.conn:
+            self._insert(mentors, first_row)
+            self._set_meta(first_row + len(mentors))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _read_header(csv_path: Path) -> List[str]:
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def append_mentors(csv_path: Path, mentors: List[Dict]) -> None:
+    """Append mentor rows to an existing CSV, flushed to disk before returning"""
+    fieldnames = _read_header(csv_path)
+    with open(csv_path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        needs_newline = f.read(1) not in (b'\n', b'\r')
+
+    with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+        if needs_newline:
+            f.write('\n')
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore', lineterminator='\n')
+        writer.writerows(mentors)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def compact_mentors(csv_path: Path, extra_mentors: Iterable[Dict] = (), fieldnames: List[str] = None) -> int:
+    """
+    Rewrite the CSV (dropping rows with duplicate keys and adding extra_mentors)
+    to a temporary file and atomically replace the original. Returns the row count.
+    """
+    if fieldnames is None:
+        fieldnames = _read_header(csv_path) if csv_path.exists() else list(CSV_COLUMNS)
+
+    seen = set()
+    rows = 0
+    fd, tmp_path = tempfile.mkstemp(dir=str(csv_path.parent), suffix='.csv.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+
+            def write_unique(mentors):
+                nonlocal rows
+                for mentor in mentors:
+                    key = dedup_key(mentor)
+                    if key not in seen:
+                        seen.add(key)
+                        writer.writerow(mentor)
+                        rows += 1
+
+            if csv_path.exists():
+                with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                    write_unique(csv.DictReader(f))
+            write_unique(extra_mentors)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return rows
+
+
+def write_merge_report(decisions: List[Dict], output_dir: str = 'output') -> str:
+    """Write the fuzzy-match decisions of a merge to a CSV report"""
+    Path(output_dir).mkdir(exist_ok=True)
+    filepath = Path(output_dir) / f"merge_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    fieldnames = ['name', 'company', 'matched_name', 'matched_company', 'matched_row', 'reason']
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(decisions)
+    print(f"✓ Merge report saved to: {filepath}")
+    return str(filepath)
+
+
+def merge_mentors(new_file_path: str, existing_file: str = 'mentors.csv', fuzzy: bool = True):
+    """Parse new mentors and merge with existing, showing what's new"""
+    csv_path = Path(existing_file)
+    index = MentorDedupIndex(existing_file)
+    try:
+        if csv_path.exists():
+            print(f"📊 Current mentors in database: {index.row_count}")
+        else:
+            print("📊 No existing mentors file found, starting fresh")
+
+        # Parse new mentors, keeping only keys not already in the index or the batch
+        print(f"\n🔍 Parsing new mentors from: {new_file_path}")
+        found = 0
+        batch_keys = set()
+        batch_blocks = {}  # blocking key -> mentors accepted from this batch
+        truly_new = []
+        fuzzy_matches = []
+        for mentor in iter_mentor_lookbook(read_lookbook_lines(new_file_path)):
+            found += 1
+            key = dedup_key(mentor)
+            if key in batch_keys or key in index:
+                continue
+
+            if fuzzy:
+                # Record linkage: compare only against mentors sharing a blocking key
+                keys = blocking_keys(mentor)
+                candidates = index.candidates(mentor)
+                candidates += [m for k in keys for m in batch_blocks.get(k, [])]
+                match = None
+                for candidate in candidates:
+                    reason = match_reason(mentor, candidate)
+                    if reason:
+                        match = (candidate, reason)
+                        break
+                if match:
+                    candidate, reason = match
+                    fuzzy_matches.append({
+                        'name': mentor.get('name', ''),
+                        'company': mentor.get('company', ''),
+                        'matched_name': candidate.get('name', ''),
+                        'matched_company': candidate.get('company', ''),
+                        'matched_row': candidate.get('row', ''),
+                        'reason': reason
+                    })
+                    continue
+                for k in keys:
+                    batch_blocks.setdefault(k, []).append(mentor)
+
+            batch_keys.add(key)
+            truly_new.append(mentor)
+        print(f"✓ Found {found} mentors in new file")
+
+        print(f"\n📈 Analysis:")
+        print(f"  - Existing mentors: {index.row_count}")
+        print(f"  - New mentors found: {found}")
+        print(f"  - Already in database: {found - len(truly_new) - len(fuzzy_matches)}")
+        if fuzzy:
+            print(f"  - Fuzzy duplicates skipped: {len(fuzzy_matches)}")
+        print(f"  - NEW mentors to add: {len(truly_new)}")
+
+        if fuzzy_matches:
+            print(f"\n🔗 Matched to existing mentors:")
+            for match in fuzzy_matches:
+                print(f"  - {match['name']} | {match['company']}  →  "
+                      f"{match['matched_name']} | {match['matched_company']} ({match['reason']})")
+            write_merge_report(fuzzy_matches)
+
+        if not truly_new:
+            print("\n✅ No new mentors found - all are already in the database!")
+            return
+
+        # Show new mentor names
+        print(f"\n🆕 New mentors being added:")
+        for mentor in truly_new:
+            print(f"  - {mentor.get('name', 'N/A')} | {mentor.get('company', 'N/A')}")
+
+        header = _read_header(csv_path) if csv_path.exists() else []
+        new_columns = [c for c in CSV_COLUMNS if any(c in m for m in truly_new) and c not in header]
+        if header and not new_columns:
+            # Fast path: append just the batch
+            append_mentors(csv_path, truly_new)
+            index.record(truly_new)
+        else:
+            # New file, or the batch brings columns the CSV lacks: rewrite atomically
+            compact_mentors(csv_path, truly_new, fieldnames=(header + new_columns) if header else None)
+            index.rebuild()
+
+        print(f"\n✅ Updated {existing_file}")
+        print(f"   Total mentors now: {index.row_count}")
+        print(f"   Unique companies: {index.unique_companies()}")
+    finally:
+        index.close()
+
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python merge_new_mentors.py <new_mentor_file.txt>")
+    args = [a for a in sys.argv[1:] if a != '--exact-only']
+    if len(args) < 1:
+        print("Usage: python merge_new_mentors.py <new_mentor_file.txt|.pdf> [--exact-only]")
+        print("       python merge_new_mentors.py --compact   (rewrite mentors.csv without duplicates)")
         sys.exit(1)
-    
-    merge_mentors(sys.argv[1])
-
 
+    if args[0] == '--compact':
+        rows = compact_mentors(Path('mentors.csv'))
+        MentorDedupIndex('mentors.csv').rebuild()
+        print(f"✅ Compacted mentors.csv to {rows} mentors")
+    else:
+        merge_mentors(args[0], fuzzy='--exact-only' not in sys.argv)
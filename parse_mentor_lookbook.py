@@ -7,98 +7,161 @@ Converts the formatted text lookbook into structured CSV/JSON format
 import re
 import csv
 import json
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List
 
 
-def parse_mentor_lookbook(text_content: str) -> List[Dict]:
-    """Parse the mentor lookbook text into structured data"""
-    mentors = []
+FIELD_LABELS = ('Full Name', 'Title', 'Company', 'City', 'State', 'Country',
+                'Areas of Expertise', 'Biography', 'LinkedIn', 'Website')
+
+# CSV column order (areas_of_expertise_list is JSON-only)
+CSV_COLUMNS = [
+    'name', 'full_name', 'title', 'company', 'city', 'state', 'country',
+    'areas_of_expertise', 'biography', 'linkedin', 'website'
+]
+
+# "Name | Company" header line that precedes "Full Name" in the newer lookbook format
+_HEADER_LINE_RE = re.compile(r'[A-Z][^\n|]+(?:\s*\|\s*[^\n|]+)?\s*')
+
+
+def _finish_mentor(mentor: Dict) -> Dict:
+    """Post-process the raw fields of one lookbook entry"""
+    # Process areas of expertise - split by newlines or commas
+    if 'areas_of_expertise' in mentor:
+        expertise = mentor['areas_of_expertise']
+        # Split by newlines first, then by commas
+        expertise_list = []
+        for item in expertise.split('\n'):
+            expertise_list.extend([e.strip() for e in item.split(',') if e.strip()])
+        mentor['areas_of_expertise'] = ', '.join(expertise_list)
+        mentor['areas_of_expertise_list'] = expertise_list
     
-    # Handle two formats:
-    # Format 1: Name | Company followed by Full Name (new format)
-    # Format 2: Full Name at the start (old format)
+    # Clean up name - remove company if present
+    if 'full_name' in mentor:
+        name = mentor['full_name']
+        # Remove "| Company" pattern if present
+        if '|' in name:
+            name = name.split('|')[0].strip()
+        mentor['full_name'] = name
+        mentor['name'] = name
     
-    # First, try to split by name pattern (Format 1)
-    # Pattern: Name | Company on its own line, followed by Full Name
-    name_pattern = r'\n([A-Z][^\n|]+(?:\s*\|\s*[^\n|]+)?)\s*\nFull Name\n'
-    entries_by_name = re.split(name_pattern, text_content)
+    return mentor
+
+
+def iter_mentor_lookbook(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    Parse lookbook lines incrementally, yielding each mentor as soon as its
+    entry ends. Accepts any iterable of lines (e.g. an open file), so memory
+    use stays bounded by one entry.
     
-    # If that doesn't work well, try Format 2: split by "Full Name\n"
-    if len(entries_by_name) < 2:
-        entries = re.split(r'\n(?=Full Name\n)', text_content)
-    else:
-        # Reconstruct entries - every other element is a name, then the entry
-        entries = []
-        for i in range(1, len(entries_by_name), 2):
-            if i + 1 < len(entries_by_name):
-                # Combine name with entry content
-                entries.append(entries_by_name[i] + '\nFull Name\n' + entries_by_name[i+1])
-    
-    # Fallback to original method if needed
-    if not entries or len(entries) < 2:
-        entries = re.split(r'\n(?=Full Name\n)', text_content)
-    
-    for entry in entries:
-        if not entry.strip() or 'Full Name' not in entry:
-            continue
-        
-        mentor = {}
-        lines = entry.strip().split('\n')
-        
-        current_field = None
-        current_value = []
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
-            
-            # Check if this is a field label
-            if line in ['Full Name', 'Title', 'Company', 'City', 'State', 'Country', 
-                       'Areas of Expertise', 'Biography', 'LinkedIn', 'Website']:
-                # Save previous field
-                if current_field and current_value:
-                    mentor[current_field.lower().replace(' ', '_')] = '\n'.join(current_value).strip()
-                
-                # Start new field
-                current_field = line
-                current_value = []
-            elif current_field:
-                # This is a continuation of the current field
-                current_value.append(line)
-            else:
-                # Might be a continuation from previous entry or header
-                continue
-        
-        # Save last field
-        if current_field and current_value:
+    Handles two formats:
+    Format 1: "Name | Company" line followed by "Full Name" (new format)
+    Format 2: entries starting directly at "Full Name" (old format)
+    """
+    mentor = None          # fields of the entry being parsed (None before the first entry)
+    current_field = None
+    current_value = []
+    pending = None         # last non-empty line, held back in case it is the next entry's header
+    
+    def save_field():
+        if mentor is not None and current_field and current_value:
             mentor[current_field.lower().replace(' ', '_')] = '\n'.join(current_value).strip()
+    
+    def add_line(line):
+        nonlocal current_field, current_value
+        if mentor is None:
+            # Header text before the first entry
+            return
+        # Check if this is a field label
+        if line in FIELD_LABELS:
+            # Save previous field and start a new one
+            save_field()
+            current_field, current_value = line, []
+        elif current_field:
+            # This is a continuation of the current field
+            current_value.append(line)
+    
+    for raw_line in lines:
+        line = raw_line.strip()
         
-        # Process areas of expertise - split by newlines or commas
-        if 'areas_of_expertise' in mentor:
-            expertise = mentor['areas_of_expertise']
-            # Split by newlines first, then by commas
-            expertise_list = []
-            for item in expertise.split('\n'):
-                expertise_list.extend([e.strip() for e in item.split(',') if e.strip()])
-            mentor['areas_of_expertise'] = ', '.join(expertise_list)
-            mentor['areas_of_expertise_list'] = expertise_list
+        # Skip empty lines
+        if not line:
+            continue
         
-        # Clean up name - remove company if present
-        if 'full_name' in mentor:
-            name = mentor['full_name']
-            # Remove "| Company" pattern if present
-            if '|' in name:
-                name = name.split('|')[0].strip()
-            mentor['full_name'] = name
-            mentor['name'] = name
+        if line == 'Full Name':
+            # The held-back line belongs to the previous entry unless it is this entry's header
+            if pending is not None and not _HEADER_LINE_RE.fullmatch(pending):
+                add_line(pending)
+            pending = None
+            
+            save_field()
+            if mentor:
+                yield _finish_mentor(mentor)
+            mentor = {}
+            current_field, current_value = line, []
+            continue
         
-        if mentor:  # Only add if we extracted data
-            mentors.append(mentor)
+        if pending is not None:
+            add_line(pending)
+        pending = line
+    
+    if pending is not None:
+        add_line(pending)
+    save_field()
+    if mentor:
+        yield _finish_mentor(mentor)
+
+
+# Bare page numbers ("12", "Page 12", "Page 12 of 300") printed at the top or bottom of a PDF page
+_PAGE_NUMBER_RE = re.compile(r'(?:page\s+)?\d+(?:\s+of\s+\d+)?', re.IGNORECASE)
+
+
+def _extract_pdf_pages(job) -> List[str]:
+    """Extract the text of a range of PDF pages (runs in a worker process)"""
+    import pdfplumber
     
-    return mentors
+    pdf_path, start, stop = job
+    with pdfplumber.open(pdf_path) as pdf:
+        return [pdf.pages[i].extract_text() or '' for i in range(start, stop)]
+
+
+def iter_pdf_lines(pdf_path: str, workers: int = None, pages_per_job: int = 8) -> Iterator[str]:
+    """
+    Yield the text lines of a PDF lookbook in page order. Pages are extracted
+    in a process pool; because lines are yielded as one continuous stream, an
+    entry that runs over a page break is stitched back together by the parser.
+    """
+    import pdfplumber
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+    jobs = [(pdf_path, start, min(start + pages_per_job, page_count))
+            for start in range(0, page_count, pages_per_job)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pages in executor.map(_extract_pdf_pages, jobs):
+            for text in pages:
+                lines = [line for line in text.splitlines() if line.strip()]
+                # Drop page numbers so they don't end up inside a field value
+                if lines and _PAGE_NUMBER_RE.fullmatch(lines[-1].strip()):
+                    lines.pop()
+                if lines and _PAGE_NUMBER_RE.fullmatch(lines[0].strip()):
+                    lines.pop(0)
+                yield from lines
+
+
+def read_lookbook_lines(input_file: str, workers: int = None) -> Iterator[str]:
+    """Lines of a lookbook given as a text file or a PDF"""
+    if input_file.lower().endswith('.pdf'):
+        yield from iter_pdf_lines(input_file, workers=workers)
+    else:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            yield from f
+
+
+def parse_mentor_lookbook(text_content: str) -> List[Dict]:
+    """Parse the mentor lookbook text into structured data"""
+    return list(iter_mentor_lookbook(text_content.splitlines()))
 
 
 def save_to_csv(mentors: List[Dict], filename: str = 'mentors.csv'):
@@ -113,10 +176,7 @@ def save_to_csv(mentors: List[Dict], filename: str = 'mentors.csv'):
         all_keys.update(mentor.keys())
     
     # Define column order (exclude areas_of_expertise_list from CSV)
-    column_order = [
-        'name', 'full_name', 'title', 'company', 'city', 'state', 'country',
-        'areas_of_expertise', 'biography', 'linkedin', 'website'
-    ]
+    column_order = CSV_COLUMNS
     
     # Add any other keys not in the standard order (but exclude areas_of_expertise_list)
     other_keys = sorted([k for k in all_keys if k not in column_order and k != 'areas_of_expertise_list'])
@@ -139,68 +199,107 @@ def save_to_json(mentors: List[Dict], filename: str = 'mentors.json'):
     print(f"✓ Saved {len(mentors)} mentors to {filename}")
 
 
+def write_mentors(mentors: Iterable[Dict], csv_file: str = None, json_file: str = None) -> Dict:
+    """
+    Stream mentors to CSV and/or JSON as they are parsed, without holding
+    the whole list. Returns summary counts for the run.
+    """
+    from collections import Counter
+    
+    count = 0
+    companies = set()
+    expertise_counts = Counter()
+    
+    csv_handle = open(csv_file, 'w', newline='', encoding='utf-8') if csv_file else None
+    json_handle = open(json_file, 'w', encoding='utf-8') if json_file else None
+    try:
+        # Every field a lookbook entry can produce is a known column, so the
+        # header can be written before the first mentor is seen
+        writer = csv.DictWriter(csv_handle, fieldnames=CSV_COLUMNS, extrasaction='ignore') if csv_handle else None
+        if writer:
+            writer.writeheader()
+        if json_handle:
+            json_handle.write('[')
+        
+        for mentor in mentors:
+            if writer:
+                writer.writerow(mentor)
+            if json_handle:
+                item = json.dumps(mentor, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                json_handle.write((',\n  ' if count else '\n  ') + item)
+            
+            count += 1
+            if mentor.get('company'):
+                companies.add(mentor['company'])
+            expertise_counts.update(mentor.get('areas_of_expertise_list', []))
+        
+        if json_handle:
+            json_handle.write('\n]' if count else ']')
+    finally:
+        if csv_handle:
+            csv_handle.close()
+        if json_handle:
+            json_handle.close()
+    
+    for filename in (csv_file, json_file):
+        if filename:
+            print(f"✓ Saved {count} mentors to {filename}")
+    
+    return {
+        'total_mentors': count,
+        'unique_companies': len(companies),
+        'expertise_counts': expertise_counts
+    }
+
+
 def main():
     """Main entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Parse mentor lookbook into CSV/JSON')
-    parser.add_argument('input_file', help='Path to mentor lookbook text file')
+    parser.add_argument('input_file', help='Path to mentor lookbook text or PDF file')
     parser.add_argument('--output', '-o', default='mentors.csv', 
                        help='Output filename (default: mentors.csv)')
     parser.add_argument('--format', choices=['csv', 'json', 'both'], default='csv',
                        help='Output format (default: csv)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Processes for PDF page extraction (default: number of CPUs)')
     
     args = parser.parse_args()
     
-    # Read input file
-    print(f"Reading mentor lookbook from: {args.input_file}")
-    with open(args.input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Parse mentors
-    print("Parsing mentor data...")
-    mentors = parse_mentor_lookbook(content)
-    
-    print(f"✓ Parsed {len(mentors)} mentors")
-    
-    # Save in requested format
+    csv_file = None
+    json_file = None
     if args.format in ['csv', 'both']:
         csv_file = args.output if args.output.endswith('.csv') else args.output.replace('.json', '.csv')
-        save_to_csv(mentors, csv_file)
-    
     if args.format in ['json', 'both']:
         json_file = args.output if args.output.endswith('.json') else args.output.replace('.csv', '.json')
-        save_to_json(mentors, json_file)
+    
+    # Parse and save in one streaming pass over the input file
+    print(f"Reading mentor lookbook from: {args.input_file}")
+    print("Parsing mentor data...")
+    lines = read_lookbook_lines(args.input_file, workers=args.workers)
+    stats = write_mentors(iter_mentor_lookbook(lines), csv_file=csv_file, json_file=json_file)
+    
+    print(f"✓ Parsed {stats['total_mentors']} mentors")
+    
+    # Compile the snapshot MentorProcessor loads instead of re-parsing the CSV
+    if csv_file:
+        from job_cross_reference import write_mentor_snapshot
+        write_mentor_snapshot(csv_file)
     
     # Print summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Total Mentors: {len(mentors)}")
+    print(f"Total Mentors: {stats['total_mentors']}")
+    print(f"Unique Companies: {stats['unique_companies']}")
     
-    # Count unique companies
-    companies = set()
-    for mentor in mentors:
-        if mentor.get('company'):
-            companies.add(mentor['company'])
-    print(f"Unique Companies: {len(companies)}")
-    
-    # Count unique expertise areas
-    all_expertise = set()
-    for mentor in mentors:
-        if mentor.get('areas_of_expertise_list'):
-            all_expertise.update(mentor['areas_of_expertise_list'])
-    print(f"Unique Expertise Areas: {len(all_expertise)}")
+    expertise_counts = stats['expertise_counts']
+    print(f"Unique Expertise Areas: {len(expertise_counts)}")
     print(f"\nTop Expertise Areas:")
-    from collections import Counter
-    expertise_counts = Counter()
-    for mentor in mentors:
-        if mentor.get('areas_of_expertise_list'):
-            expertise_counts.update(mentor['areas_of_expertise_list'])
     for area, count in expertise_counts.most_common(10):
         print(f"  - {area}: {count} mentors")
 
 
 if __name__ == "__main__":
     main()
-
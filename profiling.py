@@ -0,0 +1,106 @@
+"""
+Request Profiling
+Opt-in cProfile capture for individual web requests. A request is profiled
+when it carries the PROFILE_TOKEN (X-Profile-Token header or ?profile=
+query parameter) or is picked at PROFILE_SAMPLE_RATE. Each profile is saved
+under PROFILE_DIR as a .prof file (for snakeviz/pstats) plus a text summary.
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from telemetry import log_event
+
+
+PROFILE_DIR = Path(os.environ.get('PROFILE_DIR', 'output/profiles'))
+PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN', '')
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP', 50))
+
+_PROFILE_ID_RE = re.compile(r'^[\w-]+$')
+
+# cProfile hooks the interpreter, so profile one request at a time per process
+_profile_lock = threading.Lock()
+
+
+def token_matches(token: Optional[str]) -> bool:
+    """True if token is the configured PROFILE_TOKEN (never true when none is configured)"""
+    return bool(PROFILE_TOKEN) and bool(token) and hmac.compare_digest(token, PROFILE_TOKEN)
+
+
+def profile_reason(token: Optional[str]) -> Optional[str]:
+    """Why a request should be profiled ('requested' or 'sampled'), or None"""
+    if token_matches(token):
+        return 'requested'
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return 'sampled'
+    return None
+
+
+def profile_path(profile_id: str, suffix: str = '.prof') -> Optional[Path]:
+    """Path of a stored profile artifact, or None if the id is invalid or unknown"""
+    if not _PROFILE_ID_RE.match(profile_id):
+        return None
+    path = PROFILE_DIR / f"{profile_id}{suffix}"
+    return path if path.exists() else None
+
+
+def _prune(keep: int) -> None:
+    """Delete all but the newest `keep` profiles"""
+    profiles = sorted(PROFILE_DIR.glob('*.prof'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in profiles[keep:]:
+        for suffix in ('.prof', '.txt'):
+            old.with_suffix(suffix).unlink(missing_ok=True)
+
+
+@contextmanager
+def profiled(name: str, reason: str) -> Iterator[Dict]:
+    """
+    Profile the enclosed block and save it. Yields a dict that holds the
+    profile 'id' once the block finishes; the id stays None if another
+    request is already being profiled (that request runs unprofiled).
+    """
+    artifact = {'id': None}
+    if not _profile_lock.acquire(blocking=False):
+        yield artifact
+        return
+    try:
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield artifact
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            artifact['id'] = _save(profiler, name, reason, elapsed)
+    finally:
+        _profile_lock.release()
+
+
+def _save(profiler: cProfile.Profile, name: str, reason: str, elapsed: float) -> str:
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    profile_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{name}_{uuid.uuid4().hex[:8]}"
+    profiler.dump_stats(PROFILE_DIR / f"{profile_id}.prof")
+
+    summary = io.StringIO()
+    summary.write(f"{name} ({reason}), {elapsed * 1000:.1f} ms wall time\n\n")
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats('cumulative').print_stats(40)
+    (PROFILE_DIR / f"{profile_id}.txt").write_text(summary.getvalue())
+
+    _prune(PROFILE_KEEP)
+    log_event('request_profiled', endpoint=name, reason=reason, profile_id=profile_id,
+              duration_ms=round(elapsed * 1000, 2))
+    return profile_id
@@ -0,0 +1,110 @@
+"""
+Compact Records
+Slotted record types for mentors and jobs. They keep the read/write
+interface of the plain dicts they replace (get, [], in, keys) so the
+pipeline is unchanged, but store fields in __slots__ and intern repeated
+categorical strings. Convert with to_dict() at the JSON/report boundary.
+"""
+
+import sys
+from typing import Dict, Iterator, List
+
+
+_UNSET = object()
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """Base class: named fields in slots, anything else in `extra`"""
+
+    __slots__ = ('extra',)
+    FIELDS = ()
+    INTERNED = ()
+
+    def __init__(self, **fields):
+        self.extra = None
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Record':
+        """Build a record from a dict (e.g. a CSV/JSON row or an API result)"""
+        return cls(**data) if isinstance(data, dict) else data
+
+    def __getitem__(self, key: str):
+        if key in self.FIELDS:
+            value = getattr(self, key, _UNSET)
+            if value is not _UNSET:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in self.FIELDS:
+            setattr(self, key, _intern(value) if key in self.INTERNED else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        if key in self.FIELDS:
+            return getattr(self, key, _UNSET) is not _UNSET
+        return self.extra is not None and key in self.extra
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        keys = [f for f in self.FIELDS if getattr(self, f, _UNSET) is not _UNSET]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self) -> Iterator:
+        return ((key, self[key]) for key in self.keys())
+
+    def to_dict(self) -> Dict:
+        return dict(self.items())
+
+    def copy(self) -> 'Record':
+        return type(self)(**self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class MentorRecord(Record):
+    """One mentor from the lookbook/CSV"""
+
+    FIELDS = ('name', 'full_name', 'title', 'company', 'city', 'state', 'country',
+              'areas_of_expertise', 'biography', 'linkedin', 'website', 'areas_of_expertise_list')
+    INTERNED = ('title', 'company', 'city', 'state', 'country')
+    __slots__ = FIELDS
+
+    def __setitem__(self, key: str, value) -> None:
+        if key == 'areas_of_expertise_list' and isinstance(value, list):
+            # The same expertise labels repeat across every mentor
+            value = [_intern(v) for v in value]
+        super().__setitem__(key, value)
+
+
+class JobRecord(Record):
+    """One job posting from a job search API"""
+
+    FIELDS = ('title', 'company', 'location', 'description', 'url', 'created',
+              'salary_min', 'salary_max', 'source', 'match_score', 'mentors', 'skill_mentors')
+    INTERNED = ('company', 'location', 'source')
+    __slots__ = FIELDS
+
+
+def to_dict(record) -> Dict:
+    """Plain dict for a record (dicts pass through unchanged)"""
+    return record.to_dict() if isinstance(record, Record) else record
@@ -0,0 +1,160 @@
+"""
+Resume Text Extraction
+Extracts text from uploaded PDF resumes in a worker process pool, with page
+and time limits, caching results by a hash of the file contents
+"""
+
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Union
+
+from telemetry import record_cache
+
+
+def extract_pdf_text(data: bytes, max_pages: int) -> str:
+    """Extract text from the first max_pages pages of an in-memory PDF (runs in a worker)"""
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages[:max_pages]:
+            pages.append((page.extract_text() or '') + '\n')
+    return ''.join(pages)
+
+
+class ResumeExtractor:
+    """Runs PDF text extraction off the request thread and caches the results"""
+
+    def __init__(self, workers: int = 2, max_pages: int = 10, timeout: float = 15.0, cache_size: int = 256):
+        self.workers = workers
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # sha256 of file -> extracted text
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pool_users = {}  # pool -> calls still waiting on it
+
+    @classmethod
+    def from_env(cls) -> 'ResumeExtractor':
+        """Build an extractor configured from environment variables"""
+        return cls(
+            workers=int(os.environ.get('RESUME_WORKERS', 2)),
+            max_pages=int(os.environ.get('RESUME_MAX_PAGES', 10)),
+            timeout=float(os.environ.get('RESUME_TIMEOUT', 15)),
+            cache_size=int(os.environ.get('RESUME_CACHE_SIZE', 256)),
+        )
+
+    def _acquire_pool(self):
+        """The current pool, registered as in use until _release_pool"""
+        with self._lock:
+            if self._pool is None:
+                # Recycle workers periodically so a leaky PDF can't grow one forever
+                self._pool = multiprocessing.Pool(self.workers, maxtasksperchild=50)
+                self._pool_users[self._pool] = 0
+            self._pool_users[self._pool] += 1
+            return self._pool
+
+    def _release_pool(self, pool, stuck: bool = False) -> None:
+        """
+        Finish using a pool. stuck (after a timeout left a worker busy on a
+        PDF) retires it: later calls get a fresh pool, and the old one is
+        terminated once the other calls still waiting on it are done, so
+        their files aren't killed mid-extraction.
+        """
+        with self._lock:
+            if stuck and pool is self._pool:
+                self._pool = None
+            self._pool_users[pool] -= 1
+            retire = pool is not self._pool and self._pool_users[pool] == 0
+            if retire:
+                del self._pool_users[pool]
+        if retire:
+            pool.terminate()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                record_cache('resume_text', True)
+                return self._cache[key]
+        record_cache('resume_text', False)
+        return None
+
+    def _cache_put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._cache[key] = text
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def extract_text(self, data: bytes) -> str:
+        """Extract text from PDF bytes, raising TimeoutError if it takes too long"""
+        key = hashlib.sha256(data).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        pool = self._acquire_pool()
+        stuck = False
+        try:
+            text = pool.apply_async(extract_pdf_text, (data, self.max_pages)).get(timeout=self.timeout)
+        except multiprocessing.TimeoutError:
+            stuck = True
+            raise TimeoutError(f'PDF extraction took longer than {self.timeout:g}s')
+        finally:
+            self._release_pool(pool, stuck=stuck)
+
+        self._cache_put(key, text)
+        return text
+
+    def extract_texts(self, files: List[bytes], budget: float = None) -> List[Union[str, Exception]]:
+        """
+        Extract text from many PDFs in parallel. Each entry of the result is
+        the text or the exception raised for that file. budget caps the
+        seconds spent on the whole batch; files still unfinished by then
+        fail with TimeoutError.
+        """
+        results = [None] * len(files)
+        pending = {}
+        pool = self._acquire_pool()
+        timed_out = False
+        try:
+            for i, data in enumerate(files):
+                key = hashlib.sha256(data).hexdigest()
+                cached = self._cache_get(key)
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending[i] = (key, pool.apply_async(extract_pdf_text, (data, self.max_pages)))
+
+            # Files run `workers` at a time, so allow one timeout per round
+            rounds = -(-len(pending) // max(self.workers, 1))
+            seconds = self.timeout * rounds if budget is None else min(self.timeout * rounds, budget)
+            deadline = time.monotonic() + seconds
+            for i, (key, result) in pending.items():
+                try:
+                    results[i] = result.get(timeout=max(deadline - time.monotonic(), 0))
+                    self._cache_put(key, results[i])
+                except multiprocessing.TimeoutError:
+                    timed_out = True
+                    results[i] = TimeoutError(f'PDF extraction did not finish within {seconds:g}s')
+                except Exception as e:
+                    results[i] = e
+        finally:
+            self._release_pool(pool, stuck=timed_out)
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker pools"""
+        with self._lock:
+            pools = list(self._pool_users)
+            self._pool = None
+            self._pool_users = {}
+        for pool in pools:
+            pool.terminate()
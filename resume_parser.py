@@ -0,0 +1,260 @@
+"""
+Resume Parser
+Extracts skills and location from resume text. Patterns and the keyword
+dictionary are compiled once at import; the skills section is tokenized in a
+single pass and the keyword fallback is one scan over the resume.
+"""
+
+import re
+from typing import Dict, List
+
+
+# Skills section boundaries
+_SKILLS_HEADER_RE = re.compile(r'(?:technical\s+)?skills?[:\s]+', re.IGNORECASE)
+_SECTION_END_RE = re.compile(r'\n(EXPERIENCE|EDUCATION|PROJECTS|HIGHLIGHTS)', re.IGNORECASE)
+_SKILLS_SECTION_FALLBACK_RES = [
+    re.compile(r'(?:technical\s+)?skills?[:\s]+\n?(.*?)(?:\n\n|\nEXPERIENCE|\nEDUCATION|\nPROJECTS|$)',
+               re.IGNORECASE | re.DOTALL | re.MULTILINE),
+    re.compile(r'technologies?[:\s]+\n?(.*?)(?:\n\n|\nEXPERIENCE|$)',
+               re.IGNORECASE | re.DOTALL | re.MULTILINE),
+]
+
+# Separators inside the skills section: category labels act like commas
+_SKILLS_TOKEN_RE = re.compile(r'\b(?:Languages|Frameworks|Tools|Other|Technologies):\s*|[(),]', re.IGNORECASE)
+
+_LEVEL_PREFIX_RE = re.compile(r'^(basic|advanced|proficient|experienced|other)\s+', re.IGNORECASE)
+_NUMBER_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_PAREN_CONTENT_RE = re.compile(r'\(([^)]+)\)')
+
+_CATEGORY_LABELS = frozenset(['languages', 'frameworks', 'tools', 'other', 'technologies'])
+_SECTION_ABBREVIATIONS = frozenset(['ai', 'ml', 'api', 'aws', 'css', 'html', 'iot', 'js'])
+_KEYWORD_ABBREVIATIONS = frozenset(['ai', 'ml', 'api', 'aws', 'css', 'html', 'iot'])
+
+# Common skills searched across the whole resume when the skills section is thin
+SKILL_KEYWORDS = [
+    'python', 'javascript', 'java', 'react', 'node.js', 'nodejs',
+    'typescript', 'html', 'css', 'sql', 'mongodb', 'postgresql',
+    'aws', 'azure', 'docker', 'kubernetes', 'git', 'github',
+    'flask', 'django', 'express', 'vue', 'angular', 'next.js',
+    'machine learning', 'ai', 'artificial intelligence', 'ml',
+    'data science', 'data analysis', 'pandas', 'numpy',
+    'full stack', 'fullstack', 'frontend', 'backend', 'full-stack',
+    'rest api', 'graphql', 'microservices', 'agile', 'scrum',
+    'creative coding', 'music technology', 'hardware integration',
+    'raspberry pi', 'embedded systems', 'iot', 'streamlit', 'vite',
+    'tailwind css', 'shopify', 'railway'
+]
+
+
+def _compile_keyword_scanner(keywords: List[str]):
+    """
+    Compile keywords into one regex that reports every keyword occurring as a
+    whole word. The alternation sits in a lookahead so matches may overlap
+    (e.g. 'css' inside 'tailwind css'). Only one alternative is reported per
+    start position, so keywords that can be shadowed by a longer keyword
+    starting at the same place get a further scanner of their own.
+    """
+    remaining = sorted(set(keywords), key=len, reverse=True)
+    scanners = []
+    while remaining:
+        shadowed = [k for k in remaining
+                    if any(other != k and re.fullmatch(re.escape(k) + r'\b.*', other, re.DOTALL)
+                           for other in remaining)]
+        group = [k for k in remaining if k not in shadowed]
+        alternation = '|'.join(re.escape(k) for k in group)
+        scanners.append(re.compile(r'\b(?=(' + alternation + r')\b)'))
+        remaining = shadowed
+    return scanners
+
+
+_KEYWORD_SCANNERS = _compile_keyword_scanner(SKILL_KEYWORDS)
+_KEYWORD_COUNT = len(set(SKILL_KEYWORDS))
+
+
+def _split_skills_section(skills_text: str) -> List[str]:
+    """Split a skills section into items on top-level commas and category labels"""
+    # Collapse all whitespace (including newlines) to single spaces
+    skills_text = ' '.join(skills_text.split())
+
+    items = []
+    current = []
+    paren_depth = 0
+    pos = 0
+    for match in _SKILLS_TOKEN_RE.finditer(skills_text):
+        current.append(skills_text[pos:match.start()])
+        pos = match.end()
+        token = match.group()
+        if token == '(':
+            paren_depth += 1
+            current.append(token)
+        elif token == ')':
+            paren_depth -= 1
+            current.append(token)
+        elif paren_depth == 0:
+            # A comma or a category label ends the current item
+            items.append(''.join(current))
+            current = []
+        else:
+            current.append(token if token == ',' else ', ')
+    current.append(skills_text[pos:])
+    items.append(''.join(current))
+
+    return [item.strip() for item in items if item.strip()]
+
+
+def _add_section_skill(skill: str, found_skills: Dict[str, None]) -> None:
+    """Normalize one skills-section item and record the skills it names"""
+    skill = skill.strip()
+    if not skill or len(skill) < 2:
+        return
+
+    # Remove category prefixes
+    skill = _LEVEL_PREFIX_RE.sub('', skill)
+    skill = _NUMBER_PREFIX_RE.sub('', skill)
+
+    # Skip category labels
+    if skill.lower() in _CATEGORY_LABELS:
+        return
+
+    # Handle skills with parentheses - extract main skill name
+    if '(' in skill and ')' in skill:
+        # Extract main part before parentheses
+        main_skill = skill.split('(')[0].strip()
+        # Also check if there's useful info in parentheses
+        paren_content = _PAREN_CONTENT_RE.search(skill)
+        if paren_content:
+            paren_text = paren_content.group(1)
+            # For "AWS (basic)", just use "AWS"
+            if 'basic' not in paren_text.lower() and 'liquid' not in paren_text.lower():
+                # For "Hardware Integration (Raspberry Pi / FM9)", add both
+                if '/' in paren_text:
+                    for part in paren_text.split('/'):
+                        part = part.strip()
+                        if part and len(part) > 2:
+                            found_skills[part.title()] = None
+                elif len(paren_text.strip()) > 2:
+                    # Single item in parentheses might be worth adding
+                    found_skills[paren_text.strip().title()] = None
+        if not main_skill:
+            return
+        skill = main_skill
+
+    if len(skill) <= 2:
+        return
+
+    # Handle special abbreviations
+    if skill.lower() in _SECTION_ABBREVIATIONS:
+        found_skills['JavaScript' if skill.lower() == 'js' else skill.upper()] = None
+    elif '/' in skill:
+        # Handle "HTML/CSS" or "Git/GitHub"
+        for part in skill.split('/'):
+            part = part.strip()
+            if part:
+                if part.lower() in ('html', 'css'):
+                    found_skills[part.upper()] = None
+                elif part.lower() == 'git':
+                    found_skills['Git'] = None
+                elif part.lower() == 'github':
+                    found_skills['GitHub'] = None
+                else:
+                    found_skills[part.title()] = None
+    elif '-' in skill and not skill.startswith('-'):
+        found_skills[skill.title()] = None
+    else:
+        found_skills[skill.title() if skill.islower() else skill] = None
+
+
+def find_skill_keywords(text: str) -> List[str]:
+    """Return the SKILL_KEYWORDS that occur as whole words in text (case-insensitive)"""
+    text_lower = text.lower()
+    found = set()
+    for scanner in _KEYWORD_SCANNERS:
+        for match in scanner.finditer(text_lower):
+            found.add(match.group(1))
+            if len(found) == _KEYWORD_COUNT:
+                break
+    return [k for k in SKILL_KEYWORDS if k in found]
+
+
+def _find_skills_section(text: str) -> str:
+    """Locate the skills section of a resume"""
+    # Look for "TECHNICAL SKILLS" or "SKILLS" section - capture full multi-line section
+    skills_header_match = _SKILLS_HEADER_RE.search(text)
+    if skills_header_match:
+        # Find where the skills section ends (next major section)
+        start_pos = skills_header_match.end()
+        end_match = _SECTION_END_RE.search(text, start_pos)
+        if end_match:
+            return text[start_pos:end_match.start()]
+        # Fallback: take next 500 characters or until double newline
+        remaining = text[start_pos:start_pos + 500]
+        double_newline = remaining.find('\n\n')
+        if double_newline > 0:
+            return remaining[:double_newline]
+        return remaining
+
+    # Fallback to original pattern
+    for pattern in _SKILLS_SECTION_FALLBACK_RES:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def extract_skills_from_resume(text):
+    """Extract skills from resume text - improved parsing"""
+    found_skills = {}  # ordered set: skills in the order they were found
+
+    skills_text = _find_skills_section(text)
+
+    # If found skills section, parse it
+    if skills_text:
+        # Split by commas first, then handle slashes: "A, B/C, D" -> ["A", "B", "C", "D"]
+        for item in _split_skills_section(skills_text):
+            if '/' in item and '(' not in item:  # Don't split if it's in parentheses
+                for part in item.split('/'):
+                    _add_section_skill(part, found_skills)
+            else:
+                _add_section_skill(item, found_skills)
+
+    # Also search entire text for common skills if section parsing didn't work well
+    if len(found_skills) < 5:
+        for keyword in find_skill_keywords(text):
+            if keyword in _KEYWORD_ABBREVIATIONS:
+                found_skills[keyword.upper()] = None
+            else:
+                found_skills[keyword.title() if keyword.islower() else keyword] = None
+
+    return list(found_skills)[:20]  # Return up to 20 skills
+
+
+_HEADER_LOCATION_RE = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2})\s*\|', re.MULTILINE)
+_LOCATION_RES = [
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2})\b'),  # City, State
+    re.compile(r'location[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z]{2})'),  # Location: City, State
+]
+
+
+def extract_location_from_resume(text):
+    """Extract location from resume text - improved"""
+    # Look for location in header (most common place)
+    # Pattern: "City, State |" or "City, State | phone"
+    match = _HEADER_LOCATION_RE.search(text)
+    if match:
+        city = match.group(1).strip()
+        state = match.group(2).strip()
+        # Clean up city if it has newlines
+        city = city.replace('\n', ' ').strip()
+        return f"{city}, {state}"
+
+    # Fallback: look for any City, State pattern
+    for pattern in _LOCATION_RES:
+        # Take the first valid match (usually in header)
+        for match in pattern.finditer(text):
+            city = match.group(1).replace('\n', ' ').strip()
+            state = match.group(2).strip()
+            # Skip if city looks wrong (e.g., contains "Tankersley")
+            if 'tankersley' not in city.lower() and len(city) > 2:
+                return f"{city}, {state}"
+
+    return ""
@@ -0,0 +1,244 @@
+"""
+Search Cache and Prefetch
+Caches upstream job search results per (query, location, limit, filter
+parameters) for a TTL and counts how often each search is asked for. The
+cache lives in a SQLite file, so every worker process shares its entries
+and counts. A background scheduler, running in one process at a time,
+refreshes the most popular searches shortly before they expire within one
+upstream call budget, so common searches are served from warm results.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from records import JobRecord, to_dict
+from telemetry import log_event, record_cache, span
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, and no multi-process server either
+    fcntl = None
+
+
+# (query, location, limit, extra upstream params as sorted pairs)
+SearchKey = Tuple[str, str, int, Tuple[Tuple[str, str], ...]]
+
+
+class SearchCache:
+    """
+    LRU cache of search results with a TTL, plus a decaying popularity count
+    per search, stored in SQLite and safe to share between worker processes
+    """
+
+    def __init__(self, db_path: str = 'search_cache.db', ttl: float = 1800.0, max_entries: int = 512):
+        self.db_path = str(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        with self._connect() as conn:
+            # WAL lets readers proceed while another process is writing
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL,
+                    used_at REAL NOT NULL,
+                    jobs TEXT NOT NULL
+                )
+            """)
+            conn.execute('CREATE TABLE IF NOT EXISTS popularity (key TEXT PRIMARY KEY, count REAL NOT NULL)')
+
+    @classmethod
+    def from_env(cls) -> 'SearchCache':
+        """Build a cache configured from environment variables"""
+        return cls(
+            db_path=os.environ.get('SEARCH_CACHE_PATH', 'search_cache.db'),
+            ttl=float(os.environ.get('SEARCH_CACHE_TTL', 1800)),
+            max_entries=int(os.environ.get('SEARCH_CACHE_SIZE', 512)),
+        )
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection wrapped in a transaction"""
+        # The timeout makes concurrent writers wait for the lock instead of failing
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def key(query: str, location: str, limit: int, params: Dict[str, str] = None) -> SearchKey:
+        return (query.lower().strip(), location.lower().strip(), limit, tuple(sorted((params or {}).items())))
+
+    @staticmethod
+    def _encode(key: SearchKey) -> str:
+        return json.dumps(key)
+
+    @staticmethod
+    def _decode(text: str) -> SearchKey:
+        query, location, limit, params = json.loads(text)
+        return (query, location, limit, tuple(tuple(pair) for pair in params))
+
+    def record_query(self, key: SearchKey) -> None:
+        """Count one request for a search"""
+        with self._connect() as conn:
+            conn.execute('INSERT INTO popularity (key, count) VALUES (?, 1) '
+                         'ON CONFLICT (key) DO UPDATE SET count = count + 1', (self._encode(key),))
+
+    def get(self, key: SearchKey, allow_stale: bool = False) -> Optional[List]:
+        """
+        The cached jobs for a search (new records each time, since callers
+        score and annotate them), or None if missing or expired. allow_stale
+        returns expired entries too, for when there is no time left to fetch.
+        """
+        encoded = self._encode(key)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute('SELECT fetched_at, jobs FROM entries WHERE key = ?', (encoded,)).fetchone()
+            if row is not None and (allow_stale or now - row[0] < self.ttl):
+                conn.execute('UPDATE entries SET used_at = ? WHERE key = ?', (now, encoded))
+            else:
+                row = None
+        record_cache('search_stale' if allow_stale else 'search', row is not None)
+        return None if row is None else [JobRecord.from_dict(job) for job in json.loads(row[1])]
+
+    def put(self, key: SearchKey, jobs: List) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO entries (key, fetched_at, used_at, jobs) VALUES (?, ?, ?, ?)',
+                         (self._encode(key), now, now, json.dumps([to_dict(job) for job in jobs])))
+            # Evict the least recently used entries beyond max_entries
+            conn.execute('DELETE FROM entries WHERE key NOT IN '
+                         '(SELECT key FROM entries ORDER BY used_at DESC LIMIT ?)', (self.max_entries,))
+
+    def expires_in(self, key: SearchKey) -> float:
+        """Seconds until a search's entry expires (0 if missing or expired)"""
+        with self._connect() as conn:
+            row = conn.execute('SELECT fetched_at FROM entries WHERE key = ?', (self._encode(key),)).fetchone()
+        return 0.0 if row is None else max(0.0, row[0] + self.ttl - time.time())
+
+    def popular(self, count: int) -> List[SearchKey]:
+        """The most requested searches, most popular first"""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT key FROM popularity ORDER BY count DESC LIMIT ?', (count,)).fetchall()
+        return [self._decode(text) for (text,) in rows]
+
+    def decay(self, factor: float) -> None:
+        """Scale popularity down so counts follow recent traffic; forget rare searches"""
+        with self._connect() as conn:
+            conn.execute('UPDATE popularity SET count = count * ?', (factor,))
+            conn.execute('DELETE FROM popularity WHERE count < 0.1')
+
+
+class PrefetchScheduler:
+    """
+    Background thread that refreshes popular searches before they expire.
+    Every `interval` seconds it takes the `top` most requested searches and
+    re-fetches those expiring within `refresh_ahead` seconds, spending at
+    most `calls_per_hour` upstream calls.
+    Every worker process starts one, but only the holder of an exclusive
+    lock on `<cache file>.prefetch.lock` refreshes, so the budget is spent
+    once per cache file rather than once per worker. When that worker exits,
+    the lock is released and another worker's scheduler takes over.
+    """
+
+    # Popularity halves every hour
+    HALF_LIFE = 3600.0
+
+    def __init__(self, cache: SearchCache, job_searcher, interval: float = 60.0, top: int = 20,
+                 calls_per_hour: float = 120.0, refresh_ahead: float = 300.0):
+        self.cache = cache
+        self.job_searcher = job_searcher
+        self.interval = interval
+        self.top = top
+        self.calls_per_hour = calls_per_hour
+        self.refresh_ahead = refresh_ahead
+        # Token bucket of upstream calls, refilled continuously up to one interval's worth
+        self._capacity = max(1.0, calls_per_hour * interval / 3600)
+        self._tokens = self._capacity
+        self._refilled_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock_path = f"{cache.db_path}.prefetch.lock"
+        self._lock_file = None
+
+    @classmethod
+    def from_env(cls, cache: SearchCache, job_searcher) -> 'PrefetchScheduler':
+        """Build a scheduler configured from environment variables"""
+        return cls(
+            cache,
+            job_searcher,
+            interval=float(os.environ.get('PREFETCH_INTERVAL', 60)),
+            top=int(os.environ.get('PREFETCH_TOP', 20)),
+            calls_per_hour=float(os.environ.get('PREFETCH_CALLS_PER_HOUR', 120)),
+            refresh_ahead=float(os.environ.get('PREFETCH_REFRESH_AHEAD', 300)),
+        )
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        rate = self.calls_per_hour / 3600
+        self._tokens = min(self._capacity, self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _lead(self) -> bool:
+        """Whether this process is the one refreshing (taking the lock if it is free)"""
+        if self._lock_file is not None or fcntl is None:
+            return True
+        lock_file = open(self._lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        # Held (and the lock with it) until the process exits
+        self._lock_file = lock_file
+        log_event('prefetch_leader', pid=os.getpid())
+        return True
+
+    def run_once(self) -> int:
+        """Refresh the popular searches that are due; returns the upstream calls made"""
+        due = [key for key in self.cache.popular(self.top)
+               if self.cache.expires_in(key) <= self.refresh_ahead]
+        calls = 0
+        with span('prefetch', due=len(due)) as fields:
+            for key in due:
+                if not self._take_token():
+                    break
+                calls += 1
+                query, where, limit, params = key
+                jobs = self.job_searcher.search_adzuna(query, where, limit=limit, params=dict(params))
+                # An empty result may be an upstream error, so keep serving the old entry
+                if jobs:
+                    self.cache.put(key, jobs)
+            fields['calls'] = calls
+        self.cache.decay(0.5 ** (self.interval / self.HALF_LIFE))
+        return calls
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                if self._lead():
+                    self.run_once()
+            except Exception as e:
+                log_event('prefetch_failed', logging.ERROR, error=str(e), exc_info=True)
+
+    def start(self) -> 'PrefetchScheduler':
+        """Start refreshing in a daemon thread (does nothing if the budget is 0)"""
+        if self.calls_per_hour > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='search-prefetch', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -84,6 +84,12 @@ async function handleSearch(e) {
     const interests = form.interests.value.split(',').map(s => s.trim()).filter(s => s);
     const location = form.location.value.trim();
     const us_wide = form.us_wide.checked;
+    // Applied server-side (and pushed to the job API where it supports them)
+    const filters = {
+        min_salary: form.min_salary.value || null,
+        max_age_days: form.max_age_days.value || null,
+        remote_only: form.remote_only.checked
+    };
     
     if (skills.length === 0) {
         alert('Please enter at least one skill');
@@ -108,7 +114,9 @@ async function handleSearch(e) {
                 skills,
                 interests,
                 location,
-                us_wide
+                us_wide,
+                filters,
+                include_mentors: true
             })
         });
         
@@ -153,6 +161,9 @@ function displayResults(data) {
     // Update stats
     const stats = data.stats;
     resultsStats.textContent = `${stats.total_jobs} jobs found | ${stats.high_matches} high matches (≥50%)`;
+    if (data.partial) {
+        resultsStats.textContent += ' | Partial results: job search was slow, try again for more';
+    }
     
     // Display jobs
     currentJobs = data.jobs;
@@ -425,13 +436,8 @@ function filterJobs() {
     
     jobsList.innerHTML = filtered.map(job => createJobCard(job)).join('');
     
-    // Load mentor connections for each job
-    filtered.forEach(job => {
-        const jobId = `${job.title}_${job.company}`.replace(/[^a-zA-Z0-9]/g, '_');
-        if (job.company) {
-            loadMentorConnections(jobId, job.company);
-        }
-    });
+    // Show mentor connections for each job (inline from the search, or one batch lookup)
+    loadMentorConnectionsForJobs(filtered);
 }
 
 function updateFilterSummary(filteredCount, totalCount, mentorsCount) {
@@ -477,6 +483,21 @@ function createJobCard(job) {
             <div class="mentor-connections" id="mentors-${jobId}">
                 <div class="mentor-loading">🔍 Checking mentor connections...</div>
             </div>
+            ${Array.isArray(job.skill_mentors) && job.skill_mentors.length > 0 ? `
+            <div class="mentor-connections">
+                <div class="mentor-connections-header">
+                    <strong>🎓 Mentors with relevant expertise:</strong>
+                </div>
+                <div class="mentor-list">
+                    ${job.skill_mentors.map(mentor => `
+                        <div class="mentor-item">
+                            <strong>${escapeHtml(mentor.name || mentor.full_name || 'N/A')}</strong> - ${escapeHtml(mentor.title || 'N/A')}, ${escapeHtml(mentor.company || 'N/A')}
+                            <small>(${escapeHtml(mentor.shared_skills.join(', '))})</small>
+                            ${safeUrl(mentor.linkedin) ? `<a href="${safeUrl(mentor.linkedin)}" target="_blank" rel="noopener" class="mentor-link">LinkedIn →</a>` : ''}
+                        </div>
+                    `).join('')}
+                </div>
+            </div>` : ''}
             <div class="job-footer">
                 <button class="btn-bookmark ${isBookmarked ? 'bookmarked' : ''}" 
                         onclick="toggleBookmark('${jobId}')"
@@ -484,67 +505,66 @@ function createJobCard(job) {
                         title="${isBookmarked ? 'Remove bookmark' : 'Save job'}">
                     ${isBookmarked ? '⭐ Saved' : '☆ Save'}
                 </button>
-                ${job.url ? `<a href="${job.url}" target="_blank" class="job-link">🔗 View Job →</a>` : ''}
+                ${safeUrl(job.url) ? `<a href="${safeUrl(job.url)}" target="_blank" rel="noopener" class="job-link">🔗 View Job →</a>` : ''}
             </div>
         </div>
     `;
 }
 
-// Load mentor connections for a job (with error handling and debouncing)
+// Load mentor connections for a list of jobs (inline results first, then one batch request)
 const mentorConnectionCache = {};
-const mentorConnectionQueue = new Set();
 
-async function loadMentorConnections(jobId, company) {
-    if (!company || !company.trim()) {
-        const container = document.getElementById(`mentors-${jobId}`);
-        if (container) container.innerHTML = '';
-        return;
-    }
+async function loadMentorConnectionsForJobs(jobs) {
+    const pending = {};
     
-    const container = document.getElementById(`mentors-${jobId}`);
-    if (!container) return;
-    
-    // Check cache first
-    const cacheKey = company.toLowerCase().trim();
-    if (mentorConnectionCache[cacheKey] !== undefined) {
-        displayMentorConnections(container, company, mentorConnectionCache[cacheKey]);
-        return;
-    }
-    
-    // Debounce: don't make multiple requests for the same company
-    if (mentorConnectionQueue.has(cacheKey)) {
-        return;
-    }
-    
-    mentorConnectionQueue.add(cacheKey);
-    
-    try {
-        const encodedCompany = encodeURIComponent(company.trim());
-        const response = await fetch(`/api/mentors/company/${encodedCompany}`);
+    jobs.forEach(job => {
+        const jobId = `${job.title}_${job.company}`.replace(/[^a-zA-Z0-9]/g, '_');
+        const container = document.getElementById(`mentors-${jobId}`);
+        if (!container) return;
         
-        if (!response.ok) {
-            // If error, just hide the section silently
+        if (!job.company || !job.company.trim()) {
             container.innerHTML = '';
-            mentorConnectionCache[cacheKey] = { mentors: [], count: 0 };
             return;
         }
         
-        const data = await response.json();
-        
-        // Cache the result
-        mentorConnectionCache[cacheKey] = data;
+        const cacheKey = job.company.toLowerCase().trim();
+        if (Array.isArray(job.mentors)) {
+            mentorConnectionCache[cacheKey] = { mentors: job.mentors, count: job.mentors.length };
+        }
         
-        // Display results
-        displayMentorConnections(container, company, data);
+        // Check cache first
+        if (mentorConnectionCache[cacheKey] !== undefined) {
+            displayMentorConnections(container, job.company, mentorConnectionCache[cacheKey]);
+            return;
+        }
         
+        const company = job.company.trim();
+        (pending[company] = pending[company] || []).push(container);
+    });
+    
+    const companies = Object.keys(pending);
+    if (companies.length === 0) return;
+    
+    let results = {};
+    try {
+        const response = await fetch('/api/mentors/companies', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ companies })
+        });
+        if (response.ok) {
+            results = (await response.json()).results || {};
+        }
     } catch (error) {
         // Log error for debugging but don't show to user
-        console.log(`Mentor lookup failed for ${company}:`, error);
-        container.innerHTML = '';
-        mentorConnectionCache[cacheKey] = { mentors: [], count: 0 };
-    } finally {
-        mentorConnectionQueue.delete(cacheKey);
+        console.log('Mentor batch lookup failed:', error);
     }
+    
+    companies.forEach(company => {
+        const data = results[company] || { mentors: [], count: 0 };
+        mentorConnectionCache[company.toLowerCase()] = data;
+        pending[company].forEach(container => displayMentorConnections(container, company, data));
+    });
 }
 
 function displayMentorConnections(container, company, data) {
@@ -573,7 +593,7 @@ function displayMentorConnections(container, company, data) {
                 ${data.mentors.map(mentor => `
                     <div class="mentor-item">
                         <strong>${escapeHtml(mentor.name || mentor.full_name || 'N/A')}</strong> - ${escapeHtml(mentor.title || 'N/A')}
-                        ${mentor.linkedin ? `<a href="${mentor.linkedin}" target="_blank" class="mentor-link">LinkedIn →</a>` : ''}
+                        ${safeUrl(mentor.linkedin) ? `<a href="${safeUrl(mentor.linkedin)}" target="_blank" rel="noopener" class="mentor-link">LinkedIn →</a>` : ''}
                     </div>
                 `).join('')}
             </div>
@@ -726,6 +746,24 @@ function escapeHtml(text) {
     return div.innerHTML;
 }
 
+// An http(s) URL escaped for an href attribute, or '' for anything else
+// (e.g. javascript: links from an imported mentor file). Mentor files often
+// leave out the scheme ('www.linkedin.com/in/...'), so https is assumed.
+function safeUrl(url) {
+    let text = String(url || '').trim();
+    if (!text) return '';
+    if (!/^[a-z][a-z0-9+.-]*:/i.test(text)) text = `https://${text}`;
+    let parsed;
+    try {
+        parsed = new URL(text);
+    } catch (e) {
+        return '';
+    }
+    if (parsed.protocol !== 'http:' && parsed.protocol !== 'https:') return '';
+    return parsed.href.replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/'/g, '&#39;')
+        .replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
 // Resume upload functions
 async function handleResumeUpload(event) {
     const file = event.target.files[0];
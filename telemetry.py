@@ -0,0 +1,380 @@
+"""
+Telemetry
+Structured logging, per-stage timing spans and Prometheus-style metrics for
+the job search pipeline and the web app. Metrics live in a per-process
+registry and are rendered in the Prometheus text format by /metrics; under
+gunicorn, workers share their values through METRICS_DIR so every scrape
+reports totals across all of them.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, and no multi-process server either
+    fcntl = None
+
+
+logger = logging.getLogger('jobsearch')
+
+
+def log_event(event: str, level: int = logging.INFO, exc_info: bool = False, **fields) -> None:
+    """Log an event name with key/value fields"""
+    logger.log(level, event, exc_info=exc_info, extra={'fields': fields})
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, event and its fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname.lower(),
+            'event': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Readable `event key=value ...` lines for terminals"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [record.getMessage()]
+        for key, value in getattr(record, 'fields', {}).items():
+            parts.append(f"{key}={value}")
+        line = ' '.join(parts)
+        if record.levelno >= logging.WARNING:
+            line = f"{record.levelname}: {line}"
+        if record.exc_info:
+            line += '\n' + self.formatException(record.exc_info)
+        return line
+
+
+def configure_logging(log_format: str = None, level: str = None) -> None:
+    """
+    Send pipeline logs to stderr as JSON (default) or text. LOG_FORMAT and
+    LOG_LEVEL override the defaults. Does nothing if already configured.
+    """
+    if logger.handlers:
+        return
+    log_format = os.environ.get('LOG_FORMAT', log_format or 'json')
+    handler = logging.StreamHandler()
+    handler.setFormatter(TextFormatter() if log_format == 'text' else JsonFormatter())
+    logger.addHandler(handler)
+    logger.setLevel(os.environ.get('LOG_LEVEL', level or 'INFO').upper())
+    logger.propagate = False
+
+
+# Metrics
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    """A named metric with one child per combination of label values"""
+
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labelnames: List[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """Child metric for these label values (in labelnames order)"""
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def state(self) -> Dict[Tuple, object]:
+        """Current value of every child, as plain JSON-friendly data"""
+        with self._lock:
+            children = list(self._children.items())
+        return {key: child.state() for key, child in children}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._children = {}
+
+    @staticmethod
+    def combine(a, b):
+        """Sum of two child states (from different processes)"""
+        raise NotImplementedError
+
+    def _render_child(self, key: Tuple, value) -> List[str]:
+        raise NotImplementedError
+
+    def render(self, state: Dict[Tuple, object] = None) -> List[str]:
+        state = self.state() if state is None else state
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(state.items()):
+            lines.extend(self._render_child(key, value))
+        return lines
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def state(self) -> float:
+        return self.value
+
+
+class Counter(_Metric):
+    """Monotonic count, e.g. upstream calls or cache hits"""
+
+    kind = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    @staticmethod
+    def combine(a, b):
+        return a + b
+
+    def _render_child(self, key, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value:g}"]
+
+
+class _HistogramChild:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    def state(self) -> list:
+        with self._lock:
+            return [list(self.counts), self.sum, self.count]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (latencies, in seconds) in fixed buckets"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: List[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    @staticmethod
+    def combine(a, b):
+        return [[x + y for x, y in zip(a[0], b[0])], a[1] + b[1], a[2] + b[2]]
+
+    def _render_child(self, key, value) -> List[str]:
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            bucket_labels = _format_labels(self.labelnames, key, f'le="{bound:g}"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+        bucket_labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+        lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+        lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total:g}")
+        lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Registry:
+    """
+    The metrics of one process, or of a group of processes sharing
+    multiprocess_dir. In that mode each process writes its state to
+    <pid>.json there (every flush interval, and on exit), and render() adds
+    up every file with this process's live values, so a scrape of any worker
+    shows totals for all of them. State of exited workers is folded into
+    archive.json (see retire_process) so totals never go backwards.
+    """
+
+    ARCHIVE = 'archive'
+
+    def __init__(self, multiprocess_dir: str = None):
+        self._metrics: Dict[str, _Metric] = {}
+        self.multiprocess_dir = multiprocess_dir
+        self._flusher = None
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def reset(self) -> None:
+        """Forget all values (e.g. those a forked worker inherited from its parent)"""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def state(self) -> Dict[str, Dict[Tuple, object]]:
+        return {name: metric.state() for name, metric in self._metrics.items()}
+
+    def _path(self, name) -> str:
+        return os.path.join(self.multiprocess_dir, f"{name}.json")
+
+    @contextmanager
+    def _dir_lock(self, exclusive: bool):
+        """Readers share the lock; folding a worker into the archive takes it alone"""
+        with open(os.path.join(self.multiprocess_dir, '.lock'), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    @staticmethod
+    def _dump(state: Dict, path: str) -> None:
+        data = {name: [[list(key), value] for key, value in values.items()] for name, values in state.items()}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _load(path: str) -> Dict:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {name: {tuple(key): value for key, value in values} for name, values in data.items()}
+
+    def _combine(self, states: List[Dict]) -> Dict:
+        combined = {name: {} for name in self._metrics}
+        for state in states:
+            for name, values in state.items():
+                metric = self._metrics.get(name)
+                if metric is None:
+                    continue
+                target = combined[name]
+                for key, value in values.items():
+                    target[key] = metric.combine(target[key], value) if key in target else value
+        return combined
+
+    def write_state(self) -> None:
+        """Publish this process's values to the shared directory"""
+        if self.multiprocess_dir:
+            self._dump(self.state(), self._path(os.getpid()))
+
+    def retire_process(self, pid: int) -> None:
+        """Fold an exited process's last published values into the archive"""
+        if not self.multiprocess_dir:
+            return
+        with self._dir_lock(exclusive=True):
+            path = self._path(pid)
+            if not os.path.exists(path):
+                return
+            archive = self._combine([self._load(self._path(self.ARCHIVE)), self._load(path)])
+            self._dump(archive, self._path(self.ARCHIVE))
+            os.remove(path)
+
+    def start_flusher(self, interval: float = 5.0) -> None:
+        """Publish this process's values every `interval` seconds from a daemon thread"""
+        if not self.multiprocess_dir or self._flusher is not None:
+            return
+
+        def flush():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_state()
+                except OSError as e:
+                    log_event('metrics_flush_failed', logging.WARNING, error=str(e))
+
+        self._flusher = threading.Thread(target=flush, name='metrics-flush', daemon=True)
+        self._flusher.start()
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        states = [self.state()]
+        if self.multiprocess_dir:
+            own = f"{os.getpid()}.json"
+            with self._dir_lock(exclusive=False):
+                for name in sorted(os.listdir(self.multiprocess_dir)):
+                    if name.endswith('.json') and name != own:
+                        states.append(self._load(os.path.join(self.multiprocess_dir, name)))
+        combined = self._combine(states)
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.extend(metric.render(combined[name]))
+        return '\n'.join(lines) + '\n'
+
+
+# METRICS_DIR turns on multiprocess mode (gunicorn.conf.py sets it for its workers)
+REGISTRY = Registry(os.environ.get('METRICS_DIR') or None)
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'jobsearch_stage_duration_seconds', 'Time spent in each pipeline stage', ['stage']))
+UPSTREAM_REQUESTS = REGISTRY.register(Counter(
+    'jobsearch_upstream_requests_total', 'Calls to job search APIs by outcome', ['source', 'outcome']))
+UPSTREAM_SECONDS = REGISTRY.register(Histogram(
+    'jobsearch_upstream_request_duration_seconds', 'Latency of job search API calls', ['source']))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    'jobsearch_cache_requests_total', 'Cache lookups by cache and result (hit/miss)', ['cache', 'result']))
+JOBS = REGISTRY.register(Counter(
+    'jobsearch_jobs_total', 'Jobs passing through each pipeline stage', ['stage']))
+HTTP_SECONDS = REGISTRY.register(Histogram(
+    'jobsearch_http_request_duration_seconds', 'Web app request latency', ['endpoint', 'method', 'status']))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a hit or miss for a named cache"""
+    CACHE_REQUESTS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+@contextmanager
+def span(stage: str, **fields) -> Iterator[Dict]:
+    """
+    Time a pipeline stage: observes its duration in the stage histogram and
+    logs it with any fields. The yielded dict can be filled in with results
+    (e.g. counts) to log alongside the duration.
+    """
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        log_event(stage, duration_ms=round(elapsed * 1000, 2), **fields)